@@ -0,0 +1,457 @@
+"""
+Benchmarks for regression testing the speed of :mod:`slmsuite`.
+This module is hidden from documentation.
+
+Run every suite and print JSON results with
+
+.. highlight:: console
+.. code-block:: console
+
+    python -m slmsuite.benchmarks --output results.json
+
+and compare two runs with
+
+.. code-block:: console
+
+    python -m slmsuite.benchmarks --compare baseline.json results.json
+
+Suites
+~~~~~~
+- ``"hologram"`` : :meth:`~slmsuite.holography.algorithms.Hologram.optimize()` for every
+  method in ``ALGORITHM_DEFAULTS`` over several computational shapes.
+- ``"spots"`` : :class:`~slmsuite.holography.algorithms.SpotHologram` versus
+  :class:`~slmsuite.holography.algorithms.CompressedSpotHologram` at varying spot counts.
+- ``"slm"`` : :meth:`~slmsuite.hardware.slms.slm.SLM.write()` and the private
+  :meth:`~slmsuite.hardware.slms.slm.SLM._phase2gray()`.
+- ``"zernike"`` : :meth:`~slmsuite.holography.toolbox.phase.zernike_sum()`.
+- ``"take"`` : :meth:`~slmsuite.holography.analysis.take()`.
+- ``"fit"`` : :meth:`~slmsuite.holography.analysis.image_fit()`.
+
+Functions which accept :mod:`cupy` data are additionally timed on the GPU if :mod:`cupy`
+is installed. The hologram suites run on whichever backend
+:mod:`slmsuite.holography.algorithms` selected at import; this is recorded in the metadata.
+"""
+import os
+import sys
+import json
+import time
+import socket
+import platform
+import datetime
+import warnings
+
+import numpy as np
+import scipy
+
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
+import slmsuite
+from slmsuite.holography import analysis, toolbox
+from slmsuite.holography.toolbox import phase as tphase
+
+SUITES = ["hologram", "spots", "slm", "zernike", "take", "fit"]
+
+# Parameters for each suite, in full and quick (smoke test) form.
+PARAMETERS = {
+    "hologram": {
+        "shapes": [(256, 256), (512, 512), (1024, 1024), (2048, 2048)],
+        "maxiter": 10,
+    },
+    "spots": {
+        "shape": (512, 512),
+        "spot_counts": [10, 100, 1000],
+        "maxiter": 10,
+    },
+    "slm": {"shapes": [(1152, 1920), (2160, 3840)]},
+    "zernike": {"shape": (1152, 1920), "orders": [3, 15], "counts": [1, 10]},
+    "take": {"shape": (2048, 2048), "counts": [100, 1000, 10000], "size": 15},
+    "fit": {"counts": [10, 100], "size": 15},
+}
+QUICK_PARAMETERS = {
+    "hologram": {"shapes": [(64, 64)], "maxiter": 2},
+    "spots": {"shape": (64, 64), "spot_counts": [4], "maxiter": 2},
+    "slm": {"shapes": [(64, 96)]},
+    "zernike": {"shape": (64, 96), "orders": [3], "counts": [1]},
+    "take": {"shape": (128, 128), "counts": [10], "size": 5},
+    "fit": {"counts": [2], "size": 9},
+}
+
+
+def metadata():
+    """
+    Describes the machine and software versions, such that results can be compared.
+
+    Returns
+    -------
+    dict
+        Machine and version metadata.
+    """
+    from slmsuite.holography import algorithms
+
+    meta = {
+        "timestamp": datetime.datetime.now().isoformat(),
+        "hostname": socket.gethostname(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": sys.version.split()[0],
+        "slmsuite": slmsuite.__version__,
+        "numpy": np.__version__,
+        "scipy": scipy.__version__,
+        "cupy": None,
+        "gpu": None,
+        "algorithms_backend": "cupy" if algorithms.cp is not np else "numpy",
+    }
+
+    if cp is not None:
+        meta["cupy"] = cp.__version__
+        try:
+            properties = cp.cuda.runtime.getDeviceProperties(cp.cuda.Device().id)
+            name = properties["name"]
+            meta["gpu"] = name.decode() if isinstance(name, bytes) else str(name)
+        except Exception:
+            pass
+
+    return meta
+
+
+def _synchronize():
+    if cp is not None:
+        try:
+            cp.cuda.Device().synchronize()
+        except Exception:
+            pass
+
+
+def _backends():
+    """Array modules to benchmark functions which accept both."""
+    return [np] if cp is None else [np, cp]
+
+
+def timeit(function, repeat=3, warmup=1):
+    """
+    Times ``function()``, synchronizing the GPU (if present) around each call.
+
+    Parameters
+    ----------
+    function : function
+        Function without arguments to time.
+    repeat : int
+        Number of timed calls.
+    warmup : int
+        Number of untimed calls beforehand (e.g. to populate caches and compile kernels).
+
+    Returns
+    -------
+    list of float
+        Wall time of each call in seconds.
+    """
+    for _ in range(warmup):
+        function()
+    _synchronize()
+
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        function()
+        _synchronize()
+        times.append(time.perf_counter() - t)
+
+    return times
+
+
+def _result(suite, name, params, backend, times=None, skipped=None):
+    result = {"suite": suite, "name": name, "params": params, "backend": backend}
+
+    if skipped is None:
+        result.update({
+            "times": times,
+            "min": float(np.min(times)),
+            "median": float(np.median(times)),
+        })
+    else:
+        result["skipped"] = skipped
+
+    return result
+
+
+def _random_spots(shape, count, rng, border=.25):
+    """Random ``"knm"`` spot positions away from the edges of ``shape``."""
+    (h, w) = shape
+    return np.vstack((
+        rng.integers(int(border * w), int((1 - border) * w), count),
+        rng.integers(int(border * h), int((1 - border) * h), count),
+    ))
+
+
+def _fourier_slm(shape):
+    """Simulated, Fourier-calibrated hardware for holograms which need a ``cameraslm``."""
+    from slmsuite.hardware.slms.simulated import SimulatedSLM
+    from slmsuite.hardware.cameras.simulated import SimulatedCamera
+    from slmsuite.hardware.cameraslms import FourierSLM
+
+    slm = SimulatedSLM((shape[1], shape[0]), pitch_um=(8, 8))
+    cam = SimulatedCamera(slm, resolution=(shape[1], shape[0]), pitch_um=(5, 5))
+    fs = FourierSLM(cam, slm)
+
+    M, b = fs.fourier_calibration_build(f_eff=np.mean(shape), units="norm")
+    fs.calibrations["fourier"] = {"M": M, "b": b, "a": np.zeros((2, 1))}
+
+    return fs
+
+
+# Suites.
+def benchmark_hologram(params, repeat=3):
+    """Times :meth:`Hologram.optimize()` for every method in ``ALGORITHM_DEFAULTS``."""
+    from slmsuite.holography import algorithms
+
+    backend = "cupy" if algorithms.cp is not np else "numpy"
+    rng = np.random.default_rng(0)
+    results = []
+
+    for shape in params["shapes"]:
+        slm_shape = (shape[0] // 2, shape[1] // 2)
+        target = np.zeros(shape)
+        target[tuple(np.flip(_random_spots(shape, 100, rng), axis=0))] = 1
+
+        for method in algorithms.ALGORITHM_DEFAULTS:
+            p = {"method": method, "shape": list(shape), "slm_shape": list(slm_shape), "maxiter": params["maxiter"]}
+
+            if method == "CG" and algorithms.torch is None:
+                results.append(_result("hologram", "Hologram.optimize", p, backend, skipped="pytorch is not installed"))
+                continue
+
+            hologram = algorithms.Hologram(target, slm_shape=slm_shape, amp=np.ones(slm_shape))
+
+            def run():
+                hologram.reset()
+                hologram.optimize(method, maxiter=params["maxiter"], verbose=False)
+
+            try:
+                results.append(_result("hologram", "Hologram.optimize", p, backend, timeit(run, repeat)))
+            except Exception as err:
+                results.append(_result("hologram", "Hologram.optimize", p, backend, skipped=repr(err)))
+
+    return results
+
+
+def benchmark_spots(params, repeat=3):
+    """Times :class:`SpotHologram` versus :class:`CompressedSpotHologram` at varying spot counts."""
+    from slmsuite.holography import algorithms
+
+    backend = "cupy" if algorithms.cp is not np else "numpy"
+    rng = np.random.default_rng(0)
+    shape = tuple(params["shape"])
+    slm_shape = (shape[0] // 2, shape[1] // 2)
+    fs = _fourier_slm(slm_shape)
+    results = []
+
+    for count in params["spot_counts"]:
+        knm = _random_spots(shape, count, rng)
+        kxy = toolbox.convert_vector(knm, from_units="knm", to_units="kxy", hardware=fs.slm, shape=shape)
+
+        holograms = {
+            "SpotHologram": lambda: algorithms.SpotHologram(
+                shape, knm, basis="knm", cameraslm=fs
+            ),
+            "CompressedSpotHologram": lambda: algorithms.CompressedSpotHologram(
+                kxy, basis="kxy", cameraslm=fs
+            ),
+        }
+
+        for name, build in holograms.items():
+            p = {"spots": count, "shape": list(shape), "slm_shape": list(slm_shape), "maxiter": params["maxiter"]}
+
+            try:
+                hologram = build()
+
+                def run():
+                    hologram.optimize("WGS-Kim", maxiter=params["maxiter"], verbose=False)
+
+                results.append(_result("spots", name + ".optimize", p, backend, timeit(run, repeat)))
+            except Exception as err:
+                results.append(_result("spots", name + ".optimize", p, backend, skipped=repr(err)))
+
+    return results
+
+
+def benchmark_slm(params, repeat=3):
+    """Times :meth:`SLM.write()` and :meth:`SLM._phase2gray()`."""
+    from slmsuite.hardware.slms.simulated import SimulatedSLM
+
+    rng = np.random.default_rng(0)
+    results = []
+
+    for shape in params["shapes"]:
+        for bitdepth, phase_scaling in [(8, 1), (10, 1), (8, .9), (10, .9)]:
+            slm = SimulatedSLM(
+                (shape[1], shape[0]), bitdepth=bitdepth, wav_um=phase_scaling, wav_design_um=1
+            )
+            phase = rng.uniform(0, 4 * np.pi, shape)
+            p = {"shape": list(shape), "bitdepth": bitdepth, "phase_scaling": phase_scaling}
+
+            results.append(_result("slm", "SLM.write", p, "numpy", timeit(lambda: slm.write(phase), repeat)))
+            results.append(_result(
+                "slm", "SLM._phase2gray", p, "numpy",
+                timeit(lambda: slm._phase2gray(phase, out=slm.display), repeat)
+            ))
+
+    return results
+
+
+def benchmark_zernike(params, repeat=3):
+    """Times :meth:`zernike_sum()` for several orders and numbers of summed phases."""
+    from slmsuite.hardware.slms.simulated import SimulatedSLM
+
+    shape = tuple(params["shape"])
+    slm = SimulatedSLM((shape[1], shape[0]))
+    rng = np.random.default_rng(0)
+    results = []
+
+    for xp in _backends():
+        grid = (xp.asarray(slm.grid[0]), xp.asarray(slm.grid[1]))
+
+        for order in params["orders"]:
+            indices = np.arange(1, order + 1)
+            for count in params["counts"]:
+                weights = rng.normal(size=(order, count))
+                p = {"shape": list(shape), "order": int(order), "count": int(count)}
+
+                def run():
+                    tphase.zernike_sum(grid, indices, weights, aperture="circular")
+
+                results.append(_result("zernike", "zernike_sum", p, xp.__name__, timeit(run, repeat)))
+
+    return results
+
+
+def benchmark_take(params, repeat=3):
+    """Times :meth:`analysis.take()`, with and without integration."""
+    shape = tuple(params["shape"])
+    size = params["size"]
+    rng = np.random.default_rng(0)
+    results = []
+
+    for xp in _backends():
+        image = xp.asarray(rng.uniform(0, 255, shape).astype(np.float32))
+
+        for count in params["counts"]:
+            vectors = _random_spots(shape, count, rng, border=.1)
+
+            for integrate in [False, True]:
+                p = {"shape": list(shape), "count": int(count), "size": size, "integrate": integrate}
+
+                def run():
+                    analysis.take(image, vectors, size, integrate=integrate, xp=xp)
+
+                results.append(_result("take", "take", p, xp.__name__, timeit(run, repeat)))
+
+    return results
+
+
+def benchmark_fit(params, repeat=3):
+    """Times :meth:`analysis.image_fit()` on noisy Gaussian spots."""
+    size = params["size"]
+    rng = np.random.default_rng(0)
+    results = []
+
+    (x, y) = np.meshgrid(np.arange(size) - size // 2, np.arange(size) - size // 2)
+
+    for count in params["counts"]:
+        centers = rng.uniform(-1, 1, (2, count, 1, 1))
+        images = np.exp(-((x - centers[0]) ** 2 + (y - centers[1]) ** 2) / (2 * 2 ** 2))
+        images += rng.normal(scale=.01, size=images.shape)
+        p = {"count": int(count), "size": size}
+
+        results.append(_result("fit", "image_fit", p, "numpy", timeit(lambda: analysis.image_fit(images), repeat)))
+
+    return results
+
+
+def run(suites=None, quick=False, repeat=3, verbose=True):
+    """
+    Runs benchmark suites.
+
+    Parameters
+    ----------
+    suites : list of str OR None
+        Suites to run. See ``SUITES``. If ``None``, runs all suites.
+    quick : bool
+        Whether to use small problem sizes, as a smoke test.
+    repeat : int
+        Number of timed calls per benchmark.
+    verbose : bool
+        Whether to print the name of each suite as it runs.
+
+    Returns
+    -------
+    dict
+        ``"metadata"`` (see :meth:`metadata()`) and ``"results"``, a list with one
+        dictionary per benchmark.
+    """
+    if suites is None:
+        suites = SUITES
+    for suite in suites:
+        if not suite in SUITES:
+            raise ValueError("Suite '{}' not recognized. Options: {}".format(suite, SUITES))
+
+    parameters = QUICK_PARAMETERS if quick else PARAMETERS
+    results = []
+
+    for suite in suites:
+        if verbose:
+            print("Running '{}' benchmarks...".format(suite), file=sys.stderr)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            results += globals()["benchmark_" + suite](parameters[suite], repeat=repeat)
+
+    return {"metadata": metadata(), "results": results}
+
+
+def _key(result):
+    return (
+        result["suite"], result["name"], result["backend"],
+        json.dumps(result["params"], sort_keys=True)
+    )
+
+
+def compare(baseline, results, threshold=1.2):
+    """
+    Compares the median times of two runs.
+
+    Parameters
+    ----------
+    baseline, results : dict
+        Output of :meth:`run()` (or the loaded JSON).
+    threshold : float
+        Ratio of median times above which a benchmark is flagged as a regression.
+
+    Returns
+    -------
+    list of dict
+        One dictionary per benchmark present in both runs, with the ``"ratio"`` of
+        median times (``results / baseline``) and whether it is a ``"regression"``.
+    """
+    reference = {_key(r): r for r in baseline["results"] if "median" in r}
+    comparison = []
+
+    for r in results["results"]:
+        key = _key(r)
+        if "median" in r and key in reference:
+            ratio = r["median"] / reference[key]["median"]
+            comparison.append({
+                "suite": r["suite"],
+                "name": r["name"],
+                "backend": r["backend"],
+                "params": r["params"],
+                "baseline": reference[key]["median"],
+                "median": r["median"],
+                "ratio": ratio,
+                "regression": ratio > threshold,
+            })
+
+    return comparison
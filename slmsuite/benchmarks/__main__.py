@@ -0,0 +1,60 @@
+"""Command line interface for :mod:`slmsuite.benchmarks`. See ``python -m slmsuite.benchmarks -h``."""
+import sys
+import json
+import argparse
+
+from slmsuite.benchmarks import SUITES, run, compare
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m slmsuite.benchmarks",
+        description="Time slmsuite holography, hardware, and analysis routines.",
+    )
+    parser.add_argument(
+        "--suite", action="append", choices=SUITES,
+        help="Suite to run (repeatable). Defaults to all suites."
+    )
+    parser.add_argument("--quick", action="store_true", help="Use small problem sizes.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed calls per benchmark.")
+    parser.add_argument("--output", help="Path to write JSON results to. Defaults to stdout.")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BASELINE", "RESULTS"),
+        help="Compare two JSON results instead of running."
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=1.2,
+        help="Slowdown ratio flagged as a regression by --compare."
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare is not None:
+        with open(args.compare[0]) as f:
+            baseline = json.load(f)
+        with open(args.compare[1]) as f:
+            results = json.load(f)
+
+        comparison = compare(baseline, results, threshold=args.threshold)
+        for c in comparison:
+            print("{:>6.2f}x {} {} [{}] {}{}".format(
+                c["ratio"], c["suite"], c["name"], c["backend"],
+                json.dumps(c["params"], sort_keys=True),
+                "  REGRESSION" if c["regression"] else ""
+            ))
+
+        return int(any(c["regression"] for c in comparison))
+
+    results = run(suites=args.suite, quick=args.quick, repeat=args.repeat)
+    text = json.dumps(results, indent=2)
+
+    if args.output is None:
+        print(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,6 +3,7 @@ Abstract camera functionality.
 """
 import time
 import warnings
+import threading
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.axes_grid1 import make_axes_locatable
@@ -14,6 +15,221 @@ from slmsuite.misc.fitfunctions import lorentzian, lorentzian_jacobian
 from slmsuite.misc.math import REAL_TYPES
 
 
+class _CameraStream():
+    """
+    Background thread which continuously acquires frames from
+    :meth:`Camera._get_image_hw()` into a preallocated ring buffer.
+    See :meth:`Camera.start_stream()`.
+
+    Attributes
+    ----------
+    frames : numpy.ndarray
+        Ring buffer of shape ``(buffer_frames, height, width)``, allocated upon the first frame.
+    frame_ids : numpy.ndarray
+        Frame ID stored in each slot of :attr:`frames`, or ``-1`` if empty.
+    timestamps : numpy.ndarray
+        :meth:`time.perf_counter()` timestamp at which each stored frame was received.
+    latest_id : int
+        ID of the most recent frame, or ``-1`` if no frame has arrived. IDs count from zero.
+    """
+
+    def __init__(self, camera, buffer_frames, timeout_s, transform):
+        self.camera = camera
+        self.buffer_frames = int(buffer_frames)
+        if self.buffer_frames <= 0:
+            raise ValueError("buffer_frames must be positive.")
+        self.timeout_s = timeout_s
+        self.transform = transform
+
+        self.frames = None
+        self.frame_ids = np.full(self.buffer_frames, -1, dtype=np.int64)
+        self.timestamps = np.full(self.buffer_frames, np.nan)
+        self.latest_id = -1
+
+        self.error = None
+        self.running = True
+        self.condition = threading.Condition()
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        try:
+            while self.running:
+                img = self.camera._get_image_hw_tolerant(timeout_s=self.timeout_s)
+                t = time.perf_counter()
+
+                if self.transform:
+                    img = self.camera.transform(img)
+
+                with self.condition:
+                    if self.frames is None:
+                        self.frames = np.empty((self.buffer_frames,) + np.shape(img), dtype=np.asarray(img).dtype)
+
+                    frame_id = self.latest_id + 1
+                    slot = frame_id % self.buffer_frames
+
+                    self.frames[slot] = img
+                    self.frame_ids[slot] = frame_id
+                    self.timestamps[slot] = t
+                    self.latest_id = frame_id
+
+                    self.condition.notify_all()
+        except BaseException as err:
+            with self.condition:
+                self.error = err
+                self.running = False
+                self.condition.notify_all()
+
+    def _check(self):
+        if self.error is not None:
+            raise RuntimeError("Camera stream stopped due to an error.") from self.error
+
+    def _get(self, frame_id):
+        """Copies out a stored frame. Must be called with the condition held."""
+        slot = frame_id % self.buffer_frames
+        if self.frame_ids[slot] != frame_id:
+            raise ValueError(
+                "Frame {} is no longer in the buffer of {} frames (latest is {})."
+                .format(frame_id, self.buffer_frames, self.latest_id)
+            )
+        return self.frames[slot].copy(), float(self.timestamps[slot])
+
+    def wait_for(self, frame_id, timeout_s=None):
+        with self.condition:
+            ready = self.condition.wait_for(
+                lambda: self.latest_id >= frame_id or not self.running, timeout=timeout_s
+            )
+            self._check()
+            if not ready or self.latest_id < frame_id:
+                raise TimeoutError("Timed out waiting for frame {}.".format(frame_id))
+
+            return self._get(frame_id)
+
+    def latest(self, timeout_s=None):
+        with self.condition:
+            ready = self.condition.wait_for(
+                lambda: self.latest_id >= 0 or not self.running, timeout=timeout_s
+            )
+            self._check()
+            if not ready or self.latest_id < 0:
+                raise TimeoutError("Timed out waiting for the first frame.")
+
+            # Read the ID and the frame under one lock, such that the frame cannot be
+            # overwritten in between.
+            frame_id = self.latest_id
+            img, timestamp = self._get(frame_id)
+
+        return img, frame_id, timestamp
+
+    def since(self, timestamp):
+        with self.condition:
+            self._check()
+
+            ids = np.sort(self.frame_ids[(self.frame_ids >= 0) & (self.timestamps > timestamp)])
+            if len(ids) == 0:
+                return (np.empty((0,) + tuple(self.camera.shape)), ids, np.empty(0))
+
+            images, timestamps = zip(*[self._get(frame_id) for frame_id in ids])
+
+        return np.array(images), ids, np.array(timestamps)
+
+    def stop(self):
+        self.running = False
+        self.thread.join()
+
+
+class _FrameAccumulator():
+    """
+    Preallocated, reusable buffers which accumulate frames one at a time, such that
+    averaging many frames requires :math:`O(HW)` memory rather than a stack of frames.
+    Optionally tracks the per-pixel running mean and variance with Welford's algorithm.
+
+    Attributes
+    ----------
+    sum : numpy.ndarray
+        Sum of the accumulated frames.
+    mean, m2 : numpy.ndarray OR None
+        Running mean and sum of squared deviations (if ``variance``).
+    count : int
+        Number of accumulated frames.
+    """
+
+    def __init__(self, shape, dtype, variance=False):
+        self.sum = np.zeros(shape, dtype=dtype)
+        self.variance = variance
+
+        if variance:
+            self.mean = np.zeros(shape, dtype=float)
+            self.m2 = np.zeros(shape, dtype=float)
+            self._delta = np.zeros(shape, dtype=float)
+        else:
+            self.mean = self.m2 = self._delta = None
+
+        self.count = 0
+
+    def reset(self):
+        self.sum.fill(0)
+        if self.variance:
+            self.mean.fill(0)
+            self.m2.fill(0)
+        self.count = 0
+
+    def add(self, frame):
+        """Accumulates ``frame`` in-place."""
+        np.add(self.sum, frame, out=self.sum, casting="unsafe")
+        self.count += 1
+
+        if self.variance:
+            # Welford: delta = x - mean; mean += delta / n; m2 += delta * (x - mean).
+            np.subtract(frame, self.mean, out=self._delta)
+            self.mean += self._delta * (1 / self.count)
+            self._delta *= frame - self.mean
+            self.m2 += self._delta
+
+    def get_variance(self):
+        """Unbiased per-pixel variance of the accumulated frames."""
+        if self.count < 2:
+            return np.zeros_like(self.m2)
+        return self.m2 / (self.count - 1)
+
+
+class _HDRFusion():
+    """
+    Fuses frames of increasing exposure into a running High Dynamic Range estimate,
+    one frame at a time, without a stack of floating point frames.
+    Buffers (including the per-exposure saturation masks) are reused between captures.
+
+    Attributes
+    ----------
+    img : numpy.ndarray of float
+        Running HDR estimate, at the scale of the first exposure.
+    masks : numpy.ndarray of bool
+        Stack of shape ``(exposures, H, W)``, flagging the pixels of each exposure which
+        are at or above the overexposure threshold (and thus not used).
+    """
+
+    def __init__(self, shape, exposures):
+        self.img = np.zeros(shape, dtype=float)
+        self.masks = np.zeros((int(exposures),) + tuple(shape), dtype=bool)
+        self._valid = np.zeros(shape, dtype=bool)
+
+    def matches(self, shape, exposures):
+        """Whether these buffers can be reused for the given parameters."""
+        return self.masks.shape == (int(exposures),) + tuple(shape)
+
+    def add(self, frame, i, exposure_power, overexposure_threshold):
+        """Fuses ``frame``, the ``i``th exposure, into :attr:`img` in-place."""
+        np.greater_equal(frame, overexposure_threshold, out=self.masks[i])
+
+        if i == 0:
+            np.copyto(self.img, frame, casting="unsafe")
+        else:
+            # Overwrite data when greater precision is available.
+            np.logical_not(self.masks[i], out=self._valid)
+            np.divide(frame, float(exposure_power ** i), out=self.img, where=self._valid)
+
+
 class Camera():
     """
     Abstract class for cameras.
@@ -56,8 +272,9 @@ class Camera():
         (e.g. :meth:`.get_image()` with the ``averaging`` or ``hdr`` flags).
     default_shape : tuple
         Default ``shape`` of the camera before any WOI or transform changes are made.
-    transform : function
+    transform : :class:`~slmsuite.holography.analysis.OrientationTransform` OR function
         Flip and/or rotation operator specified by the user in :meth:`__init__`.
+        Use ``transform.inverse`` to map coordinates back to the raw camera frame.
         The user is expected to apply this transform to the matrix returned in
         :meth:`get_image()`. Note that WOI changes are applied on the camera hardware
         **before** this transformation.
@@ -155,6 +372,7 @@ class Camera():
         # Frame averaging
         self.averaging = self._parse_averaging(averaging, preserve_none=True)
         self.hdr = self._parse_hdr(hdr, preserve_none=True)
+        self.hdr_masks = None
 
         # Spatial dimensions
         if pitch_um is not None:
@@ -487,22 +705,14 @@ class Camera():
                 averaging=averaging,
             )
         elif averaging > 1:     # Average many images.
-            averaging_dtype = self.get_averaging_dtype(averaging)
+            # Sum each frame into a reusable buffer as it arrives, rather than
+            # allocating (and casting) a stack of averaging frames.
+            accumulator = self._get_accumulator(self.get_averaging_dtype(averaging))
 
-            try:
-                # Using the camera-specific batch method if available
-                imgs = self._get_images_hw(
-                    averaging, timeout_s=timeout_s
-                ).astype(averaging_dtype)
-
-                # Cast as the proper type so we can sum.
-                img = np.sum(imgs, axis=0)
-            except NotImplementedError:
-                # Brute-force collection as a backup
-                img = np.zeros(self.default_shape, dtype=averaging_dtype)
-
-                for _ in range(averaging):
-                    img += self._get_image_hw_tolerant(timeout_s=timeout_s).astype(averaging_dtype)
+            for _ in range(averaging):
+                accumulator.add(self._get_image_hw_tolerant(timeout_s=timeout_s))
+
+            img = accumulator.sum.copy()
         else:                   # Normal image
             img = self._get_image_hw_tolerant(timeout_s=timeout_s)
 
@@ -513,7 +723,115 @@ class Camera():
 
         return img
 
-    def get_images(self, image_count, timeout_s=1, out=None, transform=True, flush=False):
+    def _get_accumulator(self, dtype, variance=False):
+        """
+        Returns a reset :class:`_FrameAccumulator` for frames of shape
+        :attr:`default_shape`. Accumulators are cached per ``(dtype, variance)``, such that
+        alternating between e.g. :meth:`.get_image()` and :meth:`.get_image_mean()`
+        reuses the buffers of each.
+        """
+        accumulators = getattr(self, "_accumulators", None)
+        if accumulators is None:
+            accumulators = self._accumulators = {}
+
+        key = (np.dtype(dtype).str, bool(variance))
+        accumulator = accumulators.get(key, None)
+
+        if accumulator is None or accumulator.sum.shape != tuple(self.default_shape):
+            accumulator = _FrameAccumulator(self.default_shape, dtype, variance)
+            accumulators[key] = accumulator
+        else:
+            accumulator.reset()
+
+        return accumulator
+
+    def get_image_mean(
+        self,
+        averaging=None,
+        timeout_s=1,
+        transform=True,
+        variance=False,
+        reject_sigma=None,
+    ):
+        """
+        Capture ``averaging`` frames and return their per-pixel mean (and optionally
+        variance), accumulated frame-by-frame in :math:`O(HW)` memory.
+        Unlike :meth:`.get_image()`, which returns the sum of the frames, the result is
+        always floating point.
+
+        Parameters
+        ----------
+        averaging : int OR None
+            Number of frames to accept. If ``None``, the value of :attr:`averaging` is used.
+        timeout_s : float
+            The time in seconds to wait for each frame to be fetched.
+        transform : bool
+            Whether or not to transform the output according to :attr:`transform`.
+        variance : bool
+            Whether to also return the (unbiased) per-pixel variance.
+        reject_sigma : float OR None
+            If not ``None``, rejects outlier frames (e.g. from a stray reflection or
+            a dropped frame) whose total intensity deviates from the running mean total of
+            accepted frames by more than ``reject_sigma`` standard deviations.
+            Rejection starts after three frames are accepted. Rejected frames are replaced
+            by new frames, up to ``averaging`` extra frames in total.
+
+        Returns
+        -------
+        numpy.ndarray OR (numpy.ndarray, numpy.ndarray)
+            The mean image, or the mean image and variance image if ``variance``.
+        """
+        averaging = self._parse_averaging(averaging)
+        accumulator = self._get_accumulator(float, variance=variance)
+
+        # Running statistics of the frame totals for outlier rejection.
+        (total_mean, total_m2) = (0, 0)
+
+        for _ in range(2 * averaging if reject_sigma is not None else averaging):
+            if accumulator.count >= averaging:
+                break
+
+            frame = self._get_image_hw_tolerant(timeout_s=timeout_s)
+
+            if reject_sigma is not None:
+                total = float(np.sum(frame))
+                n = accumulator.count
+
+                if n >= 3:
+                    std = np.sqrt(total_m2 / (n - 1))
+                    if std > 0 and np.abs(total - total_mean) > reject_sigma * std:
+                        continue
+
+                delta = total - total_mean
+                total_mean += delta / (n + 1)
+                total_m2 += delta * (total - total_mean)
+
+            accumulator.add(frame)
+
+        if accumulator.count < averaging:
+            warnings.warn(
+                f"'{self.name}' only accepted {accumulator.count} of {averaging} frames."
+            )
+
+        if variance:
+            mean = accumulator.mean.copy()
+        else:
+            mean = accumulator.sum / max(accumulator.count, 1)
+        if transform:
+            mean = self.transform(mean)
+
+        if not variance:
+            return mean
+
+        var = accumulator.get_variance()
+        if transform:
+            var = self.transform(var)
+
+        return mean, var
+
+    def get_images(
+        self, image_count, timeout_s=1, out=None, transform=True, flush=False, contiguous=True
+    ):
         """
         Grab ``image_count`` images in succession.
 
@@ -536,6 +854,10 @@ class Camera():
             Defaults to ``True``.
         flush : bool
             Whether to flush before grabbing.
+        contiguous : bool
+            If ``False``, the transformed images are returned as a (generally
+            non-contiguous) strided view over the raw stack, deferring the copy until the
+            consumer needs contiguous data. Defaults to ``True``.
 
         Returns
         -------
@@ -568,18 +890,142 @@ class Camera():
 
         # Transform if desired.
         if transform:
-            imgs_ = np.empty(
-                (int(image_count), self.shape[0], self.shape[1]),
-                dtype=self.dtype
-            )
-            for i in range(image_count):
-                imgs_[i, :, :] = self.transform(imgs[i])
+            if isinstance(self.transform, analysis.OrientationTransform):
+                # Transform the whole stack as a single view.
+                imgs = self.transform(imgs, copy=contiguous)
+            else:
+                # Custom transforms act on single images.
+                imgs_ = np.empty(
+                    (int(image_count), self.shape[0], self.shape[1]),
+                    dtype=self.dtype
+                )
+                for i in range(image_count):
+                    imgs_[i, :, :] = self.transform(imgs[i])
 
-            imgs = imgs_
+                imgs = imgs_
 
         return imgs
 
-    def get_image_hdr(self, exposures=None, return_raw=False, **kwargs):
+    # Streaming methods.
+
+    def start_stream(self, buffer_frames=16, timeout_s=1, transform=True):
+        """
+        Starts continuous acquisition in a background thread, which pulls frames from
+        :meth:`._get_image_hw()` into a preallocated ring buffer of the
+        ``buffer_frames`` most recent frames. Each frame is stored with an
+        incrementing frame ID and the :meth:`time.perf_counter()` timestamp at which it
+        was received. Use :meth:`.latest()`, :meth:`.wait_for()`, and :meth:`.since()`
+        to access frames without waiting on a blocking grab.
+
+        This works with any subclass implementing :meth:`._get_image_hw()`,
+        including :class:`~slmsuite.hardware.cameras.simulated.SimulatedCamera`.
+
+        Tip
+        ~~~
+        Timestamps share a clock with :attr:`~slmsuite.hardware.slms.slm.SLM.display_time`,
+        so ``camera.since(slm.display_time + slm.settle_time_s)`` returns the frames
+        which *finished* after the SLM settled. Frames exposed partly before the
+        deadline may be included, depending on the exposure and readout time.
+
+        Caution
+        ~~~~~~~
+        Other methods which acquire from the camera (e.g. :meth:`.get_image()`) should
+        not be used while streaming, as they would compete with the thread for frames.
+
+        Parameters
+        ----------
+        buffer_frames : int
+            Number of frames in the ring buffer.
+        timeout_s : float
+            The time in seconds to wait for each frame to be fetched.
+        transform : bool
+            Whether to transform each frame according to :attr:`transform`.
+        """
+        if self.is_streaming():
+            raise RuntimeError("Camera '{}' is already streaming.".format(self.name))
+
+        self._stream = _CameraStream(self, buffer_frames, timeout_s, transform)
+
+    def stop_stream(self):
+        """Stops continuous acquisition started by :meth:`.start_stream()`."""
+        stream = getattr(self, "_stream", None)
+        if stream is not None:
+            stream.stop()
+        self._stream = None
+
+    def is_streaming(self):
+        """Returns whether continuous acquisition (see :meth:`.start_stream()`) is running."""
+        stream = getattr(self, "_stream", None)
+        return stream is not None and stream.running
+
+    def _get_stream(self):
+        stream = getattr(self, "_stream", None)
+        if stream is None:
+            raise RuntimeError("Camera '{}' is not streaming. Call start_stream() first.".format(self.name))
+        return stream
+
+    def latest(self, timeout_s=None):
+        """
+        Returns the most recent streamed frame, waiting for the first frame if necessary.
+        See :meth:`.start_stream()`.
+
+        Parameters
+        ----------
+        timeout_s : float OR None
+            The time in seconds to wait if no frame has arrived yet.
+
+        Returns
+        -------
+        (numpy.ndarray, int, float)
+            A copy of the frame, its frame ID, and its timestamp.
+        """
+        return self._get_stream().latest(timeout_s)
+
+    def wait_for(self, frame_id, timeout_s=None):
+        """
+        Blocks until the streamed frame ``frame_id`` has arrived, then returns it.
+        See :meth:`.start_stream()`.
+
+        Parameters
+        ----------
+        frame_id : int
+            ID of the desired frame.
+        timeout_s : float OR None
+            The time in seconds to wait.
+
+        Returns
+        -------
+        (numpy.ndarray, float)
+            A copy of the frame and its timestamp.
+
+        Raises
+        ------
+        ValueError
+            If the frame was already overwritten in the ring buffer.
+        TimeoutError
+            If the frame does not arrive within ``timeout_s``.
+        """
+        return self._get_stream().wait_for(int(frame_id), timeout_s)
+
+    def since(self, timestamp):
+        """
+        Returns all streamed frames still in the ring buffer which were received after
+        ``timestamp``. See :meth:`.start_stream()`.
+
+        Parameters
+        ----------
+        timestamp : float
+            :meth:`time.perf_counter()` timestamp.
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray, numpy.ndarray)
+            Copies of the frames with shape ``(N, height, width)``, their frame IDs, and
+            their timestamps, in order of acquisition.
+        """
+        return self._get_stream().since(timestamp)
+
+    def get_image_hdr(self, exposures=None, return_raw=False, pipelined=True, **kwargs):
         r"""
         Often, the necessities of precision applications exceed the bitdepth of a
         camera. One way to recover High Dynamic Range (HDR) imaging is to use
@@ -602,6 +1048,14 @@ class Camera():
         greater number of sample clock periods are rounded to for smaller relative variation.
         Future modifications to :meth:`get_image_hdr_analysis()` might improve image stitching.
 
+        Note
+        ~~~~
+        Unless ``return_raw``, each frame is fused into a running HDR estimate as it
+        arrives, such that no floating point stack of frames is allocated.
+        The per-exposure saturation masks of the latest capture are kept in
+        :attr:`hdr_masks`, a boolean array of shape ``(exposures, H, W)`` which is
+        reused (overwritten) by the next capture.
+
         Parameters
         ----------
         exposures : int OR (int, int)
@@ -616,6 +1070,10 @@ class Camera():
         return_raw : bool
             If ``True``, returns the raw data (stack of images with count ``exposures``)
             instead of the processed data. The data can be processed using :meth:`get_image_hdr_analysis`
+        pipelined : bool
+            If ``True``, each frame is fused in a background thread while the exposure
+            is changed and the next frame is read out, such that fusion overlaps with
+            acquisition. Ignored if ``return_raw``.
         **kwargs
             Passed to :meth:`.get_image()`.
 
@@ -630,26 +1088,64 @@ class Camera():
         """
         (exposures, exposure_power) = self._parse_hdr(exposures)
 
-        # Make empty data and grab the original exposure time.
+        # Grab the original exposure time.
         original_exposure = self.get_exposure()
-        imgs = np.empty((exposures, self.shape[0], self.shape[1]))
 
-        for i in range(exposures):
-            self.set_exposure(int(exposure_power ** i) * original_exposure)
-            self.flush()    # Sometimes, cameras return bad frames after exposure change.
-            imgs[i, :, :] = self.get_image(hdr=False, **kwargs)
+        if return_raw:
+            imgs = np.empty((exposures, self.shape[0], self.shape[1]))
 
-        # Reset exposure.
-        self.set_exposure(original_exposure)
-        self.flush()
+            for i in range(exposures):
+                self.set_exposure(int(exposure_power ** i) * original_exposure)
+                self.flush()    # Sometimes, cameras return bad frames after exposure change.
+                imgs[i, :, :] = self.get_image(hdr=False, **kwargs)
+
+            # Reset exposure.
+            self.set_exposure(original_exposure)
+            self.flush()
 
-        if return_raw:
             return imgs
-        else:
-            img = self.get_image_hdr_analysis(imgs, exposure_power=exposure_power, overexposure_threshold=self.bitresolution/2)
-            if np.max(img) >= self.bitresolution:
-                warnings.warn("HDR image is overexposed.")
-            return img
+
+        # Reuse the fusion buffers if possible.
+        fusion = getattr(self, "_hdr_fusion", None)
+        if fusion is None or not fusion.matches(self.shape, exposures):
+            fusion = _HDRFusion(self.shape, exposures)
+            self._hdr_fusion = fusion
+            self.hdr_masks = fusion.masks
+
+        threshold = self.bitresolution / 2
+        worker = None
+
+        try:
+            for i in range(exposures):
+                self.set_exposure(int(exposure_power ** i) * original_exposure)
+                self.flush()    # Sometimes, cameras return bad frames after exposure change.
+                frame = self.get_image(hdr=False, **kwargs)
+
+                # Fusion of the previous frame must complete before this one.
+                if worker is not None:
+                    worker.join()
+
+                if pipelined:
+                    worker = threading.Thread(
+                        target=fusion.add,
+                        args=(frame, i, exposure_power, threshold),
+                        daemon=True
+                    )
+                    worker.start()
+                else:
+                    fusion.add(frame, i, exposure_power, threshold)
+        finally:
+            # Reset exposure (overlapping with the fusion of the last frame).
+            self.set_exposure(original_exposure)
+            self.flush()
+
+            if worker is not None:
+                worker.join()
+
+        img = fusion.img.copy()
+        if np.max(img) >= self.bitresolution:
+            warnings.warn("HDR image is overexposed.")
+        return img
 
     @staticmethod
     def get_image_hdr_analysis(imgs, overexposure_threshold=None, exposure_power=2):
@@ -682,24 +1178,18 @@ class Camera():
             The scale of the returned image is the same as the original exposure.
         """
         # Parse arguments
+        imgs = np.asarray(imgs)
         exposure_power = int(exposure_power)
         if overexposure_threshold is None:
             # Default to half exposure.
             overexposure_threshold = np.max(imgs) / 2
 
-        img = None
+        fusion = _HDRFusion(imgs.shape[1:], imgs.shape[0])
 
         for i in range(imgs.shape[0]):
-            img_current = imgs[i, :, :].astype(float)
-
-            if i == 0:
-                img = img_current
-            else:
-                # Overwrite data when greater precision is available.
-                mask = img_current < overexposure_threshold
-                img[mask] = img_current[mask] / float(exposure_power ** i)
+            fusion.add(imgs[i], i, exposure_power, overexposure_threshold)
 
-        return img
+        return fusion.img
 
     # Other helper methods.
 
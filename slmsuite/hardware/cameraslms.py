@@ -27,6 +27,199 @@ from slmsuite.misc.math import REAL_TYPES
 from slmsuite.hardware.cameras.simulated import SimulatedCamera
 from slmsuite.hardware.slms.simulated import SimulatedSLM
 
+class MonotonicClock:
+    """
+    Clock used by :class:`CameraSLMSequencer` to schedule hardware,
+    based upon :meth:`time.perf_counter()` (as for :attr:`.SLM.display_time`).
+    """
+
+    def now(self):
+        """Returns the current time in seconds."""
+        return time.perf_counter()
+
+    def sleep(self, delay):
+        """Waits for ``delay`` seconds."""
+        if delay > 0:
+            time.sleep(delay)
+
+
+class SimulatedClock(MonotonicClock):
+    """
+    Virtual clock for :class:`CameraSLMSequencer` with simulated hardware.
+    Time only advances when waiting, such that schedules are deterministic and
+    settle windows do not cost real time.
+
+    Note
+    ~~~~
+    Simulated writes and grabs take no virtual time, so the resulting
+    :attr:`CameraSLMSequencer.stats` only reflect the scheduled ``settle_time_s``
+    and ``period_s``, and exclude I/O. With neither set, all grabs are simultaneous
+    and the frame rate is undefined (``nan``).
+
+    Attributes
+    ----------
+    time : float
+        Current virtual time in seconds.
+    """
+
+    def __init__(self, start=0):
+        self.time = float(start)
+
+    def now(self):
+        return self.time
+
+    def sleep(self, delay):
+        if delay > 0:
+            self.time += delay
+
+
+class CameraSLMSequencer:
+    """
+    Schedules SLM writes, settle windows, and camera grabs for a list of patterns on a
+    monotonic clock, yielding synchronized ``(pattern_index, image)`` pairs when
+    iterated. Construct with :meth:`CameraSLM.sequence()`.
+
+    Every step is scheduled against absolute deadlines: pattern ``i`` is written at
+    ``start + i * period_s`` (or as soon as the previous grab completes), and grabbed
+    once ``settle_time_s`` has passed since the write completed. A late step therefore
+    does not delay later deadlines.
+
+    Tip
+    ~~~
+    With ``preload=True``, patterns are converted once with :meth:`.SLM.preload()`
+    beforehand, such that each write is a buffer copy with :meth:`.SLM.show()`.
+
+    Attributes
+    ----------
+    cameraslm : CameraSLM
+        Hardware to sequence.
+    patterns : list of array_like
+        Phase patterns to write.
+    settle_time_s : float
+        Time waited between the write and the grab.
+    period_s : float OR None
+        Target time between writes, or ``None`` for as fast as possible.
+    clock : MonotonicClock
+        Clock used for scheduling. Defaults to a :class:`SimulatedClock` if both the
+        camera and SLM are simulated.
+    stats : dict
+        Timing of the latest run, updated after every frame.
+
+        ``"write_times"``, ``"grab_times"`` : numpy.ndarray
+            Clock times at which each write completed and each grab started.
+        ``"lateness_s"`` : numpy.ndarray
+            Delay of each grab past its scheduled time.
+        ``"frame_rate"`` : float
+            Achieved frame rate in Hz, or ``nan`` if fewer than two grabs occurred or
+            all grabs were simultaneous (e.g. on a :class:`SimulatedClock` without
+            settling).
+        ``"jitter_s"`` : float
+            Standard deviation of the time between grabs.
+    """
+
+    def __init__(
+        self,
+        cameraslm,
+        patterns,
+        settle_time_s=None,
+        period_s=None,
+        phase_correct=True,
+        preload=False,
+        clock=None,
+        **kwargs
+    ):
+        """
+        See :meth:`CameraSLM.sequence()`.
+        """
+        self.cameraslm = cameraslm
+        self.patterns = list(patterns)
+
+        if settle_time_s is None:
+            settle_time_s = cameraslm.slm.settle_time_s
+        self.settle_time_s = float(settle_time_s)
+        if self.settle_time_s < 0:
+            raise ValueError("settle_time_s must be non-negative.")
+
+        self.period_s = None if period_s is None else float(period_s)
+        self.phase_correct = phase_correct
+        self.preload = preload
+        self.kwargs = kwargs
+
+        if clock is None:
+            if (
+                isinstance(cameraslm.cam, SimulatedCamera)
+                and isinstance(cameraslm.slm, SimulatedSLM)
+            ):
+                clock = SimulatedClock()
+            else:
+                clock = MonotonicClock()
+        self.clock = clock
+
+        self.stats = self._get_stats([], [], [])
+
+    def __len__(self):
+        return len(self.patterns)
+
+    @staticmethod
+    def _get_stats(write_times, grab_times, lateness):
+        grab_times = np.array(grab_times)
+
+        if len(grab_times) > 1:
+            intervals = np.diff(grab_times)
+            span = grab_times[-1] - grab_times[0]
+            frame_rate = (len(grab_times) - 1) / span if span > 0 else np.nan
+            jitter = np.std(intervals)
+        else:
+            frame_rate = jitter = np.nan
+
+        return {
+            "write_times" : np.array(write_times),
+            "grab_times" : grab_times,
+            "lateness_s" : np.array(lateness),
+            "frame_rate" : frame_rate,
+            "jitter_s" : jitter,
+        }
+
+    def __iter__(self):
+        slm = self.cameraslm.slm
+        cam = self.cameraslm.cam
+        clock = self.clock
+
+        if self.preload:
+            slm.preload(self.patterns, phase_correct=self.phase_correct)
+
+        write_times = []
+        grab_times = []
+        lateness = []
+
+        t_start = clock.now()
+
+        for i, pattern in enumerate(self.patterns):
+            # Wait until the write deadline.
+            if self.period_s is not None:
+                clock.sleep(t_start + i * self.period_s - clock.now())
+
+            if self.preload:
+                slm.show(i)
+            else:
+                slm.write(pattern, phase_correct=self.phase_correct, settle=False)
+            t_write = clock.now()
+
+            # Wait for the pattern to settle, then grab.
+            t_grab = t_write + self.settle_time_s
+            clock.sleep(t_grab - clock.now())
+
+            t_actual = clock.now()
+            image = cam.get_image(**self.kwargs)
+
+            write_times.append(t_write)
+            grab_times.append(t_actual)
+            lateness.append(t_actual - t_grab)
+            self.stats = self._get_stats(write_times, grab_times, lateness)
+
+            yield i, image
+
+
 class CameraSLM:
     """
     Base class for an SLM with camera feedback.
@@ -86,6 +279,63 @@ class CameraSLM:
 
         self.calibrations = {}
 
+    def sequence(
+        self,
+        patterns,
+        settle_time_s=None,
+        period_s=None,
+        phase_correct=True,
+        preload=False,
+        clock=None,
+        **kwargs
+    ):
+        """
+        Sequences writes of ``patterns`` to the SLM with synchronized camera grabs.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            sequencer = cameraslm.sequence(patterns, settle_time_s=.01)
+            for index, image in sequencer:
+                ...
+            print(sequencer.stats["frame_rate"], sequencer.stats["jitter_s"])
+
+        Parameters
+        ----------
+        patterns : list of array_like
+            Phase patterns to write in order. ``None`` writes a flat pattern.
+        settle_time_s : float OR None
+            Time to wait between each write and grab. If ``None``, uses
+            :attr:`.SLM.settle_time_s`.
+        period_s : float OR None
+            Target time between writes. If ``None``, runs as fast as possible.
+        phase_correct : bool
+            Passed to :meth:`.SLM.write()` (or :meth:`.SLM.preload()`).
+        preload : bool
+            Whether to convert all patterns with :meth:`.SLM.preload()` beforehand,
+            such that each write is a fast :meth:`.SLM.show()`.
+        clock : MonotonicClock OR None
+            Clock to schedule on. If ``None``, uses a :class:`SimulatedClock` for
+            simulated hardware and a :class:`MonotonicClock` otherwise.
+        **kwargs
+            Passed to :meth:`.Camera.get_image()`.
+
+        Returns
+        -------
+        CameraSLMSequencer
+            Iterable yielding ``(pattern_index, image)``, with timing in ``stats``.
+        """
+        return CameraSLMSequencer(
+            self,
+            patterns,
+            settle_time_s=settle_time_s,
+            period_s=period_s,
+            phase_correct=phase_correct,
+            preload=preload,
+            clock=clock,
+            **kwargs
+        )
+
     def plot(
             self,
             phase=None,
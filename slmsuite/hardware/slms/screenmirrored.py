@@ -89,14 +89,19 @@ class ScreenMirrored(SLM):
         Fullscreen window used to send information to the SLM.
     tex_shape_ratio : (int, int)
         Ratio between the SLM shape and the (power-2-padded) texture stored in ``OpenGL``.
-    buffer : numpy.ndarray
+    buffer : numpy.ndarray OR None
         Memory used to load data to the ``OpenGL`` memory. Of type ``np.uint8``.
-    cbuffer : pyglet.gl.GLubyte
+        ``None`` if :attr:`pbos` are used.
+    cbuffer : pyglet.gl.GLubyte OR None
         Array of length ``prod(shape) * 4`` (4 bytes per RGBA).
         Maps to the same memory as :attr:`buffer`.
         Used to load data to the texture.
+        ``None`` if :attr:`pbos` are used.
     texture : pyglet.gl.GLuint
         Identifier for the texture loaded into ``OpenGL`` memory.
+    pbos : pyglet.gl.GLuint array OR None
+        Identifiers for the two pixel buffer objects used to stream
+        single-channel data to the texture. ``None`` if the RGBA upload is used.
     """
 
     def __init__(
@@ -105,6 +110,7 @@ class ScreenMirrored(SLM):
             bitdepth=8,
             wav_um=1,
             pitch_um=(8,8),
+            pbo=True,
             verbose=True,
             **kwargs
         ):
@@ -140,6 +146,13 @@ class ScreenMirrored(SLM):
             Wavelength of operation in microns. Defaults to 1 um.
         pitch_um : (float, float)
             Pixel pitch in microns. Defaults to 8 micron square pixels.
+        pbo : bool
+            Whether to stream a single 8-bit luminance channel to the texture through
+            two alternating pixel buffer objects (PBOs). The transfer from a PBO to the
+            texture is asynchronous, so the conversion of the next frame overlaps with the
+            transfer of the current frame, and the data is not replicated into RGBA
+            channels on the CPU. If ``False``, uses the (slower) synchronous RGBA upload.
+            Defaults to ``True``.
         verbose : bool
             Whether or not to print extra information.
         **kwargs
@@ -205,47 +218,8 @@ class ScreenMirrored(SLM):
             proj = pyglet.window.Projection2D()
             proj.set(self.shape[1], self.shape[0], self.shape[1], self.shape[0])
 
-            # Setup shapes
-            texture_shape = tuple(np.power(2, np.ceil(np.log2(self.shape)))
-                                .astype(np.int64))
-            self.tex_shape_ratio = (float(self.shape[0])/float(texture_shape[0]),
-                                    float(self.shape[1])/float(texture_shape[1]))
-            B = 4
-
-            # Setup buffers (texbuffer is power of 2 padded to init the memory in OpenGL)
-            self.buffer = np.zeros(self.shape + (B,), dtype=np.uint8)
-            N = int(self.shape[0] * self.shape[1] * B)
-            self.cbuffer = (gl.GLubyte * N).from_buffer(self.buffer)
-
-            texbuffer = np.zeros(texture_shape + (B,), dtype=np.uint8)
-            Nt = int(texture_shape[0] * texture_shape[1] * B)
-            texcbuffer = (gl.GLubyte * Nt).from_buffer(texbuffer)
-
-            # Setup the texture
-            gl.glEnable(gl.GL_TEXTURE_2D)
-            self.texture = gl.GLuint()
-            gl.glGenTextures(1, ctypes.byref(self.texture))
-            gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture.value)
-
-            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_GENERATE_MIPMAP, gl.GL_FALSE)
-            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_NEAREST)
-            gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_NEAREST)
-
-            # Malloc the OpenGL memory
-            gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, gl.GL_RGBA8,
-                            texture_shape[1], texture_shape[0],
-                            0, gl.GL_BGRA, gl.GL_UNSIGNED_BYTE,
-                            texcbuffer)
-
-            # Make sure we can write to a subset of the memory (as we will do in the future)
-            gl.glTexSubImage2D(gl.GL_TEXTURE_2D, 0, 0, 0,
-                            self.shape[1], self.shape[0],
-                            gl.GL_BGRA, gl.GL_UNSIGNED_BYTE,
-                            self.cbuffer)
-
-            # Cleanup
-            gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
-            gl.glFlush()
+            # Setup the texture and buffers.
+            self._setup_texture(pbo)
 
             # Write nothing.
             self.write(phase=None)
@@ -267,14 +241,125 @@ class ScreenMirrored(SLM):
                 "design wavelength {} um".format(self.wav_um, self.wav_design_um)
             )
 
+    def _setup_texture(self, pbo=True):
+        """
+        Allocates the texture in ``OpenGL`` memory, along with either the pixel buffer
+        objects (``pbo=True``) or the RGBA host buffer used to upload data to it.
+        """
+        # Setup shapes
+        texture_shape = tuple(np.power(2, np.ceil(np.log2(self.shape)))
+                            .astype(np.int64))
+        self.tex_shape_ratio = (float(self.shape[0])/float(texture_shape[0]),
+                                float(self.shape[1])/float(texture_shape[1]))
+        B = 1 if pbo else 4
+
+        if pbo:
+            # Single-channel luminance data is replicated to RGB by OpenGL, not the CPU.
+            internal_format = gl.GL_LUMINANCE8
+            data_format = gl.GL_LUMINANCE
+            gl.glPixelStorei(gl.GL_UNPACK_ALIGNMENT, 1)
+        else:
+            internal_format = gl.GL_RGBA8
+            data_format = gl.GL_BGRA
+
+        # Setup buffers (texbuffer is power of 2 padded to init the memory in OpenGL)
+        texbuffer = np.zeros(texture_shape + (B,), dtype=np.uint8)
+        Nt = int(texture_shape[0] * texture_shape[1] * B)
+        texcbuffer = (gl.GLubyte * Nt).from_buffer(texbuffer)
+
+        # Setup the texture
+        gl.glEnable(gl.GL_TEXTURE_2D)
+        self.texture = gl.GLuint()
+        gl.glGenTextures(1, ctypes.byref(self.texture))
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture.value)
+
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_GENERATE_MIPMAP, gl.GL_FALSE)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MAG_FILTER, gl.GL_NEAREST)
+        gl.glTexParameteri(gl.GL_TEXTURE_2D, gl.GL_TEXTURE_MIN_FILTER, gl.GL_NEAREST)
+
+        # Malloc the OpenGL memory
+        gl.glTexImage2D(gl.GL_TEXTURE_2D, 0, internal_format,
+                        texture_shape[1], texture_shape[0],
+                        0, data_format, gl.GL_UNSIGNED_BYTE,
+                        texcbuffer)
+
+        N = int(self.shape[0] * self.shape[1] * B)
+
+        if pbo:
+            self.buffer = None
+            self.cbuffer = None
+
+            # Two pixel buffer objects to alternate between.
+            self.pbos = (gl.GLuint * 2)()
+            self._pbo_index = 0
+            gl.glGenBuffers(2, self.pbos)
+            for i in range(2):
+                gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, self.pbos[i])
+                gl.glBufferData(gl.GL_PIXEL_UNPACK_BUFFER, N, None, gl.GL_STREAM_DRAW)
+            gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, 0)
+        else:
+            self.pbos = None
+
+            self.buffer = np.zeros(self.shape + (B,), dtype=np.uint8)
+            self.cbuffer = (gl.GLubyte * N).from_buffer(self.buffer)
+
+            # Make sure we can write to a subset of the memory (as we will do in the future)
+            gl.glTexSubImage2D(gl.GL_TEXTURE_2D, 0, 0, 0,
+                            self.shape[1], self.shape[0],
+                            gl.GL_BGRA, gl.GL_UNSIGNED_BYTE,
+                            self.cbuffer)
+
+        # Cleanup
+        gl.glBindTexture(gl.GL_TEXTURE_2D, 0)
+        gl.glFlush()
+
+    def _upload_texture(self, data):
+        """
+        Loads ``data`` into the texture, either by streaming one channel through the next
+        pixel buffer object or by the synchronous RGBA upload.
+        """
+        gl.glEnable(gl.GL_TEXTURE_2D)
+        gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture.value)
+
+        if self.pbos is None:
+            # Write to buffer (self.buffer is the same as self.cbuffer).
+            # Unfortunately, OpenGL needs the data copied three times.
+            np.copyto(self.buffer[:,:,0], data)
+            np.copyto(self.buffer[:,:,1], data)
+            np.copyto(self.buffer[:,:,2], data)
+
+            gl.glTexSubImage2D(gl.GL_TEXTURE_2D, 0, 0, 0,
+                            self.shape[1], self.shape[0],
+                            gl.GL_RGBA, gl.GL_UNSIGNED_BYTE,
+                            self.cbuffer)
+        else:
+            data = np.ascontiguousarray(data, dtype=np.uint8)
+            N = data.nbytes
+
+            # Alternate pixel buffer objects, such that we never write to the buffer
+            # which the previous transfer might still be reading.
+            gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, self.pbos[self._pbo_index])
+            self._pbo_index = 1 - self._pbo_index
+
+            # Orphan the old storage (so mapping does not stall), then copy the data in.
+            gl.glBufferData(gl.GL_PIXEL_UNPACK_BUFFER, N, None, gl.GL_STREAM_DRAW)
+            pointer = gl.glMapBuffer(gl.GL_PIXEL_UNPACK_BUFFER, gl.GL_WRITE_ONLY)
+            if not pointer:
+                gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, 0)
+                raise RuntimeError("Could not map the OpenGL pixel buffer object.")
+            ctypes.memmove(pointer, data.ctypes.data, N)
+            gl.glUnmapBuffer(gl.GL_PIXEL_UNPACK_BUFFER)
+
+            # With a PBO bound, the data argument is an offset into the PBO,
+            # and the transfer is asynchronous.
+            gl.glTexSubImage2D(gl.GL_TEXTURE_2D, 0, 0, 0,
+                            self.shape[1], self.shape[0],
+                            gl.GL_LUMINANCE, gl.GL_UNSIGNED_BYTE,
+                            None)
+            gl.glBindBuffer(gl.GL_PIXEL_UNPACK_BUFFER, 0)
+
     def _write_hw(self, data):
         """Writes to screen. See :class:`.SLM`."""
-        # Write to buffer (self.buffer is the same as self.cbuffer).
-        # Unfortunately, OpenGL needs the data copied three times.
-        np.copyto(self.buffer[:,:,0], data)
-        np.copyto(self.buffer[:,:,1], data)
-        np.copyto(self.buffer[:,:,2], data)
-
         # Setup texture variables.
         x1 = 0
         y1 = 0
@@ -297,12 +382,7 @@ class ScreenMirrored(SLM):
             x1, y2, 0., 1.)
 
         # Update the texture.
-        gl.glEnable(gl.GL_TEXTURE_2D)
-        gl.glBindTexture(gl.GL_TEXTURE_2D, self.texture.value)
-        gl.glTexSubImage2D(gl.GL_TEXTURE_2D, 0, 0, 0,
-                        self.shape[1], self.shape[0],
-                        gl.GL_RGBA, gl.GL_UNSIGNED_BYTE,
-                        self.cbuffer)
+        self._upload_texture(data)
 
         # Blit the texture.
         gl.glPushClientAttrib(gl.GL_CLIENT_VERTEX_ARRAY_BIT)
@@ -4,7 +4,17 @@ Abstract functionality for SLMs.
 
 import time
 import os
+import queue
+import threading
+import weakref
+import concurrent.futures
 import numpy as np
+try:
+    import cupy as cp                               # type: ignore
+    from cupyx import zeros_pinned as cp_zeros_pinned   # type: ignore
+except ImportError:
+    cp = np
+    cp_zeros_pinned = np.zeros
 import matplotlib.pyplot as plt
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 import warnings
@@ -17,6 +27,111 @@ from slmsuite.holography import analysis
 from slmsuite.misc.files import generate_path, latest_path, write_h5, read_h5
 
 
+class _AsyncWriter:
+    """
+    Background thread which converts and displays patterns for :meth:`SLM.write_async()`.
+
+    Each pattern is converted into a back buffer while the front buffer
+    (:attr:`SLM.phase`, :attr:`SLM.display`) is still displayed. The buffers are then
+    swapped (without copying) and the front buffer is sent to the SLM once the
+    previous frame is released: either when it has settled, or (for frames written
+    with ``hold=True``) when :meth:`SLM.release()` is called.
+
+    The thread only holds a weak proxy to the SLM, such that the SLM can still be
+    garbage collected (and closed by :meth:`SLM.__del__()`) while the thread runs.
+    """
+
+    def __init__(self, slm):
+        self.slm = weakref.proxy(slm)
+        self.back = (np.zeros_like(slm.phase), np.zeros_like(slm.display))
+
+        self.queue = queue.Queue(maxsize=2)
+        self.released = threading.Event()
+        self.released.set()
+        self.condition = threading.Condition()
+
+        self.submitted = 0
+        self.displayed = 0
+        self.deadline = 0
+        self.closing = False
+
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+
+    def submit(self, phase, phase_correct, hold):
+        future = concurrent.futures.Future()
+
+        with self.condition:
+            self.submitted += 1
+
+        self.queue.put((phase, phase_correct, hold, future))
+
+        return future
+
+    def _run(self):
+        while True:
+            job = self.queue.get()
+            if job is None:
+                return
+            (phase, phase_correct, hold, future) = job
+
+            try:
+                # Convert while the previous frame is displayed.
+                self.slm._format_display(phase, phase_correct, out=self.back)
+
+                # Wait for the previous frame to be released and settled.
+                self.released.wait()
+                delay = self.deadline - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+                # Swap buffers and display.
+                with self.condition:
+                    front = (self.slm.phase, self.slm.display)
+                    (self.slm.phase, self.slm.display) = self.back
+                    self.back = front
+
+                    self.slm._write_hw(self.slm.display)
+                    t = time.perf_counter()
+
+                    self.slm.display_time = t
+                    self.deadline = t + self.slm.settle_time_s
+                    if hold and not self.closing:
+                        self.released.clear()
+            except BaseException as err:
+                future.set_exception(err)
+            else:
+                future.set_result(t)
+            finally:
+                with self.condition:
+                    self.displayed += 1
+                    self.condition.notify_all()
+
+    def wait(self, timeout=None):
+        """Waits until no frame can be displayed without a release, then until settled."""
+        with self.condition:
+            ready = self.condition.wait_for(
+                lambda: self.displayed == self.submitted or not self.released.is_set(),
+                timeout=timeout,
+            )
+        if not ready:
+            raise TimeoutError("Timed out waiting for the SLM to display.")
+
+        delay = self.deadline - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+        return self.slm.display_time
+
+    def close(self):
+        with self.condition:    # Held patterns are released, and no longer held.
+            self.closing = True
+            self.released.set()
+        self.queue.put(None)
+        if threading.current_thread() is not self.thread:
+            self.thread.join()
+
+
 class SLM:
     """
     Abstract class for SLMs.
@@ -87,10 +202,24 @@ class SLM:
         far-field.
 
         When :meth:`.fit_source_amplitude()` is called,
+    phase_curve : numpy.ndarray OR None
+        Measured phase delay (radians) produced by each of the :attr:`bitresolution`
+        grayscale levels, for SLMs with a nonlinear response.
+        A linear SLM has ``phase_curve[g] = 2*pi*(bitresolution - 1 - g)/(bitresolution * phase_scaling)``.
+        If not ``None``, :meth:`write()` converts phase to the grayscale
+        level with the nearest (modulo :math:`2\pi`) measured phase.
+        Defaults to ``None`` (linear response). Assign a new array (rather than
+        modifying in-place) to rebuild the lookup table.
     phase : numpy.ndarray
         Displayed data in units of phase (radians).
     display : numpy.ndarray
         Displayed data in SLM units (integers).
+    display_time : float OR None
+        :meth:`time.perf_counter()` timestamp at which :attr:`display` was last sent to
+        the SLM, such that the pattern has settled at ``display_time + settle_time_s``.
+    playlist : numpy.ndarray OR numpy.memmap OR None
+        Stack of preconverted :attr:`display` buffers with shape ``(N, height, width)``.
+        See :meth:`preload()` and :meth:`show()`.
     """
 
     def __init__(
@@ -177,11 +306,33 @@ class SLM:
         self.phase = np.zeros(self.shape)
         self.display = np.zeros(self.shape, dtype=dtype)
 
+        # Nonlinear response and the cached lookup table for phase conversion.
+        self.phase_curve = None
+        self._phase_lut = None
+        self._phase_lut_key = None
+        self._phase_lut_device = None
+        self._phase_lut_index = {}
+
+        # Device buffers for cupy phase data. See _format_display_device().
+        self._device_buffers = None
+
+        # Preconverted patterns.
+        self.playlist = None
+
+        # Display timing and the (lazily started) asynchronous writer.
+        self.display_time = None
+        self._async_writer = None
+
     def close(self):
         """Abstract method to close the SLM and delete related objects."""
         raise NotImplementedError()
 
     def __del__(self):
+        try:
+            self.stop_async()
+        except:
+            pass
+
         try:
             self.close()
         except:
@@ -381,8 +532,9 @@ class SLM:
         -  :attr:`phase_scaling` is less than one.
             In this case, the SLM has **more phase tuning range** than necessary.
             If the data is within the SLM range ``[0, 2*pi/phase_scaling]``, then the data is passed directly.
-            Otherwise, the data is wrapped by :math:`2\pi` using the very slow :meth:`numpy.mod()`.
-            Try to avoid this in applications where speed is important.
+            Otherwise, the data is wrapped by :math:`2\pi` by quantizing the phase to a
+            fixed-point integer index and mapping through a precomputed lookup table.
+            This is slower than the bitwise routine, but much faster than :meth:`numpy.mod()`.
 
         -  :attr:`phase_scaling` is more than one.
             In this case, the SLM has **less phase tuning range** than necessary.
@@ -390,6 +542,15 @@ class SLM:
             important exception that phases (after wrapping) between ``2*pi/phase_scaling`` and
             ``2*pi`` are set to zero. For instance, a sawtooth blaze would be truncated at the tips.
 
+        -  :attr:`phase_curve` is not ``None``.
+            The lookup table routine is always used, with the table built from the measured curve.
+
+        Note
+        ~~~~
+        The lookup table resolves :math:`2\pi` into at least :math:`2^{16}` fixed-point
+        steps, so phases within :math:`2\pi/2^{16}` of a boundary between two
+        grayscale levels may round to the neighboring level.
+
         Caution
         ~~~~~~~
         After scale conversion, data is ``floor()`` ed to integers with ``np.copyto``, rather than
@@ -407,6 +568,11 @@ class SLM:
             unless the passed data is of integer type and the data is applied directly.
 
             -  If ``None`` is passed to :meth:`.write()`, data is zeroed.
+            -  If a :mod:`cupy` array is passed (e.g. from a
+               :class:`~slmsuite.holography.algorithms.Hologram`), phase correction and
+               conversion are done on the GPU, and only the integer :attr:`display`
+               data is transferred to the host. In this case, :attr:`phase` is filled
+               with ``nan`` as the phase is not transferred.
             -  If the array has a larger shape than the SLM shape, then the data is
                cropped to size in a centered manner
                (:attr:`~slmsuite.holography.toolbox.unpad`).
@@ -424,7 +590,8 @@ class SLM:
             Usually, an **exact** stored copy of the data passed by the user under
             ``phase`` is stored in the attribute :attr:`phase`.
             However, in cases where :attr:`phase_scaling` not one, this
-            copy is modified to include how the data was wrapped. If the data was
+            copy may differ by floating point error (or be wrapped, for phases too large
+            to be quantized to 64-bit integers). If the data was
             cropped, then the cropped data is stored, etc. If integer data was passed, the
             equivalent floating point phase is computed and stored in the attribute :attr:`phase`.
         phase_correct : bool
@@ -443,13 +610,169 @@ class SLM:
             If integer data is incompatible with the bitdepth or if the passed phase is
             otherwise incompatible (not a 2D array or smaller than the SLM shape, etc).
         """
+        self._format_display(phase, phase_correct)
+
+        # Write!
+        self._write_hw(self.display)
+        self.display_time = time.perf_counter()
+
+        # Optional delay.
+        if settle:
+            time.sleep(self.settle_time_s)
+
+        return self.display
+
+    def write_async(self, phase, phase_correct=True, hold=False):
+        """
+        Queues ``phase`` to be converted and written to the SLM by a background thread,
+        returning immediately. Patterns are double-buffered: each pattern is converted
+        (see :meth:`write()`) while the previous pattern is still displayed, then written
+        once the previous pattern is released. This overlaps conversion with settling
+        and camera capture, rather than serializing them with :meth:`write()`.
+
+        A pattern is released either
+
+        - when it has settled (``hold=False``), or
+        - when :meth:`release()` is called (``hold=True``), e.g. after a camera capture.
+
+        .. highlight:: python
+        .. code-block:: python
+
+            slm.write_async(patterns[0], hold=True)
+            for i in range(1, len(patterns)):
+                slm.write_async(patterns[i], hold=True)   # Converted now.
+                slm.wait_settled()                        # Previous pattern settled.
+                images.append(cam.get_image())
+                slm.release()                             # Next pattern displayed.
+            slm.wait_settled()
+            images.append(cam.get_image())
+            slm.release()
+
+        Tip
+        ~~~
+        The background thread is started upon the first call and runs until
+        :meth:`stop_async()` is called or the SLM is garbage collected.
+
+        Caution
+        ~~~~~~~
+        Do not call :meth:`write()` while asynchronous writes are pending.
+        :attr:`phase` and :attr:`display` are swapped with the back buffer (rather
+        than copied into) when each pattern is displayed.
+
+        Parameters
+        ----------
+        phase : numpy.ndarray OR None
+            See :meth:`write()`. A copy is queued, so the caller may reuse the array.
+        phase_correct : bool
+            See :meth:`write()`.
+        hold : bool
+            Whether to keep this pattern displayed until :meth:`release()` is called.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the :meth:`time.perf_counter()` timestamp at which the pattern
+            was sent to the SLM (see :attr:`display_time`).
+        """
+        if self._async_writer is None:
+            self._async_writer = _AsyncWriter(self)
+
+        if cp != np and isinstance(phase, cp.ndarray):
+            phase = phase.copy()    # Stay on the GPU.
+        elif phase is not None:
+            phase = np.array(phase, copy=True)
+
+        return self._async_writer.submit(phase, phase_correct, hold)
+
+    def wait_settled(self, timeout=None):
+        """
+        Blocks until the currently displayed pattern has settled, i.e. until
+        :attr:`display_time` ``+`` :attr:`settle_time_s`. If patterns from
+        :meth:`write_async()` are pending, first waits until they are displayed
+        (or blocked behind a held pattern).
+
+        Parameters
+        ----------
+        timeout : float OR None
+            Maximum time in seconds to wait for pending patterns to be displayed.
+
+        Returns
+        -------
+        float OR None
+            :attr:`display_time` of the settled pattern.
+
+        Raises
+        ------
+        TimeoutError
+            If pending patterns are not displayed within ``timeout``.
+        """
+        if self._async_writer is None:
+            if self.display_time is not None:
+                delay = self.display_time + self.settle_time_s - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            return self.display_time
+
+        return self._async_writer.wait(timeout)
+
+    def release(self):
+        """
+        Releases a pattern written by :meth:`write_async()` with ``hold=True``,
+        such that the next pending pattern is displayed.
+        """
+        if self._async_writer is not None:
+            self._async_writer.released.set()
+
+    def stop_async(self):
+        """
+        Stops the background thread started by :meth:`write_async()`, after displaying
+        any pending patterns (held patterns are released). This is also done when the
+        SLM is garbage collected; call it explicitly to free the thread deterministically.
+        A later :meth:`write_async()` starts a new thread.
+        """
+        if self._async_writer is not None:
+            self._async_writer.close()
+            self._async_writer = None
+
+    def _format_display(self, phase, phase_correct=True, out=None):
+        """
+        Checks, cleans, and adds to data, then populates :attr:`phase` and :attr:`display`
+        without sending the data to the SLM. See :meth:`write()`.
+
+        Parameters
+        ----------
+        phase : numpy.ndarray or None
+            See :meth:`write()`.
+        phase_correct : bool
+            See :meth:`write()`.
+        out : (numpy.ndarray, numpy.ndarray) OR None
+            Buffers of shape :attr:`shape` to populate in place of
+            ``(phase, display)``, e.g. for preconversion.
+            If ``None``, populates :attr:`phase` and :attr:`display`.
+
+        Returns
+        -------
+        numpy.ndarray
+           :attr:`~slmsuite.hardware.slms.slm.SLM.display` (or the display buffer in ``out``).
+        """
+        if out is None:
+            out = (self.phase, self.display)
+        (phase_out, display_out) = out
+
+        # Convert GPU data on the GPU.
+        if cp != np and isinstance(phase, cp.ndarray):
+            if np.issubdtype(phase.dtype, np.integer):
+                phase = phase.get()
+            else:
+                return self._format_display_device(phase, phase_correct, out)
+
         # Helper variable to speed the case where phase is None.
         zero_phase = False
 
         # Parse phase.
         if phase is None:
             # Zero the phase pattern.
-            self.phase.fill(0)
+            phase_out.fill(0)
             zero_phase = True
         else:
             # Make sure the array is an ndarray.
@@ -474,44 +797,80 @@ class SLM:
 
             # Copy the pattern and unpad if necessary.
             if phase.shape != self.shape:
-                np.copyto(self.display, toolbox.unpad(phase, self.shape))
+                np.copyto(display_out, toolbox.unpad(phase, self.shape))
             else:
-                np.copyto(self.display, phase)
+                np.copyto(display_out, phase)
 
             # Update the phase variable with the integer data that we displayed.
-            self.phase = 2 * np.pi - self.display * (
-                2 * np.pi / self.phase_scaling / self.bitresolution
+            np.copyto(
+                phase_out,
+                2 * np.pi - display_out * (2 * np.pi / self.phase_scaling / self.bitresolution)
             )
         else:
             # If float data was passed (or the None case).
             # Copy the pattern and unpad if necessary.
             if phase is not None:
-                if self.phase.shape != self.shape:
-                    np.copyto(self.phase, toolbox.unpad(self.phase, self.shape))
+                if phase.shape != self.shape:
+                    np.copyto(phase_out, toolbox.unpad(phase, self.shape))
                 else:
-                    np.copyto(self.phase, phase)
+                    np.copyto(phase_out, phase)
 
             # Add phase correction if requested.
             if phase_correct and ("phase" in self.source):
-                self.phase += self.source["phase"]
+                phase_out += self.source["phase"]
                 zero_phase = False
 
-            # Pass the data to self.display.
+            # Pass the data to the display.
             if zero_phase:
                 # If None was passed and phase_correct is False, then use a faster method.
-                self.display.fill(0)
+                display_out.fill(0)
             else:
                 # Turn the floats in phase space to integer data for the SLM.
-                self.display = self._phase2gray(self.phase, out=self.display)
+                self._phase2gray(phase_out, out=display_out)
 
-        # Write!
-        self._write_hw(self.display)
+        return display_out
 
-        # Optional delay.
-        if settle:
-            time.sleep(self.settle_time_s)
+    def _format_display_device(self, phase, phase_correct, out):
+        """
+        :mod:`cupy` counterpart of :meth:`_format_display()` for floating point phase.
+        Phase correction and :meth:`_phase2gray()` are done on the GPU with a cached
+        device copy of :attr:`source` ``["phase"]``. Only the integer result is
+        downloaded, through pinned memory, into the display buffer of ``out``.
+        The phase buffer of ``out`` is filled with ``nan``, as the phase is not downloaded.
+        """
+        (phase_out, display_out) = out
+
+        # Allocate device and pinned buffers once.
+        if self._device_buffers is None:
+            self._device_buffers = {
+                "phase": cp.zeros(self.shape, dtype=self.phase.dtype),
+                "display": cp.zeros(self.shape, dtype=self.display.dtype),
+                "pinned": cp_zeros_pinned(self.shape, dtype=self.display.dtype),
+                "source": None,
+                "source_host": None,
+            }
+        buffers = self._device_buffers
 
-        return self.display
+        # Copy the pattern and unpad if necessary.
+        if phase.shape != self.shape:
+            phase = toolbox.unpad(phase, self.shape)
+        buffers["phase"][:] = phase
+
+        # Add phase correction if requested, uploading the correction only when it changes.
+        if phase_correct and ("phase" in self.source):
+            if buffers["source_host"] is not self.source["phase"]:
+                buffers["source"] = cp.asarray(self.source["phase"], dtype=self.phase.dtype)
+                buffers["source_host"] = self.source["phase"]
+            buffers["phase"] += buffers["source"]
+
+        # Convert on the device, then download only the integer data.
+        self._phase2gray(buffers["phase"], out=buffers["display"])
+        buffers["display"].get(out=buffers["pinned"])
+        np.copyto(display_out, buffers["pinned"])
+
+        phase_out.fill(np.nan)
+
+        return display_out
 
     def _phase2gray(self, phase, out=None):
         r"""
@@ -521,9 +880,10 @@ class SLM:
 
         Parameters
         ----------
-        phase : numpy.ndarray
-            Array of phases in radians.
-        out : numpy.ndarray
+        phase : numpy.ndarray OR cupy.ndarray
+            Array of phases in radians. If a :mod:`cupy` array, the conversion is done on
+            the GPU and ``out`` must also be a :mod:`cupy` array.
+        out : numpy.ndarray OR cupy.ndarray
             Array to store integer values scaled to SLM voltage, i.e. for in-place
             operations.
             If ``None``, an appropriate array will be allocated.
@@ -532,23 +892,25 @@ class SLM:
         -------
         out
         """
+        xp = cp.get_array_module(phase) if cp != np else np
+
         if out is None:
-            out = np.zeros(self.shape, dtype=self.display.dtype)
+            out = xp.zeros(self.shape, dtype=self.display.dtype)
 
-        if self.phase_scaling == 1:
+        if self.phase_scaling == 1 and self.phase_curve is None:
             # Prepare the 2pi -> integer conversion factor and convert.
             factor = -(self.bitresolution / 2 / np.pi)
             phase *= factor
 
             # There is some randomness involved in casting positive floats to integers.
             # Avoid this by going all negative.
-            maximum = np.amax(phase)
+            maximum = float(xp.amax(phase))
             if maximum >= 0:
                 toshift = self.bitresolution * 2 * np.ceil(maximum / self.bitresolution)
                 phase -= toshift
 
             # Copy and case the data to the output (usually self.display)
-            np.copyto(out, phase, casting="unsafe")
+            xp.copyto(out, phase, casting="unsafe")
 
             # Restore phase (usually self.phase) as these operations are in-place.
             phase *= 1 / factor
@@ -559,40 +921,312 @@ class SLM:
             # This part (along with the choice of type), implements modulo much faster than np.mod().
             if self.bitresolution != 8 and self.bitresolution != 16:
                 active_bits_mask = int(self.bitresolution - 1)
-                np.bitwise_and(out, active_bits_mask, out=out)
+                xp.bitwise_and(out, active_bits_mask, out=out)
         else:
             # phase_scaling is not included in the scaling.
             factor = -(self.bitresolution * self.phase_scaling / 2 / np.pi)
             phase *= factor
 
             # Only if necessary, modulo the phase to remain within SLM bounds.
-            if np.amin(phase) <= -self.bitresolution or np.amax(phase) > 0:
-                # Minus 1 is to conform with the in-bound case.
-                phase -= 1
-                # np.mod is the slowest step. It could maybe be faster if phase is converted to
-                # an integer beforehand, but there is an amount of risk for overflow.
-                # For instance, a standard double can represent numbers far larger than
-                # even a 64 bit integer. If this optimization is implemented, take care to
-                # generate checks for the conversion to long integer / etc before the final
-                # conversion to dtype of uint8 or uint16.
-                np.mod(phase, self.bitresolution * self.phase_scaling, out=phase)
-                phase += self.bitresolution * (1 - self.phase_scaling)
-
-                # Set values still out of range to zero.
-                if self.phase_scaling > 1:
-                    phase[phase < 0] = self.bitresolution - 1
+            minimum = float(xp.amin(phase))
+            maximum = float(xp.amax(phase))
+            if (
+                self.phase_curve is not None or
+                minimum <= -self.bitresolution or maximum > 0
+            ):
+                # Wrap with the lookup table rather than the (slow) np.mod.
+                self._phase2gray_lut(phase, minimum, maximum, out)
             else:
                 # Go from negative to positive.
                 phase += self.bitresolution - 1
 
-            # Copy and case the data to the output (usually self.display)
-            np.copyto(out, phase, casting="unsafe")
+                # Copy and case the data to the output (usually self.display)
+                xp.copyto(out, phase, casting="unsafe")
+
+                phase -= self.bitresolution - 1
 
-            # Restore phase (though we do not unmodulo)
+            # Restore phase.
             phase *= 1 / factor
 
         return out
 
+    def _get_phase_lut(self, xp=np):
+        """
+        Returns the lookup table used by :meth:`_phase2gray_lut()`, (re)building it if
+        :attr:`phase_scaling`, :attr:`bitresolution`, or :attr:`phase_curve` changed.
+
+        Entry ``i`` of the table is the grayscale level for the wrapped scaled phase
+        ``mod(p - 1, bitresolution * phase_scaling) = bitresolution * phase_scaling * (i + .5) / L``,
+        where ``L`` is the table size and ``p`` is the scaled phase in the
+        ``phase_scaling != 1`` case of :meth:`_phase2gray()`.
+
+        Parameters
+        ----------
+        xp : module
+            :mod:`numpy` or :mod:`cupy`. A device copy of the table is cached for the latter.
+
+        Returns
+        -------
+        numpy.ndarray OR cupy.ndarray
+            Table of size ``L`` (a power of two) and the same dtype as :attr:`display`.
+        """
+        key = (self.phase_scaling, self.bitresolution, self.phase_curve)
+        if (
+            self._phase_lut is not None and
+            self._phase_lut_key[:2] == key[:2] and
+            self._phase_lut_key[2] is key[2]
+        ):
+            if xp is np:
+                return self._phase_lut
+            if self._phase_lut_device is None:
+                self._phase_lut_device = xp.asarray(self._phase_lut)
+            return self._phase_lut_device
+
+        B = self.bitresolution
+        L = max(2**16, 64 * B)
+        scaled = B * self.phase_scaling
+        q = scaled * (np.arange(L) + .5) / L    # Wrapped scaled phase, in [0, scaled).
+
+        if self.phase_curve is None:
+            lut = np.floor(q + B * (1 - self.phase_scaling))
+            lut[lut < 0] = B - 1  # Out of range for phase_scaling > 1.
+        else:
+            curve = np.ravel(np.asarray(self.phase_curve, dtype=float))
+            if curve.size != B:
+                raise ValueError(
+                    "phase_curve must have one entry per grayscale level ({}), not {}."
+                    .format(B, curve.size)
+                )
+
+            # Target phase of each entry: the linear curve evaluated at the linear level.
+            target = 2 * np.pi * ((B - 1) - (q + B * (1 - self.phase_scaling))) / scaled
+
+            # Nearest measured phase, modulo 2pi. Chunked to bound memory.
+            lut = np.empty(L)
+            chunk = max(1, 2**24 // B)
+            for i in range(0, L, chunk):
+                distance = np.angle(np.exp(1j * (curve[np.newaxis, :] - target[i:i+chunk, np.newaxis])))
+                lut[i:i+chunk] = np.argmin(np.abs(distance), axis=1)
+
+        self._phase_lut = np.clip(lut, 0, B - 1).astype(self.display.dtype)
+        self._phase_lut_key = key
+        self._phase_lut_device = None
+
+        return self._get_phase_lut(xp)
+
+    def _phase2gray_lut(self, phase, minimum, maximum, out):
+        """
+        Helper function for :meth:`_phase2gray()` which wraps the scaled ``phase``
+        (units of grayscale levels, negated) by quantizing it to a fixed-point integer
+        index into a lookup table (see :meth:`_get_phase_lut()`).
+        ``phase`` is restored after use, except for floating point error.
+
+        Parameters
+        ----------
+        phase : numpy.ndarray OR cupy.ndarray
+            Scaled phase, modified in-place then restored.
+        minimum, maximum : float
+            Extrema of ``phase``.
+        out : numpy.ndarray OR cupy.ndarray
+            Array to store the grayscale levels.
+        """
+        xp = cp.get_array_module(phase) if cp != np else np
+        lut = self._get_phase_lut(xp)
+        L = lut.size
+        factor = L / (self.bitresolution * self.phase_scaling)
+
+        # Convert to table units, shifting by a multiple of L such that all indices are
+        # nonnegative. Then, casting to integer floors, and L - 1 masks the modulo.
+        shift = L * np.ceil(max(0, -(minimum - 1) * factor) / L) - factor
+        top = (maximum - 1) * factor + shift + factor
+
+        if top >= 2**62:
+            # Avoid integer overflow by wrapping with floats. This is slow, but
+            # such phases are too large to be meaningful anyway.
+            xp.mod(phase - 1, self.bitresolution * self.phase_scaling, out=phase)
+            phase += 1
+            shift = -factor
+            top = L
+
+        dtype = np.int32 if top < 2**31 else np.int64
+        key = (xp.__name__, np.dtype(dtype).str)
+        if not key in self._phase_lut_index:
+            self._phase_lut_index[key] = xp.empty(self.shape, dtype=dtype)
+        index = self._phase_lut_index[key]
+        if index.shape != phase.shape:
+            index = xp.empty(phase.shape, dtype=dtype)
+
+        phase *= factor
+        phase += shift
+        xp.copyto(index, phase, casting="unsafe")
+        phase -= shift
+        phase *= 1 / factor
+
+        xp.bitwise_and(index, L - 1, out=index)
+        xp.take(lut, index, out=out)
+
+    # Playlist methods
+
+    def preload(self, patterns, phase_correct=True, file_path=None):
+        """
+        Converts a sequence of patterns to :attr:`display` data once and stores the
+        result in :attr:`playlist`, such that :meth:`show()` only needs to copy the
+        stored buffer to the SLM. This is useful for sequences which are cycled
+        repeatedly (e.g. calibration sweeps or tweezer movies), where :meth:`write()`
+        would otherwise add :attr:`source` ``["phase"]`` and convert to integers every frame.
+
+        Important
+        ~~~~~~~~~
+        The stored buffers include the :attr:`source` ``["phase"]`` present at the time of
+        preloading (if ``phase_correct``). Preload again if the calibration changes.
+
+        Parameters
+        ----------
+        patterns : array_like OR list of array_like OR str
+            Phase (or integer) patterns with the conventions of :meth:`write()`, either
+            as a list or as an array of shape ``(N, height, width)``.
+            If a ``str``, the path of a ``.npy`` file previously written by
+            :meth:`preload()` with ``file_path``, which is memory-mapped directly
+            (no conversion is done).
+        phase_correct : bool
+            Whether or not to add :attr:`source` ``["phase"]`` to each pattern.
+        file_path : str OR None
+            If not ``None``, the converted buffers are written to a memory-mapped ``.npy``
+            file at this path rather than held in memory. This allows sequences
+            larger than memory, and reuse between sessions by passing the path as ``patterns``.
+
+        Returns
+        -------
+        numpy.ndarray OR numpy.memmap
+            :attr:`playlist`.
+        """
+        if isinstance(patterns, str):
+            playlist = np.load(patterns, mmap_mode="r")
+
+            if playlist.ndim != 3 or playlist.shape[1:] != self.shape:
+                raise ValueError(
+                    "Expected a stack of patterns of shape (N, {}, {}), not {}."
+                    .format(*self.shape, playlist.shape)
+                )
+            if playlist.dtype != self.display.dtype:
+                raise TypeError(
+                    "Unexpected integer type {}. Expected {}.".format(
+                        playlist.dtype, self.display.dtype
+                    )
+                )
+
+            self.playlist = playlist
+            return self.playlist
+
+        N = len(patterns)
+        shape = (N,) + tuple(self.shape)
+
+        if file_path is None:
+            playlist = np.empty(shape, dtype=self.display.dtype)
+        else:
+            playlist = np.lib.format.open_memmap(
+                file_path, mode="w+", dtype=self.display.dtype, shape=shape
+            )
+
+        # Convert using the write() machinery, without changing the current state.
+        phase = np.zeros_like(self.phase)
+
+        for i in range(N):
+            self._format_display(patterns[i], phase_correct, out=(phase, playlist[i]))
+
+        if file_path is not None:
+            playlist.flush()
+
+        self.playlist = playlist
+        return self.playlist
+
+    def show(self, index, settle=False):
+        """
+        Sends the ``index`` th preconverted pattern in :attr:`playlist` to the SLM.
+        The only per-frame cost is copying the buffer to :attr:`display`.
+
+        Note
+        ~~~~
+        :attr:`phase` is not updated, as the phase of preloaded patterns is not stored.
+
+        Parameters
+        ----------
+        index : int
+            Index of the pattern in :attr:`playlist`.
+        settle : bool
+            Whether to sleep for :attr:`settle_time_s`.
+
+        Returns
+        -------
+        numpy.ndarray
+           :attr:`display`, the integer data sent to the SLM.
+        """
+        if self.playlist is None:
+            raise RuntimeError("No patterns are preloaded. Call preload() first.")
+
+        np.copyto(self.display, self.playlist[index])
+        self._write_hw(self.display)
+        self.display_time = time.perf_counter()
+
+        # Optional delay.
+        if settle:
+            time.sleep(self.settle_time_s)
+
+        return self.display
+
+    def play(self, indices=None, fps=None, repeat=1, callback=None):
+        """
+        Shows a sequence of preloaded patterns (see :meth:`show()`) at a target frame rate.
+
+        Frames are scheduled against absolute deadlines, such that a slow frame does not
+        delay the following frames. If a frame cannot be shown by its deadline, it is
+        still shown (frames are never skipped).
+
+        Parameters
+        ----------
+        indices : array_like of int OR None
+            Order of indices into :attr:`playlist` to show.
+            If ``None``, shows every pattern in order.
+        fps : float OR None
+            Target frame rate. If ``None``, shows frames as fast as possible.
+        repeat : int
+            Number of times to cycle through ``indices``.
+        callback : callable OR None
+            Called as ``callback(index)`` after each frame is shown, e.g. to trigger a
+            camera. If ``callback`` returns ``True``, then playback stops.
+
+        Returns
+        -------
+        numpy.ndarray
+            :attr:`display_time` of each frame, i.e. the :meth:`time.perf_counter()`
+            timestamps at which each frame finished writing to the SLM.
+        """
+        if self.playlist is None:
+            raise RuntimeError("No patterns are preloaded. Call preload() first.")
+
+        if indices is None:
+            indices = np.arange(len(self.playlist))
+        indices = np.ravel(indices).astype(int)
+
+        period = 0 if fps is None else 1 / float(fps)
+        timestamps = []
+        t_start = time.perf_counter()
+
+        for frame, index in enumerate(np.tile(indices, int(repeat))):
+            # Wait until this frame's deadline.
+            delay = t_start + frame * period - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            self.show(index)
+            timestamps.append(self.display_time)
+
+            if callback is not None:
+                if callback(index):
+                    break
+
+        return np.array(timestamps)
+
     def write_phase(self, path=".", name=None):
         """
         Saves :attr:`~slmsuite.hardware.slms.slm.SLM.phase` and
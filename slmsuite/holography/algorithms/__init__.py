@@ -28,11 +28,16 @@ Internally, algorithms is split into several hidden files
 to enhance clarity and reduce file length.
 
 - ``_header.py`` : The common imports for all the files.
+- ``_fft.py`` : Cached FFT engine shared between DFT-based holograms.
+- ``_nufft.py`` : Non-uniform FFT engine for :class:`CompressedSpotHologram`.
 - ``_stats.py`` : Statistics and plotting common to all hologram classes.
 - ``_hologram.py`` : The core file. Contains the actual algorithms (:class:`Hologram`).
 - ``_feedback.py`` : Infrastructure for image feedback (:class:`FeedbackHologram`).
 - ``_spots.py`` : Infrastructure for spot-specific holography
   (:class:`SpotHologram`, :class:`CompressedSpotHologram`).
+- ``_multiplane.py`` : Meta-optimization of several holograms into one phase (:class:`MultiplaneHologram`).
+- ``_batch.py`` : Vectorized optimization of many independent holograms (:class:`HologramBatch`).
+- ``_pool.py`` : Process pool for optimizing many holograms on the CPU (:class:`HologramPool`).
 """
 from slmsuite.holography.algorithms._header import *
 
@@ -41,6 +46,8 @@ from slmsuite.holography.algorithms._feedback import FeedbackHologram as _Feedba
 from slmsuite.holography.algorithms._spots import SpotHologram as _SpotHologram
 from slmsuite.holography.algorithms._spots import CompressedSpotHologram as _CompressedSpotHologram
 from slmsuite.holography.algorithms._multiplane import MultiplaneHologram as _MultiplaneHologram
+from slmsuite.holography.algorithms._batch import HologramBatch as _HologramBatch
+from slmsuite.holography.algorithms._pool import HologramPool as _HologramPool
 
 # Hack to get automodule to put the classes in the correct location.
 class Hologram(_Hologram):
@@ -58,9 +65,17 @@ class CompressedSpotHologram(_CompressedSpotHologram):
 class MultiplaneHologram(_MultiplaneHologram):
     pass
 
+class HologramBatch(_HologramBatch):
+    pass
+
+class HologramPool(_HologramPool):
+    pass
+
 # Hack to get the class and attribute docs to work.
 Hologram.__doc__ = _Hologram.__doc__
 FeedbackHologram.__doc__ = _FeedbackHologram.__doc__
 SpotHologram.__doc__ = _SpotHologram.__doc__
 CompressedSpotHologram.__doc__ = _CompressedSpotHologram.__doc__
-MultiplaneHologram.__doc__ = _MultiplaneHologram.__doc__
\ No newline at end of file
+MultiplaneHologram.__doc__ = _MultiplaneHologram.__doc__
+HologramBatch.__doc__ = _HologramBatch.__doc__
+HologramPool.__doc__ = _HologramPool.__doc__
\ No newline at end of file
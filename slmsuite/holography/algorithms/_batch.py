@@ -0,0 +1,521 @@
+from slmsuite.holography.algorithms._header import *
+from slmsuite.holography.algorithms._fft import _FFTEngine
+
+
+class HologramBatch(object):
+    """
+    Vectorized optimization of many independent DFT-based holograms of the same shape.
+
+    Each child hologram is optimized exactly as :meth:`Hologram.optimize_gs()` would,
+    but the nearfield construction, FFTs, farfield routines, and weighting are evaluated
+    for all children at once over a leading batch axis of size ``B``.
+    This makes use of the batched FFT throughput of :mod:`numpy`/:mod:`cupy`, which
+    is otherwise left unused when holograms are optimized serially.
+
+    Children that converge (see ``tol`` in :meth:`.optimize()`) are written back to their
+    :class:`Hologram` and removed from the batch, such that the remaining iterations
+    only compute for the children that are still active.
+
+    Each child continues from its own state: its :attr:`~Hologram.iter`, its
+    ``"fixed_phase"`` flag and fixed farfield phase, its phase fixing history, and its
+    MRAF ``zero_weights``. Upon write-back, the batch iterations are appended to the
+    child's :attr:`~Hologram.stats` (method, flags, and, where computed, the
+    ``"computational"`` efficiency), such that :meth:`~Hologram.plot_stats()` and later
+    serial optimization see the full history.
+
+    Important
+    ~~~~~~~~~
+    Only ``"GS"`` and ``"WGS-"`` methods with ``"computational"`` feedback are supported.
+    The children must share :attr:`shape`, :attr:`slm_shape`, and ``dtype``.
+    :class:`MultiplaneHologram` and :class:`CompressedSpotHologram` cannot be batched.
+
+    Attributes
+    ----------
+    holograms : list of :class:`Hologram`
+        List of ``B`` child holograms. Results are written into these upon convergence
+        or termination.
+    shape : (int, int)
+        Shared computational shape of the children.
+    slm_shape : (int, int)
+        Shared nearfield shape of the children.
+    flags : dict
+        Flags used for optimization, in the style of :attr:`Hologram.flags`.
+        Flags which are not passed to :meth:`.optimize()` are taken from the first child.
+        These are copied to each child upon completion.
+    iter : int
+        Number of iterations of the current call to :meth:`.optimize()`.
+        Each child's :attr:`~Hologram.iter` is advanced by this amount.
+    active : numpy.ndarray of int
+        Indices of the children which are still being optimized.
+    converged_iter : numpy.ndarray of int
+        Number of iterations each child took to converge, or ``-1`` if it did not converge.
+    stats : dict
+        Contains ``"efficiency"``, a list (one entry per iteration) of arrays of length ``B``
+        with the computational efficiency of each child. Inactive children are ``nan``.
+        Efficiency is only computed when needed for convergence (``tol``), for
+        ``"fix_phase_efficiency"``, or when ``"computational"`` is in the
+        ``"stat_groups"`` flag.
+    """
+
+    def __init__(self, holograms):
+        """
+        Stacks the data of several holograms for batched optimization.
+
+        Parameters
+        ----------
+        holograms : list of :class:`Hologram`
+            List of ``B`` DFT-based holograms to optimize simultaneously.
+        """
+        self.holograms = list(holograms)
+
+        if len(self.holograms) == 0:
+            raise ValueError("HologramBatch requires at least one hologram.")
+
+        h0 = self.holograms[0]
+        for h in self.holograms:
+            if hasattr(h, "holograms") or h.target is None or len(h.target.shape) != 2:
+                raise ValueError(
+                    "HologramBatch only supports DFT-based holograms, not {}.".format(type(h))
+                )
+            if (
+                tuple(h.shape) != tuple(h0.shape) or
+                tuple(h.slm_shape) != tuple(h0.slm_shape) or
+                h.dtype != h0.dtype
+            ):
+                raise ValueError("HologramBatch requires holograms of identical shape and dtype.")
+
+        self.shape = tuple(h0.shape)
+        self.slm_shape = tuple(h0.slm_shape)
+        self.dtype = h0.dtype
+        self.dtype_complex = h0.dtype_complex
+
+        self.flags = {}
+        self.iter = 0
+        self.stats = {"efficiency": []}
+
+    def __len__(self):
+        return len(self.holograms)
+
+    # Stacking helper functions.
+    def _stack(self, attr, indices):
+        """Stack the attribute ``attr`` of the children at ``indices`` along a leading axis."""
+        values = [getattr(self.holograms[i], attr) for i in indices]
+
+        if all(value is None for value in values):
+            return None
+        if all(np.isscalar(value) for value in values) and len(set(values)) == 1:
+            return values[0]    # Uniform scalar amplitude is shared.
+
+        return cp.stack([
+            cp.broadcast_to(cp.array(0 if v is None else v, dtype=self.dtype), self.slm_shape)
+            if attr in ["amp", "propagation_kernel"] else cp.array(v, dtype=self.dtype)
+            for v in values
+        ])
+
+    def _load(self):
+        """Copy the data of all children into the batch arrays."""
+        self.active = np.arange(len(self))
+        self.converged_iter = np.full(len(self), -1)
+
+        self.amp = self._stack("amp", self.active)
+        self.propagation_kernel = self._stack("propagation_kernel", self.active)
+        self.phase = self._stack("phase", self.active)
+        self.target = self._stack("target", self.active)
+        self.weights = self._stack("weights", self.active)
+        cp.nan_to_num(self.weights, copy=False, nan=0)
+
+        B = len(self)
+        self.nearfield = cp.zeros((B,) + self.shape, dtype=self.dtype_complex)
+        self.farfield = None
+        self.amp_ff = None
+        self._efficiency = np.full(B, np.nan)
+
+        # Continue each child from its own iteration and phase fixing state.
+        self._iter_start = np.array([h.iter for h in self.holograms])
+        self.fixed_phase = np.array([bool(h.flags.get("fixed_phase", False)) for h in self.holograms])
+        self._has_phase_ff = np.array([h.phase_ff is not None for h in self.holograms])
+        self._unfixed_streak = np.array([self._count_unfixed(h) for h in self.holograms])
+        self._history = []
+
+        if np.any(self._has_phase_ff):
+            self.phase_ff = cp.stack([
+                cp.zeros(self.shape, dtype=self.dtype) if h.phase_ff is None
+                else cp.array(h.phase_ff, dtype=self.dtype)
+                for h in self.holograms
+            ])
+        else:
+            self.phase_ff = None
+
+        # MRAF: noise regions are attenuated by mraf_factor rather than zeroed.
+        noise_region = cp.isnan(self.target)
+        if bool(cp.any(noise_region)):
+            mraf_factor = self.flags.get("mraf_factor", None)
+            self._noise_region = noise_region
+            self._mraf_noise = noise_region.astype(self.dtype)
+            if mraf_factor is not None:
+                self._mraf_noise *= mraf_factor
+        else:
+            self._noise_region = None
+            self._mraf_noise = None
+
+        # MRAF zero_weights, as in Hologram._mraf_helper_routines(), stored densely.
+        self._zero_region = None
+        self._zero_weights = None
+        if self._noise_region is not None:
+            zero_region = cp.abs(self.target) == 0
+            zero_factor = self.flags.get("zero_factor", 0)
+            for j, h in enumerate(self.holograms):
+                if not bool(cp.any(self._noise_region[j])):
+                    zero_region[j] = False     # MRAF is not enabled for this child.
+                elif not hasattr(h, "zero_weights") and (zero_factor == 0 or not bool(cp.any(zero_region[j]))):
+                    zero_region[j] = False
+
+            if bool(cp.any(zero_region)):
+                self._zero_region = zero_region
+                self._zero_weights = cp.zeros((B,) + self.shape, dtype=self.dtype_complex)
+                for j, h in enumerate(self.holograms):
+                    if hasattr(h, "zero_weights") and bool(cp.any(zero_region[j])):
+                        self._zero_weights[j][zero_region[j]] = cp.array(h.zero_weights)
+
+    @staticmethod
+    def _count_unfixed(hologram):
+        """
+        Number of contiguous most recent iterations of ``hologram`` with an unfixed phase,
+        as used by the ``"fix_phase_iteration"`` rule of :meth:`Hologram._gs_farfield_routines()`.
+        """
+        history = hologram.stats.get("flags", {}).get("fixed_phase", [])
+        count = 0
+        for value in reversed(history):
+            if value:
+                break
+            count += 1
+        return count
+
+    def _compact(self, keep):
+        """Remove the children which are not in the boolean mask ``keep`` from the batch."""
+        self.active = self.active[keep]
+        self.fixed_phase = self.fixed_phase[keep]
+        self._has_phase_ff = self._has_phase_ff[keep]
+        self._unfixed_streak = self._unfixed_streak[keep]
+        self._efficiency = self._efficiency[keep]
+
+        keep = cp.array(keep) if cp != np else keep
+
+        for attr in [
+            "amp", "propagation_kernel", "phase", "target", "weights",
+            "nearfield", "farfield", "amp_ff", "phase_ff", "_noise_region", "_mraf_noise",
+            "_zero_region", "_zero_weights",
+        ]:
+            value = getattr(self, attr)
+            if value is not None and not np.isscalar(value) and value.ndim == 3:
+                setattr(self, attr, value[keep])
+
+    def _retire(self, done):
+        """
+        Write the results of the children in the boolean mask ``done`` back into the
+        child holograms and remove them from the batch.
+        """
+        for j in np.flatnonzero(done):
+            h = self.holograms[self.active[j]]
+
+            cp.copyto(h.phase, self.phase[j])
+            h.weights = self.weights[j].copy()
+            h.farfield = self.farfield[j].copy()
+            h.amp_ff = self.amp_ff[j].copy()
+            h.phase_ff = cp.arctan2(h.farfield.imag, h.farfield.real)
+
+            if self._zero_region is not None and bool(cp.any(self._zero_region[j])):
+                h.zero_weights = self._zero_weights[j][self._zero_region[j]].copy()
+
+            i = self.active[j]
+            self._write_stats(h, i)
+
+            h.flags.update(self.flags)
+            h.flags["fixed_phase"] = bool(self.fixed_phase[j])
+            h.iter = int(self._iter_start[i] + self.iter)
+
+        self._compact(np.logical_not(done))
+
+    def _write_stats(self, hologram, i):
+        """
+        Appends the batch iterations of child ``i`` to its :attr:`~Hologram.stats`, in the
+        layout of :meth:`Hologram._update_stats_dictionary()`.
+        """
+        flags = hologram.flags
+        iteration = hologram.iter
+
+        try:
+            hologram.flags = dict(flags)
+            hologram.flags.update(self.flags)
+            hologram.flags.pop("raw_stats", None)   # The batch does not keep farfields.
+
+            for k, (fixed_phase, efficiency) in enumerate(self._history[:self.iter]):
+                hologram.iter = int(self._iter_start[i] + k)
+                hologram.flags["fixed_phase"] = bool(fixed_phase[i])
+
+                stats = {}
+                if efficiency is not None:
+                    stats["computational"] = {"efficiency": float(efficiency[i])}
+
+                hologram._update_stats_dictionary(stats)
+        finally:
+            hologram.flags = flags
+            hologram.iter = iteration
+
+    # Propagation.
+    def _build_nearfield(self):
+        """Populate the ``(B, H, W)`` nearfield with data from amp and phase."""
+        (i0, i1, i2, i3) = toolbox.unpad(self.shape, self.slm_shape)
+        self.nearfield.fill(0)
+
+        if self.propagation_kernel is None:
+            self.nearfield[:, i0:i1, i2:i3] = self.amp * cp.exp(1j * self.phase)
+        else:
+            self.nearfield[:, i0:i1, i2:i3] = self.amp * cp.exp(1j * (self.phase + self.propagation_kernel))
+
+    def _nearfield2farfield(self):
+        self._build_nearfield()
+        self.farfield = _FFTEngine.get(self.nearfield.shape, self.dtype_complex).fft2(self.nearfield)
+        self.amp_ff = cp.abs(self.farfield, out=self.amp_ff)
+
+    def _farfield2nearfield(self):
+        self.nearfield = _FFTEngine.get(self.farfield.shape, self.dtype_complex).ifft2(self.farfield)
+
+        (i0, i1, i2, i3) = toolbox.unpad(self.shape, self.slm_shape)
+        self.phase = cp.arctan2(
+            self.nearfield.imag[:, i0:i1, i2:i3],
+            self.nearfield.real[:, i0:i1, i2:i3],
+            out=self.phase,
+        )
+        if self.propagation_kernel is not None:
+            self.phase -= self.propagation_kernel
+
+    # Per-child norms and statistics.
+    def _norm(self, matrix):
+        """Batched :meth:`Hologram._norm()` over the last two axes, keeping dimensions."""
+        if cp.iscomplexobj(matrix):
+            matrix = cp.abs(matrix)
+        return cp.sqrt(cp.nansum(cp.square(matrix), axis=(-2, -1), keepdims=True))
+
+    def _update_stats(self, efficiency=True):
+        """
+        Record the phase fixing state and, if ``efficiency``, the computational efficiency
+        (overlap with the target) of each child for the current iteration.
+        """
+        fixed_phase = np.zeros(len(self), dtype=bool)
+        fixed_phase[self.active] = self.fixed_phase
+        self._unfixed_streak = np.where(self.fixed_phase, 0, self._unfixed_streak + 1)
+
+        if not efficiency:
+            self._history.append((fixed_phase, None))
+            return self._efficiency
+
+        overlap = cp.nansum(self.target * self.amp_ff, axis=(-2, -1)) / cp.squeeze(
+            self._norm(self.amp_ff) * self._norm(self.target), axis=(-2, -1)
+        )
+        efficiency = cp.square(overlap)
+        efficiency = efficiency.get() if cp != np else efficiency
+
+        efficiency_full = np.full(len(self), np.nan)
+        efficiency_full[self.active] = efficiency
+        self.stats["efficiency"].append(efficiency_full)
+        self._history.append((fixed_phase, efficiency_full))
+
+        previous = self._efficiency
+        self._efficiency = np.array(efficiency, dtype=float)
+
+        return previous
+
+    # Farfield routines.
+    def _update_weights(self):
+        """
+        Batched version of :meth:`Hologram._update_weights_generic()` with
+        ``"computational"`` feedback, where norms and means are taken per child.
+        """
+        method = self.flags["method"].lower()[4:]
+
+        feedback_corrected = self.amp_ff.astype(self.dtype, copy=True)
+        feedback_corrected *= 1 / self._norm(feedback_corrected)
+
+        if ("wu" in method or "tanh" in method):    # Additive
+            feedback_corrected *= -self.flags["feedback_exponent"]
+            feedback_corrected += self.target
+        else:                                       # Multiplicative
+            cp.divide(feedback_corrected, self.target, out=feedback_corrected)
+
+            feedback_corrected[feedback_corrected == np.inf] = 1
+            feedback_corrected[self.target == 0] = 1
+            cp.nan_to_num(feedback_corrected, copy=False, nan=1)
+
+        if "leonardo" in method or "kim" in method:
+            cp.power(feedback_corrected, -self.flags["feedback_exponent"], out=feedback_corrected)
+        elif "nogrette" in method:
+            feedback_corrected *= -(1 / cp.nanmean(feedback_corrected, axis=(-2, -1), keepdims=True))
+            feedback_corrected += 1
+            feedback_corrected *= -self.flags["feedback_factor"]
+            feedback_corrected += 1
+            cp.reciprocal(feedback_corrected, out=feedback_corrected)
+        elif "wu" in method:
+            feedback_corrected = cp.exp(self.flags["feedback_exponent"] * feedback_corrected)
+        elif "tanh" in method:
+            feedback_corrected = self.flags["feedback_factor"] * cp.tanh(
+                self.flags["feedback_exponent"] * feedback_corrected
+            )
+            feedback_corrected += 1
+        else:
+            raise ValueError(
+                f"Method '{self.flags['method']}' not recognized by HologramBatch.optimize()"
+            )
+
+        feedback_corrected[feedback_corrected == np.inf] = 1
+
+        self.weights *= feedback_corrected
+        cp.nan_to_num(self.weights, copy=False, nan=0.0001)
+        self.weights *= 1 / self._norm(self.weights)
+
+        # Keep the weights zero outside of the signal region (see _gs_farfield_routines).
+        if self._noise_region is not None:
+            self.weights[self._noise_region] = 0
+
+    def _gs_farfield_routines(self):
+        if "WGS" in self.flags["method"]:
+            self._update_weights()
+
+            # Decide whether to fix phase, per child.
+            if "Kim" in self.flags["method"]:
+                was_fixed = self.fixed_phase.copy()
+
+                if self.flags["fix_phase_efficiency"] is not None:
+                    self.fixed_phase |= self._efficiency > self.flags["fix_phase_efficiency"]
+
+                # Fix after enough contiguous unfixed iterations of each child.
+                iteration = self._iter_start[self.active] + self.iter
+                self.fixed_phase |= (
+                    np.logical_not(was_fixed)
+                    & (iteration >= self.flags["fix_phase_iteration"] - 1)
+                    & (self._unfixed_streak >= self.flags["fix_phase_iteration"])
+                )
+
+                # Save the phase of children going from unfixed to fixed.
+                self._has_phase_ff &= was_fixed
+            else:
+                self.fixed_phase[:] = False
+
+        # Update the farfield phase for children which are not fixed (or lack a phase).
+        refresh = np.logical_not(self.fixed_phase & self._has_phase_ff)
+        if self.phase_ff is None or np.all(refresh):
+            self.phase_ff = cp.arctan2(self.farfield.imag, self.farfield.real, out=self.phase_ff)
+        elif np.any(refresh):
+            refresh = cp.array(refresh) if cp != np else refresh
+            self.phase_ff[refresh] = cp.arctan2(
+                self.farfield.imag[refresh], self.farfield.real[refresh]
+            )
+        self._has_phase_ff[:] = True
+
+        # MRAF zero region: accumulate the zero_weights from the current farfield.
+        if self._zero_region is not None:
+            fz = self.farfield[self._zero_region]
+            self._zero_weights[self._zero_region] -= self.flags.get("zero_factor", 1) * cp.abs(fz) * fz
+
+        # Fix amplitude; the weights are zero outside of the signal region.
+        if self._mraf_noise is None:
+            cp.exp(1j * self.phase_ff, out=self.farfield)
+            cp.multiply(self.farfield, self.weights, out=self.farfield)
+        else:
+            noise = self.farfield * self._mraf_noise
+            cp.exp(1j * self.phase_ff, out=self.farfield)
+            cp.multiply(self.farfield, self.weights, out=self.farfield)
+            self.farfield += noise
+
+            if self._zero_region is not None:
+                self.farfield[self._zero_region] = self._zero_weights[self._zero_region]
+
+    # Core optimization function.
+    def optimize(self, method="GS", maxiter=20, verbose=True, callback=None, tol=None, **kwargs):
+        """
+        Optimizes all child holograms simultaneously.
+        See :meth:`Hologram.optimize()` for details on the methods.
+
+        Parameters
+        ----------
+        method : str
+            Optimization method to use. Must be ``"GS"`` or one of the ``"WGS-"`` methods.
+        maxiter : int
+            Maximum number of iterations to optimize before terminating.
+        verbose : bool
+            Whether to display a :mod:`tqdm` progress bar.
+        callback : callable OR None
+            Called with this :class:`HologramBatch` each iteration, after the farfield is
+            computed. If ``callback`` returns ``True``, the optimization exits.
+        tol : float OR None
+            Per-child convergence tolerance. A child is considered converged (and is
+            retired from the batch) once its computational efficiency changes by less
+            than ``tol`` between iterations. If ``None``, all children run for ``maxiter``.
+        **kwargs
+            Passed to :attr:`flags`. See :meth:`Hologram.optimize()`.
+        """
+        # Parse flags.
+        if not method in ALGORITHM_DEFAULTS or not "GS" in method:
+            raise ValueError(f"HologramBatch does not support method '{method}'.")
+
+        self.flags = dict(self.holograms[0].flags)
+        self.flags["method"] = method
+        for flag, value in ALGORITHM_DEFAULTS[method].items():
+            if not flag in self.flags:
+                self.flags[flag] = value
+        self.flags.update(kwargs)
+
+        feedback = self.flags.get("feedback", "computational")
+        if feedback != "computational":
+            raise ValueError(f"HologramBatch only supports 'computational' feedback, not '{feedback}'.")
+
+        # Efficiency is needed for convergence, for fixing phase, or if requested.
+        efficiency = (
+            tol is not None
+            or self.flags.get("fix_phase_efficiency", None) is not None
+            or "computational" in self.flags.get("stat_groups", [])
+        )
+
+        # Load the children and prepare the loop.
+        self.iter = 0
+        self.stats = {"efficiency": []}
+        self._load()
+
+        iterations = range(maxiter)
+        if verbose and maxiter > 1:
+            iterations = tqdm(iterations)
+
+        for _ in iterations:
+            # (A) Nearfield -> Farfield
+            self._nearfield2farfield()
+
+            # (B) Midloop farfield routines.
+            # (B.1) Run step function if present and check termination conditions.
+            if callback is not None:
+                if callback(self):
+                    break
+
+            # (B.2) Update statistics and retire converged children.
+            previous = self._update_stats(efficiency)
+
+            if tol is not None:
+                done = np.abs(self._efficiency - previous) < tol
+                if np.any(done):
+                    self.converged_iter[self.active[done]] = self.iter
+                    self._retire(done)
+
+                    if len(self.active) == 0:
+                        break
+
+            # (B.3) Weighting and amplitude constraints.
+            self._gs_farfield_routines()
+
+            # (C) Farfield -> Nearfield
+            self._farfield2nearfield()
+
+            self.iter += 1
+
+        # Update the final farfield of the remaining children and write back.
+        if len(self.active) > 0:
+            self._nearfield2farfield()
+            self._retire(np.ones(len(self.active), dtype=bool))
@@ -0,0 +1,149 @@
+from slmsuite.holography.algorithms._header import *
+
+
+class _FFTEngine(object):
+    """
+    Cached two-dimensional discrete Fourier transform used by DFT-based holograms.
+
+    Engines are shared between all holograms with the same transform shape, complex
+    :attr:`dtype`, and backend, and should be requested through :meth:`get()`
+    rather than constructed directly.
+    Transforms are done with :mod:`scipy.fft` (multithreaded via ``workers``) or
+    :mod:`cupyx.scipy.fft` (with a cached
+    `plan <https://docs.cupy.dev/en/stable/reference/generated/cupyx.scipy.fft.get_fft_plan.html>`_).
+    Unlike :mod:`numpy.fft`, both support ``overwrite_x``, which lets the transform
+    reuse the memory of the temporary arrays produced by ``fftshift``.
+
+    Attributes
+    ----------
+    shape : tuple of int
+        Shape of the arrays to transform. Transforms act on the last two axes, so any
+        leading axes are treated as a batch.
+    dtype : numpy.dtype
+        Complex datatype of the arrays to transform.
+    xp : module
+        Backend, either :mod:`numpy` or :mod:`cupy`.
+    workers : int
+        Number of threads used by :mod:`scipy.fft`. Defaults to ``-1`` (all cores).
+        Ignored for :mod:`cupy`.
+    """
+    _engines = {}
+    workers_default = -1
+
+    def __init__(self, shape, dtype, xp=cp, workers=None):
+        self.shape = tuple(int(s) for s in shape)
+        self.dtype = np.dtype(dtype)
+        self.xp = xp
+        self.workers = _FFTEngine.workers_default if workers is None else workers
+
+        self._plan = None
+        if xp is np:
+            self._fft = spfft
+        else:
+            self._fft = cpfft
+            try:
+                self._plan = cpfft.get_fft_plan(
+                    cp.empty(self.shape, dtype=self.dtype), axes=(-2, -1), value_type="C2C"
+                )
+            except Exception:   # Fall back to cupy's internal plan cache.
+                self._plan = None
+
+    @staticmethod
+    def get(shape, dtype, xp=cp):
+        """
+        Returns the shared engine for the given ``shape``, ``dtype``, and backend,
+        creating it if necessary.
+
+        Parameters
+        ----------
+        shape : tuple of int
+            Shape of the arrays to transform.
+        dtype : type
+            Complex datatype of the arrays to transform.
+        xp : module
+            Backend, either :mod:`numpy` or :mod:`cupy`. Defaults to :mod:`cupy`.
+
+        Returns
+        -------
+        _FFTEngine
+            The cached engine.
+        """
+        key = (tuple(int(s) for s in shape), np.dtype(dtype).str, xp.__name__)
+
+        if not key in _FFTEngine._engines:
+            _FFTEngine._engines[key] = _FFTEngine(shape, dtype, xp)
+
+        return _FFTEngine._engines[key]
+
+    @staticmethod
+    def clear():
+        """Erases all cached engines (and thus all cached :mod:`cupy` plans)."""
+        _FFTEngine._engines = {}
+
+    def _kwargs(self, x):
+        if self.xp is np:
+            return {"workers": self.workers}
+        elif self._plan is not None and x.shape == self.shape and x.dtype == self.dtype:
+            return {"plan": self._plan}
+        else:
+            return {}
+
+    def fft2(self, x, shift=True, overwrite_x=False):
+        """
+        Forward orthonormal transform over the last two axes.
+
+        Parameters
+        ----------
+        x : numpy.ndarray OR cupy.ndarray
+            Data to transform.
+        shift : bool
+            Whether to ``fftshift`` the input and output, such that the zeroth order is at the
+            center of both the nearfield and the farfield.
+        overwrite_x : bool
+            Whether ``x`` may be destroyed. The shifted copy of ``x`` is always
+            overwritten, so this only has an effect when ``shift=False``.
+
+        Returns
+        -------
+        numpy.ndarray OR cupy.ndarray
+            The transformed data.
+        """
+        if shift:
+            x = self.xp.fft.fftshift(x, axes=(-2, -1))
+            overwrite_x = True
+
+        y = self._fft.fft2(x, axes=(-2, -1), norm="ortho", overwrite_x=overwrite_x, **self._kwargs(x))
+
+        if shift:
+            y = self.xp.fft.fftshift(y, axes=(-2, -1))
+
+        return y
+
+    def ifft2(self, x, shift=True, overwrite_x=False):
+        """
+        Inverse orthonormal transform over the last two axes.
+
+        Parameters
+        ----------
+        x : numpy.ndarray OR cupy.ndarray
+            Data to transform.
+        shift : bool
+            Whether to ``ifftshift`` the input and output. See :meth:`fft2()`.
+        overwrite_x : bool
+            Whether ``x`` may be destroyed. See :meth:`fft2()`.
+
+        Returns
+        -------
+        numpy.ndarray OR cupy.ndarray
+            The transformed data.
+        """
+        if shift:
+            x = self.xp.fft.ifftshift(x, axes=(-2, -1))
+            overwrite_x = True
+
+        y = self._fft.ifft2(x, axes=(-2, -1), norm="ortho", overwrite_x=overwrite_x, **self._kwargs(x))
+
+        if shift:
+            y = self.xp.fft.ifftshift(y, axes=(-2, -1))
+
+        return y
@@ -1,5 +1,6 @@
 from slmsuite.holography.algorithms._header import *
 from slmsuite.holography.algorithms._stats import _HologramStats
+from slmsuite.holography.algorithms._fft import _FFTEngine
 
 
 class Hologram(_HologramStats):
@@ -152,6 +153,23 @@ class Hologram(_HologramStats):
             iteration. Note that this can be a good amount of data.
          - ``"blur_ij"`` : ``float``
             See :meth:`~slmsuite.holography.algorithms.FeedbackHologram.ijcam_to_knmslm()`.
+         - ``"fft_shift"`` : ``bool``
+            If ``False``, GS-type optimization works in the unshifted DFT basis.
+            See :meth:`~slmsuite.holography.algorithms.Hologram.optimize_gs()`.
+         - ``"profile"`` : ``bool``
+            If ``True``, records the wall time, device synchronization time, and memory
+            allocated by each stage of every iteration of the optimization loop
+            in ``stats["profile"]``. Useful to find whether the transforms, statistics,
+            or (camera) feedback dominate. Adds a device synchronization after every stage.
+         - ``"nufft"`` : ``bool`` OR ``str``
+            For :class:`~slmsuite.holography.algorithms.CompressedSpotHologram` with a
+            tilt-only basis, evaluates the transforms with a non-uniform FFT.
+            If ``True``, uses :mod:`finufft` if installed, otherwise a :mod:`numpy`/:mod:`cupy`
+            implementation. ``"finufft"`` or ``"numpy"`` selects one explicitly.
+         - ``"spot_tracking"`` : ``bool``
+            For spot holograms with ``"experimental_spot"`` feedback, follows drifting
+            spots on the camera with a :class:`~slmsuite.holography.analysis.SpotTracker`
+            (stored as ``spot_tracker``) and integrates around the tracked positions.
          - Other user-defined flags.
 
     stats : dict
@@ -168,6 +186,11 @@ class Hologram(_HologramStats):
             Same format as ``"flags"``, except with another layer of hierarchy corresponding
             to the source (group) of the given stats. This is to differentiate standard deviations
             computed computationally and experimentally.
+         - ``"profile"`` : ``dict of dicts of lists``
+            Only present if the ``"profile"`` flag was set. Maps each stage of the
+            optimization loop (e.g. ``"nearfield2farfield"``, ``"stats"``) to lists of
+            ``"time"``, ``"sync"``, and ``"bytes"`` for each iteration.
+            See :meth:`._profile_stage()`.
 
         See :meth:`._update_stats()` and :meth:`.plot_stats()`.
     """
@@ -394,6 +417,9 @@ class Hologram(_HologramStats):
         # Initialize flags.
         self.flags = kwargs
 
+        # Farfield data is stored in the shifted (centered) DFT basis outside of optimization.
+        self._fft_shift = True
+
         # Initialize target. reset() will handle weights.
         self._set_target(target, reset_weights=False)
 
@@ -832,12 +858,19 @@ class Hologram(_HologramStats):
 
         # This doesn't use self.nearfield, self.farfield because we might be using different shape.
         nearfield = toolbox.pad(self.amp * cp.exp(1j * (self.phase + propagation_kernel)), shape)
-        farfield = cp.fft.fftshift(cp.fft.fft2(cp.fft.fftshift(nearfield), norm="ortho"))
+        farfield = _FFTEngine.get(nearfield.shape, nearfield.dtype).fft2(nearfield)
 
         # Only populate amp and phase if
         if self.amp_ff is not None and shape == self.amp_ff.shape:
-            self.amp_ff = cp.abs(farfield, out=self.amp_ff)
-            self.phase_ff = cp.arctan2(farfield.imag, farfield.real, out=self.phase_ff)
+            if self._fft_shift:
+                self.amp_ff = cp.abs(farfield, out=self.amp_ff)
+                self.phase_ff = cp.arctan2(farfield.imag, farfield.real, out=self.phase_ff)
+            else:   # Called mid-optimization in the unshifted basis.
+                farfield_unshifted = cp.fft.ifftshift(farfield)
+                self.amp_ff = cp.abs(farfield_unshifted, out=self.amp_ff)
+                self.phase_ff = cp.arctan2(
+                    farfield_unshifted.imag, farfield_unshifted.real, out=self.phase_ff
+                )
 
         # Transform as desired. Note that this will likely break normalization.
         if cp != np:
@@ -934,6 +967,38 @@ class Hologram(_HologramStats):
                 analysis.image_vortices_remove(self.phase_ff, self.target > 0)
                 self.plot_farfield(self.phase_ff, title="phase removal after", limits=limits)
 
+    def _get_nearfield_slices(self):
+        """
+        Returns a list of ``(nearfield_slices, slm_slices)`` pairs which map data of shape
+        :attr:`slm_shape` onto :attr:`nearfield`. Outside of the unshifted basis (see
+        :meth:`optimize_gs()`), this is the single centered region of :meth:`toolbox.unpad()`.
+        In the unshifted basis, the region is ``fftshift``-ed and wraps around the edges of
+        :attr:`nearfield`, so up to four pairs are returned.
+        """
+        (i0, i1, i2, i3) = toolbox.unpad(self.shape, self.slm_shape)
+
+        if self._fft_shift:
+            return [((slice(i0, i1), slice(i2, i3)), (slice(None), slice(None)))]
+
+        axes = []
+        for (start, stop, n) in [(i0, i1, self.shape[0]), (i2, i3, self.shape[1])]:
+            length = stop - start
+            start = (start + n // 2) % n    # fftshift moves index c to (c + n // 2) % n.
+
+            if start + length <= n:
+                axes.append([(slice(start, start + length), slice(0, length))])
+            else:
+                axes.append([
+                    (slice(start, n), slice(0, n - start)),
+                    (slice(0, start + length - n), slice(n - start, length)),
+                ])
+
+        return [
+            ((dst0, dst1), (src0, src1))
+            for (dst0, src0) in axes[0]
+            for (dst1, src1) in axes[1]
+        ]
+
     def _build_nearfield(self, phase_torch=None):
         """Populate nearfield with data from amp and phase."""
         (i0, i1, i2, i3) = toolbox.unpad(self.shape, self.slm_shape)
@@ -941,9 +1006,12 @@ class Hologram(_HologramStats):
 
         if phase_torch is None:
             if self.propagation_kernel is None:
-                self.nearfield[i0:i1, i2:i3] = self.amp * cp.exp(1j * self.phase)
+                field = self.amp * cp.exp(1j * self.phase)
             else:
-                self.nearfield[i0:i1, i2:i3] = self.amp * cp.exp(1j * (self.phase + self.propagation_kernel))
+                field = self.amp * cp.exp(1j * (self.phase + self.propagation_kernel))
+
+            for (dst, src) in self._get_nearfield_slices():
+                self.nearfield[dst] = field[src]
 
             return self.nearfield
         else:
@@ -960,15 +1028,28 @@ class Hologram(_HologramStats):
 
             return nearfield_torch
 
+    def _get_nearfield_slm(self):
+        """Returns the (centered) region of :attr:`nearfield` with shape :attr:`slm_shape`."""
+        slices = self._get_nearfield_slices()
+
+        if len(slices) == 1:
+            (dst, _) = slices[0]
+            return self.nearfield[dst]
+
+        out = cp.empty(self.slm_shape, dtype=self.nearfield.dtype)
+        for (dst, src) in slices:
+            out[src] = self.nearfield[dst]
+
+        return out
+
     def _nearfield_extract(self):
         """Populate phase with data from nearfield."""
-        (i0, i1, i2, i3) = toolbox.unpad(self.shape, self.slm_shape)
-
-        self.phase = cp.arctan2(
-            self.nearfield.imag[i0:i1, i2:i3],
-            self.nearfield.real[i0:i1, i2:i3],
-            out=self.phase,
-        )
+        for (dst, src) in self._get_nearfield_slices():
+            cp.arctan2(
+                self.nearfield.imag[dst],
+                self.nearfield.real[dst],
+                out=self.phase[src],
+            )
         if self.propagation_kernel is not None:
             self.phase -= self.propagation_kernel
 
@@ -982,7 +1063,9 @@ class Hologram(_HologramStats):
         nearfield = self._build_nearfield(phase_torch)
 
         if phase_torch is None:
-            self.farfield = cp.fft.fftshift(cp.fft.fft2(cp.fft.fftshift(nearfield), norm="ortho"))
+            self.farfield = _FFTEngine.get(self.shape, self.dtype_complex).fft2(
+                nearfield, shift=self._fft_shift
+            )
         else:
             farfield_torch = self._get_torch_tensor_from_cupy(self.farfield)
             farfield_torch = torch.fft.fftshift(torch.fft.fft2(torch.fft.fftshift(nearfield), norm="ortho"))
@@ -1002,7 +1085,9 @@ class Hologram(_HologramStats):
             Whether to extract data into the :attr:`phase` variable. This is not used
             for :class:`MultiplaneHologram`.
         """
-        self.nearfield = cp.fft.ifftshift(cp.fft.ifft2(cp.fft.ifftshift(self.farfield), norm="ortho"))
+        self.nearfield = _FFTEngine.get(self.shape, self.dtype_complex).ifft2(
+            self.farfield, shift=self._fft_shift
+        )
 
         if extract:
             self._nearfield_extract()
@@ -1226,6 +1311,8 @@ class Hologram(_HologramStats):
         moving these statistics to the CPU. This is especially apparent in the case
         of fully-computational holography, where this effect can slow what is otherwise
         a fully-GPU-contained loop by an order magnitude.
+        Pass ``profile=True`` to measure the cost of each stage of the loop
+        (see the ``"profile"`` flag).
 
         Tip
         ~~~
@@ -1374,15 +1461,22 @@ class Hologram(_HologramStats):
 
         Note
         ~~~~
-        Default FFTs are **not** in-place in this algorithm. In both non-:mod:`cupy` and
-        :mod:`cupy` implementations, :mod:`numpy.fft` does not support in-place
-        operations.  However, :mod:`scipy.fft` does in both. In the future, we may move to the scipy
-        implementation. However, neither :mod:`numpy` or :mod:`scipy` ``fftshift`` support
-        in-place movement (for obvious reasons). For even faster computation, algorithms should
-        consider **not shifting** the FFT result, and instead shifting measurement data / etc to
-        this unshifted basis. We might also implement `get_fft_plan
-        <https://docs.cupy.dev/en/stable/reference/generated/cupyx.scipy.fftpack.get_fft_plan.html>`_
-        for even faster FFTing. However, in practice, speed is limited by other
+        FFTs are computed with :mod:`scipy.fft` (multithreaded) or :mod:`cupyx.scipy.fft`
+        (with a cached `get_fft_plan
+        <https://docs.cupy.dev/en/stable/reference/generated/cupyx.scipy.fftpack.get_fft_plan.html>`_),
+        shared between all holograms of the same :attr:`shape` and :attr:`dtype`.
+        The transforms overwrite the temporary shifted arrays in-place. However, neither
+        :mod:`numpy` or :mod:`scipy` ``fftshift`` support
+        in-place movement (for obvious reasons), so each iteration normally costs four
+        full-array copies. Passing ``fft_shift=False`` to :meth:`.optimize()` instead
+        **does not shift** the FFT result: for the duration of the loop, the nearfield is
+        built directly in the shifted basis and :attr:`target`, :attr:`weights`,
+        :attr:`farfield`, :attr:`amp_ff`, :attr:`phase_ff`, and the MRAF masks
+        are moved to the unshifted basis. Everything is shifted back when the loop
+        exits. ``callback`` functions see farfield data in the unshifted basis, and stats
+        other than bare ``"computational"`` stats are computed after temporarily shifting back.
+        This mode only supports ``"computational"`` feedback.
+        However, in practice, speed is often limited by other
         peripherals (especially feedback and stats) rather than FFT speed or memory.
 
         Parameters
@@ -1392,39 +1486,106 @@ class Hologram(_HologramStats):
         callback : callable OR None
             See :meth:`.optimize()`.
         """
+        # Move to the unshifted basis if desired. Stats which depend on the layout of
+        # the farfield must temporarily shift back.
+        fft_shift = self.flags.get("fft_shift", True)
+        if not fft_shift:
+            self._set_fft_shift(False)
+        stats_need_shift = not fft_shift and (
+            self.flags.get("raw_stats", False) or
+            any(group != "computational" for group in self.flags["stat_groups"])
+        )
+
         # Precompute MRAF helper variables.
         # In particular, this stores the binary masks for the signal, noise, and null regions.
         mraf_variables = self._mraf_helper_routines()
 
-        for _ in iterations:
-            # (A) Nearfield -> Farfield
-            # This uses the self.phase and self.amplitude attributes to populate the
-            # self.farfield attribute. Also cleans per-loop variables such as self.img_ij
-            self._nearfield2farfield()
+        # Each stage is timed if the "profile" flag is set.
+        self._profile_begin()
 
-            # (B) Midloop Farfield Routines
-            # (B.1) Run step function if present and check termination conditions.
-            if callback is not None:
-                if callback(self):
-                    break
+        try:
+            for _ in iterations:
+                # (A) Nearfield -> Farfield
+                # This uses the self.phase and self.amplitude attributes to populate the
+                # self.farfield attribute. Also cleans per-loop variables such as self.img_ij
+                with self._profile_stage("nearfield2farfield"):
+                    self._nearfield2farfield()
+
+                # (B) Midloop Farfield Routines
+                # (B.1) Run step function if present and check termination conditions.
+                if callback is not None:
+                    with self._profile_stage("callback"):
+                        if callback(self):
+                            break
+
+                # (B.2) Update statistics based on the current farfield and potentially current
+                # experimental results.
+                with self._profile_stage("stats"):
+                    if stats_need_shift:
+                        self._set_fft_shift(True)
+                        self._update_stats(self.flags["stat_groups"])
+                        self._set_fft_shift(False)
+                    else:
+                        self._update_stats(self.flags["stat_groups"])
+
+                # (B.3) Evaluate method-specific routines, stats, etc. This includes camera feedback/etc.
+                # If you want to add new functionality to GS, do so here to keep the main loop clean.
+                with self._profile_stage("farfield_routines"):
+                    self._gs_farfield_routines(mraf_variables)
+
+                # (C) Farfield -> Nearfield
+                # This populates the self.nearfield and self.phase attributes.
+                with self._profile_stage("farfield2nearfield"):
+                    self._farfield2nearfield()
+
+                # Increment iteration.
+                self.iter += 1
+        finally:
+            self._profile_end()
+
+            # Return to the shifted basis.
+            if not fft_shift:
+                self._set_fft_shift(True)
 
-            # (B.2) Update statistics based on the current farfield and potentially current
-            # experimental results.
-            self._update_stats(self.flags["stat_groups"])
+        # Update the final farfield using phase and amp.
+        self._populate_results()
 
-            # (B.3) Evaluate method-specific routines, stats, etc. This includes camera feedback/etc.
-            # If you want to add new functionality to GS, do so here to keep the main loop clean.
-            self._gs_farfield_routines(mraf_variables)
+    def _set_fft_shift(self, fft_shift=True):
+        """
+        Moves the farfield data between the shifted (centered, ``fft_shift=True``) and
+        unshifted (``fft_shift=False``) DFT bases. See :meth:`optimize_gs()`.
+        :attr:`target` and :attr:`weights` are modified in-place.
 
-            # (C) Farfield -> Nearfield
-            # This populates the self.nearfield and self.phase attributes.
-            self._farfield2nearfield()
+        Parameters
+        ----------
+        fft_shift : bool
+            The basis to move to.
+        """
+        if fft_shift == self._fft_shift:
+            return
 
-            # Increment iteration.
-            self.iter += 1
+        if not fft_shift and self.flags.get("feedback", "computational") != "computational":
+            raise ValueError(
+                "fft_shift=False is only supported for 'computational' feedback, "
+                "not '{}'.".format(self.flags["feedback"])
+            )
 
-        # Update the final farfield using phase and amp.
-        self._populate_results()
+        shift = cp.fft.fftshift if fft_shift else cp.fft.ifftshift
+
+        # The MRAF zero_weights are ordered according to the zero region of the target.
+        zero_weights = getattr(self, "zero_weights", None)
+        if zero_weights is not None and zero_weights.size > 0:
+            zero_region = cp.abs(self.target) == 0
+            zero_full = cp.zeros(self.shape, dtype=zero_weights.dtype)
+            zero_full[zero_region] = zero_weights
+            zero_weights[:] = shift(zero_full)[shift(zero_region)]
+
+        for attr in ["target", "weights", "farfield", "amp_ff", "phase_ff"]:
+            value = getattr(self, attr, None)
+            if value is not None and tuple(value.shape) == tuple(self.shape):
+                value[:] = shift(value)
+
+        self._fft_shift = fft_shift
 
     def _mraf_helper_routines(self):
         # MRAF helper variables
@@ -1635,33 +1796,44 @@ class Hologram(_HologramStats):
 
         self.optimizer = optim_class([phase_torch], **self.flags["optimizer_kwargs"])
 
-        for _ in iterations:
-            # (A) Step the Conjugate Gradient Optimization
-            # (A.1) Reset the gradients for this step.
-            self.optimizer.zero_grad()
-
-            # (A.1) Compute the loss for this phase pattern.
-            # This computes the farfield (and potentially experimental results)
-            # and then passes these values to the current ``loss`` function.
-            result = self._cg_loss(phase_torch)
+        # Each stage is timed if the "profile" flag is set.
+        self._profile_begin()
 
-            # (A.2) Compute the gradients of the phase pattern with respect to loss.
-            result.backward(retain_graph=True)
-
-            # (A.3) Step the optimization of phase_torch according to the gradients calculated.
-            self.optimizer.step()
-
-            # (B) Midloop Routines
-            # (B.1) Run step function if present and check termination conditions.
-            if callback is not None:
-                if callback(self):
-                    break
-
-            # (B.2) Update statistics.
-            self._update_stats(self.flags["stat_groups"])
-
-            # Increment iteration.
-            self.iter += 1
+        try:
+            for _ in iterations:
+                # (A) Step the Conjugate Gradient Optimization
+                # (A.1) Reset the gradients for this step.
+                self.optimizer.zero_grad()
+
+                # (A.1) Compute the loss for this phase pattern.
+                # This computes the farfield (and potentially experimental results)
+                # and then passes these values to the current ``loss`` function.
+                with self._profile_stage("loss"):
+                    result = self._cg_loss(phase_torch)
+
+                # (A.2) Compute the gradients of the phase pattern with respect to loss.
+                with self._profile_stage("backward"):
+                    result.backward(retain_graph=True)
+
+                # (A.3) Step the optimization of phase_torch according to the gradients calculated.
+                with self._profile_stage("step"):
+                    self.optimizer.step()
+
+                # (B) Midloop Routines
+                # (B.1) Run step function if present and check termination conditions.
+                if callback is not None:
+                    with self._profile_stage("callback"):
+                        if callback(self):
+                            break
+
+                # (B.2) Update statistics.
+                with self._profile_stage("stats"):
+                    self._update_stats(self.flags["stat_groups"])
+
+                # Increment iteration.
+                self.iter += 1
+        finally:
+            self._profile_end()
 
         # Update the final farfield using phase and amp.
         self._populate_results()
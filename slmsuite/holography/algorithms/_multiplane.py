@@ -265,14 +265,12 @@ class MultiplaneHologram(Hologram):
         for h, w in zip(self.holograms, self.weights):
             h._farfield2nearfield(extract=False)    # Avoid individually extracting phase.
 
-            (i0, i1, i2, i3) = toolbox.unpad(h.shape, h.slm_shape)
-
             # Add the complex individual nearfields to our meta nearfield.
             if h.propagation_kernel is None:
-                self.nearfield += w * h.nearfield[i0:i1, i2:i3]
+                self.nearfield += w * h._get_nearfield_slm()
             else:
                 # Remove the propagation kernel if necessary.
-                self.nearfield += w * h.nearfield[i0:i1, i2:i3] * cp.exp(-1j * h.propagation_kernel)
+                self.nearfield += w * h._get_nearfield_slm() * cp.exp(-1j * h.propagation_kernel)
             h.iter = self.iter
 
         # Get meta self phase.
@@ -281,6 +279,10 @@ class MultiplaneHologram(Hologram):
     def _mraf_helper_routines(self):
         return [h._mraf_helper_routines() for h in self.holograms]
 
+    def _set_fft_shift(self, fft_shift=True):
+        """The meta nearfield is not transformed; only the children change basis."""
+        for h in self.holograms: h._set_fft_shift(fft_shift)
+
     def _gs_farfield_routines(self, mraf_variables):
         for h, mraf in zip(self.holograms, mraf_variables):
             h._gs_farfield_routines(mraf)
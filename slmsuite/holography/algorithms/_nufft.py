@@ -0,0 +1,241 @@
+from slmsuite.holography.algorithms._header import *
+from slmsuite.holography.algorithms._fft import _FFTEngine
+
+try:
+    import finufft
+except ImportError:
+    finufft = None
+
+
+class _NUFFTEngine(object):
+    r"""
+    Two-dimensional non-uniform discrete Fourier transforms between ``N`` points
+    :math:`(x_n, y_n)` and a uniform grid of modes with shape ``(H, W)``.
+
+    -   Type 1 (non-uniform to uniform):
+        :math:`f_{pq} = \sum_n c_n e^{i(x_n (p - W//2) + y_n (q - H//2))}`.
+    -   Type 2 (uniform to non-uniform):
+        :math:`c_n = \sum_{pq} f_{pq} e^{i(x_n (p - W//2) + y_n (q - H//2))}`.
+
+    Transforms are done with `finufft <https://finufft.readthedocs.io>`_ if installed
+    (CPU only). Otherwise, a :mod:`numpy`/:mod:`cupy` implementation of
+    `Gaussian gridding <https://doi.org/10.1137/S003614450343200X>`_ is used:
+    points are spread onto a twice-oversampled grid, transformed with an FFT,
+    and deconvolved. This costs :math:`O(HW \log HW + N)` rather than :math:`O(NHW)`.
+
+    Attributes
+    ----------
+    shape : (int, int)
+        Shape ``(H, W)`` of the uniform grid.
+    eps : float
+        Requested relative precision.
+    backend : str
+        Either ``"finufft"`` or ``"numpy"`` (which also handles :mod:`cupy` arrays).
+    dtype : type
+        Complex datatype of the oversampled grid for the ``"numpy"`` backend.
+        Single precision suffices for ``eps >= 1e-6``.
+    """
+    _engines = {}
+    oversampling = 2
+
+    def __init__(self, shape, eps=1e-6, backend=None):
+        self.shape = tuple(int(s) for s in shape)
+        self.eps = float(eps)
+
+        if backend is None:
+            backend = "finufft" if (finufft is not None and cp == np) else "numpy"
+        if backend == "finufft" and finufft is None:
+            raise ValueError("finufft is not installed.")
+        if not backend in ["finufft", "numpy"]:
+            raise ValueError("NUFFT backend '{}' not recognized.".format(backend))
+        self.backend = backend
+
+        # Gaussian gridding parameters: the spreading half-width ``spread`` and the
+        # Gaussian variance ``tau`` for each axis (Greengard and Lee, 2004).
+        R = _NUFFTEngine.oversampling
+        self.spread = int(np.ceil(-np.log(self.eps) / (np.pi * (R - 1) / (R - .5)))) + 1
+        self.fine_shape = tuple(R * s for s in self.shape)
+        self.tau = tuple(np.pi * self.spread / (s * s * R * (R - .5)) for s in self.shape)
+        self.dtype = np.complex64 if self.eps >= 1e-6 else np.complex128
+
+        # Deconvolution factors, which also convert the orthonormal inverse FFT to 1/M.
+        self._deconvolve = {}
+
+    @staticmethod
+    def get(shape, eps=1e-6, backend=None):
+        """
+        Returns the shared engine for the given ``shape``, ``eps``, and ``backend``,
+        creating it if necessary.
+
+        Parameters
+        ----------
+        shape : (int, int)
+            Shape ``(H, W)`` of the uniform grid.
+        eps : float
+            Requested relative precision.
+        backend : str OR None
+            ``"finufft"`` or ``"numpy"``. If ``None``, uses :mod:`finufft` if available.
+
+        Returns
+        -------
+        _NUFFTEngine
+            The cached engine.
+        """
+        key = (tuple(int(s) for s in shape), float(eps), backend)
+
+        if not key in _NUFFTEngine._engines:
+            _NUFFTEngine._engines[key] = _NUFFTEngine(shape, eps, backend)
+
+        return _NUFFTEngine._engines[key]
+
+    # Gaussian gridding helper functions.
+    def _modes(self, axis, xp):
+        """Mode indices ``p - M//2`` of the uniform grid along ``axis`` (0 for y, 1 for x)."""
+        M = self.shape[axis]
+        return xp.arange(M) - M // 2
+
+    def _get_deconvolve(self, xp, dtype):
+        """Outer product of the per-axis deconvolution factors, with shape ``(H, W)``."""
+        key = (xp.__name__, np.dtype(dtype).str)
+
+        if not key in self._deconvolve:
+            factors = []
+            for axis in [0, 1]:
+                k = self._modes(axis, xp).astype(np.float64)
+                tau = self.tau[axis]
+                factors.append(np.sqrt(np.pi / tau) * xp.exp(k * k * tau))
+            factors[0] /= np.sqrt(self.fine_shape[0] * self.fine_shape[1])
+            self._deconvolve[key] = (factors[0][:, np.newaxis] * factors[1][np.newaxis, :]).astype(dtype)
+
+        return self._deconvolve[key]
+
+    def _weights(self, points, axis, xp):
+        """
+        Indices into the fine grid and Gaussian weights of the ``2 * spread`` fine grid
+        points nearest to each point, both of shape ``(N, 2 * spread)``.
+        """
+        Mr = self.fine_shape[axis]
+        h = 2 * np.pi / Mr
+
+        points = xp.mod(points.astype(np.float64), 2 * np.pi)
+        nearest = xp.floor(points / h).astype(np.int64)
+        offsets = xp.arange(-self.spread + 1, self.spread + 1)
+
+        index = nearest[:, np.newaxis] + offsets[np.newaxis, :]
+        distance = points[:, np.newaxis] - h * index
+        weights = xp.exp(-distance * distance / (4 * self.tau[axis]))
+
+        return xp.mod(index, Mr), weights
+
+    def _fine_index(self, x, y, xp):
+        """Flattened fine grid indices and Gaussian weights of shape ``(N, S, S)``."""
+        (ix, wx) = self._weights(x, 1, xp)
+        (iy, wy) = self._weights(y, 0, xp)
+
+        index = iy[:, :, np.newaxis] * self.fine_shape[1] + ix[:, np.newaxis, :]
+        weights = wy[:, :, np.newaxis] * wx[:, np.newaxis, :]
+
+        return index, weights
+
+    def _crop(self, xp, fine):
+        """Extracts the modes of the uniform grid from the (unshifted) fine grid."""
+        ky = xp.mod(self._modes(0, xp), self.fine_shape[0])
+        kx = xp.mod(self._modes(1, xp), self.fine_shape[1])
+        return fine[ky[:, np.newaxis], kx[np.newaxis, :]]
+
+    # Transforms.
+    def setpts(self, x, y):
+        """
+        Prepares the non-uniform points for repeated transforms.
+
+        Parameters
+        ----------
+        x, y : numpy.ndarray OR cupy.ndarray
+            Points of shape ``(N,)`` in radians per grid pixel along ``W`` and ``H``.
+
+        Returns
+        -------
+        dict
+            Points (and, for the ``"numpy"`` backend, the spreading indices and weights)
+            to pass to :meth:`type1()` and :meth:`type2()`.
+        """
+        points = {"x": x, "y": y}
+
+        if self.backend == "numpy":
+            xp = cp.get_array_module(x) if cp != np else np
+            (points["index"], points["weights"]) = self._fine_index(x, y, xp)
+        else:   # finufft requires points within [-3 pi, 3 pi].
+            points["x"] = np.mod(np.asarray(x, dtype=np.float64) + np.pi, 2 * np.pi) - np.pi
+            points["y"] = np.mod(np.asarray(y, dtype=np.float64) + np.pi, 2 * np.pi) - np.pi
+
+        return points
+
+    def type1(self, points, c):
+        """
+        Non-uniform to uniform transform.
+
+        Parameters
+        ----------
+        points : dict
+            Points from :meth:`setpts()`.
+        c : numpy.ndarray OR cupy.ndarray
+            Complex strengths of shape ``(N,)``.
+
+        Returns
+        -------
+        numpy.ndarray OR cupy.ndarray
+            Uniform grid of shape ``(H, W)``.
+        """
+        if self.backend == "finufft":
+            return finufft.nufft2d1(
+                points["y"], points["x"], c.astype(np.complex128),
+                n_modes=self.shape, isign=1, eps=self.eps
+            ).astype(c.dtype)
+
+        xp = cp.get_array_module(c) if cp != np else np
+        values = c[:, np.newaxis, np.newaxis] * points["weights"]
+        index = points["index"].ravel()
+
+        size = self.fine_shape[0] * self.fine_shape[1]
+        fine = xp.bincount(index, weights=values.real.ravel(), minlength=size).astype(self.dtype)
+        fine += self.dtype(1j) * xp.bincount(index, weights=values.imag.ravel(), minlength=size)
+
+        fine = _FFTEngine.get(self.fine_shape, self.dtype, xp).ifft2(
+            fine.reshape(self.fine_shape), shift=False, overwrite_x=True
+        )
+
+        return (self._crop(xp, fine) * self._get_deconvolve(xp, self.dtype)).astype(c.dtype)
+
+    def type2(self, points, f):
+        """
+        Uniform to non-uniform transform.
+
+        Parameters
+        ----------
+        points : dict
+            Points from :meth:`setpts()`.
+        f : numpy.ndarray OR cupy.ndarray
+            Uniform grid of shape ``(H, W)``.
+
+        Returns
+        -------
+        numpy.ndarray OR cupy.ndarray
+            Complex values of shape ``(N,)`` at the points.
+        """
+        if self.backend == "finufft":
+            return finufft.nufft2d2(
+                points["y"], points["x"], f.astype(np.complex128), isign=1, eps=self.eps
+            ).astype(f.dtype)
+
+        xp = cp.get_array_module(f) if cp != np else np
+        fine = xp.zeros(self.fine_shape, dtype=self.dtype)
+
+        ky = xp.mod(self._modes(0, xp), self.fine_shape[0])
+        kx = xp.mod(self._modes(1, xp), self.fine_shape[1])
+        fine[ky[:, np.newaxis], kx[np.newaxis, :]] = f * self._get_deconvolve(xp, self.dtype)
+
+        fine = _FFTEngine.get(self.fine_shape, self.dtype, xp).ifft2(
+            fine, shift=False, overwrite_x=True
+        ).ravel()
+
+        return xp.sum(fine[points["index"]] * points["weights"], axis=(1, 2)).astype(f.dtype)
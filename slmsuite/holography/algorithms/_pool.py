@@ -0,0 +1,382 @@
+from slmsuite.holography.algorithms._header import *
+from slmsuite.holography.algorithms._fft import _FFTEngine
+
+import os
+import pickle
+import concurrent.futures
+import multiprocessing
+from multiprocessing import shared_memory
+
+# Attributes which are scratch space for the optimization loop. These are not transferred
+# to the workers; instead they are rebuilt (or regenerated by the loop) on the worker side.
+_POOL_SCRATCH = [
+    "nearfield", "farfield", "amp_ff", "phase_ff", "img_ij", "img_knm",
+    "_cupy_kernel", "_cupy_kernel_store", "_separable_kernel", "_nufft_points",
+]
+
+# Arrays which are written back from the worker to the parent upon completion.
+# The farfield arrays are only outputs, and are allocated empty.
+_POOL_RESULTS = ["phase", "weights", "farfield", "amp_ff", "phase_ff"]
+_POOL_OUTPUTS = ["farfield", "amp_ff", "phase_ff"]
+
+# Byte alignment of each array within the shared memory block.
+_POOL_ALIGN = 64
+
+
+class _SharedArrays(object):
+    """
+    Several :mod:`numpy` arrays packed into a single
+    :class:`~multiprocessing.shared_memory.SharedMemory` block.
+    Only the (small, picklable) :attr:`spec` needs to be sent between processes.
+
+    Attributes
+    ----------
+    shm : multiprocessing.shared_memory.SharedMemory
+        The underlying block.
+    spec : dict
+        Maps each key to a tuple ``(offset, shape, dtype)`` within the block.
+    """
+
+    def __init__(self, layout, name=None):
+        """
+        Creates (``name=None``) or attaches to (``name`` given) a block.
+
+        Parameters
+        ----------
+        layout : dict
+            Maps each key to ``(shape, dtype)`` when creating, or to
+            ``(offset, shape, dtype)`` (a :attr:`spec`) when attaching.
+        name : str OR None
+            Name of the block to attach to.
+        """
+        if name is None:
+            self.spec = {}
+            size = 0
+            for key, (shape, dtype) in layout.items():
+                size = _POOL_ALIGN * int(np.ceil(size / _POOL_ALIGN))
+                self.spec[key] = (size, tuple(shape), np.dtype(dtype).str)
+                size += int(np.prod(shape)) * np.dtype(dtype).itemsize
+            self.shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        else:
+            self.spec = layout
+            self.shm = shared_memory.SharedMemory(name=name)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def view(self, key):
+        """Returns a :mod:`numpy` view of the array ``key`` within the block."""
+        (offset, shape, dtype) = self.spec[key]
+        return np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=offset)
+
+    def put(self, key, value):
+        """Copies ``value`` into the array ``key``."""
+        view = self.view(key)
+        view[...] = value
+        del view
+
+    def get(self, key):
+        """Returns a private copy of the array ``key``."""
+        view = self.view(key)
+        value = view.copy()
+        del view
+        return value
+
+    def close(self, unlink=False):
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+def _pool_initializer(fft_workers):
+    """Limits the threads used by each worker such that workers do not oversubscribe cores."""
+    _FFTEngine.workers_default = fft_workers
+
+
+def _pool_worker(cls, state, name, spec, kwargs):
+    """
+    Rebuilds the hologram in the worker process from its stripped ``state`` and the
+    arrays in shared memory, optimizes, and writes the results back to shared memory.
+    """
+    shared = _SharedArrays(spec, name=name)
+
+    try:
+        # Rebuild the hologram without calling the constructor.
+        hologram = cls.__new__(cls)
+        hologram.__dict__.update(state)
+
+        for key in spec:
+            if isinstance(key, tuple) or key in _POOL_OUTPUTS:
+                continue
+            setattr(hologram, key, shared.get(key))
+
+        for key in {key[0] for key in spec if isinstance(key, tuple)}:
+            n = len([k for k in spec if isinstance(k, tuple) and k[0] == key])
+            setattr(hologram, key, tuple(shared.get((key, i)) for i in range(n)))
+
+        # Rebuild the scratch space.
+        hologram.nearfield = np.zeros(hologram.shape, dtype=hologram.dtype_complex)
+        hologram.farfield = np.zeros(hologram.target.shape, dtype=hologram.dtype_complex)
+
+        hologram.optimize(**kwargs)
+
+        # Write the results back.
+        for key in _POOL_RESULTS:
+            value = getattr(hologram, key, None)
+            if key in spec and value is not None:
+                shared.put(key, value)
+
+        return {
+            "iter": hologram.iter,
+            "flags": hologram.flags,
+            "stats": hologram.stats,
+        }
+    finally:
+        shared.close()
+
+
+class HologramPool(object):
+    """
+    Process pool which distributes the optimization of many holograms across CPU cores.
+
+    When :mod:`cupy` is unavailable, each hologram is optimized with :mod:`numpy`
+    on the CPU, where a single optimization cannot make use of many cores.
+    :class:`HologramPool` instead optimizes independent holograms concurrently in
+    separate worker processes.
+    The large arrays of each job (e.g. the nearfield :attr:`~Hologram.amp`,
+    :attr:`~Hologram.phase`, :attr:`~Hologram.target`, and :attr:`~Hologram.weights`)
+    are transferred through a single block of
+    :class:`~multiprocessing.shared_memory.SharedMemory` rather than being pickled.
+    Only the small remainder of the hologram state is pickled.
+
+    Upon completion, the optimized :attr:`~Hologram.phase`, :attr:`~Hologram.weights`,
+    farfield (``farfield``, ``amp_ff``, and ``phase_ff``), :attr:`~Hologram.iter`,
+    :attr:`~Hologram.flags`, and :attr:`~Hologram.stats` are written back into the
+    submitted hologram.
+
+    Important
+    ~~~~~~~~~
+    Only ``"computational"`` and ``"computational_spot"`` feedback are supported,
+    as the worker processes do not have access to hardware.
+    :attr:`~FeedbackHologram.cameraslm` is not transferred to the workers;
+    :class:`CompressedSpotHologram` caches the SLM grids it needs before submission.
+    Any ``callback`` passed to :meth:`.submit()` must be picklable
+    (e.g. defined at the top level of a module).
+
+    Caution
+    ~~~~~~~
+    The pool is meant for CPU-only deployments and cannot be used when :mod:`cupy`
+    is installed. With :mod:`cupy`, use :class:`HologramBatch` to make use of the GPU instead.
+
+    Tip
+    ~~~
+    The pool can be used as a context manager, which shuts down the workers upon exit.
+
+    .. highlight:: python
+    .. code-block:: python
+
+        with HologramPool() as pool:
+            results = pool.map(holograms, method="WGS-Kim", maxiter=50, verbose=False)
+
+    Attributes
+    ----------
+    workers : int
+        Number of worker processes.
+    executor : concurrent.futures.ProcessPoolExecutor
+        The underlying executor.
+    """
+
+    def __init__(self, workers=None, fft_workers=1, mp_context=None):
+        """
+        Starts the worker processes.
+
+        Parameters
+        ----------
+        workers : int OR None
+            Number of worker processes. If ``None``, uses the number of cores.
+        fft_workers : int
+            Number of threads used by each worker for FFTs. Defaults to ``1`` such that
+            ``workers`` processes do not oversubscribe the cores.
+        mp_context : str OR multiprocessing.context.BaseContext OR None
+            Start method (e.g. ``"spawn"``) or context for the workers.
+            If ``None``, uses the platform default.
+        """
+        if cp is not np:
+            raise RuntimeError(
+                "HologramPool is meant for CPU-only deployments. "
+                "Use HologramBatch to optimize many holograms with cupy."
+            )
+
+        if workers is None:
+            workers = os.cpu_count()
+        self.workers = int(workers)
+        if isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp_context,
+            initializer=_pool_initializer,
+            initargs=(int(fft_workers),),
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+
+    def shutdown(self, wait=True):
+        """
+        Shuts down the worker processes.
+
+        Parameters
+        ----------
+        wait : bool
+            Whether to wait for pending jobs to complete.
+        """
+        self.executor.shutdown(wait=wait)
+
+    @staticmethod
+    def _strip(hologram):
+        """
+        Splits the hologram into a picklable state without large arrays and
+        a shared memory block holding the arrays.
+        """
+        if hasattr(hologram, "holograms"):
+            raise ValueError("HologramPool does not support MultiplaneHologram.")
+        if hasattr(hologram, "_build_grid_complex"):
+            hologram._build_grid_complex()
+
+        state = {}
+        arrays = {}
+        for key, value in hologram.__dict__.items():
+            if key == "_spot_zernike_cached":
+                continue        # Forces the kernel to be rebuilt.
+            elif key in _POOL_SCRATCH or key == "cameraslm":
+                state[key] = None
+            elif isinstance(value, np.ndarray):
+                arrays[key] = value
+            elif (
+                isinstance(value, tuple) and len(value) > 0 and
+                all(isinstance(v, np.ndarray) for v in value)
+            ):
+                for i, v in enumerate(value):
+                    arrays[(key, i)] = v
+            else:
+                state[key] = value
+
+        # Check picklability now rather than in the executor's thread.
+        try:
+            pickle.dumps(state)
+        except Exception as err:
+            raise ValueError(
+                "Could not transfer {} to the pool:\n{}".format(type(hologram).__name__, err)
+            )
+
+        # Slots for the results.
+        layout = {key: (value.shape, value.dtype) for key, value in arrays.items()}
+        for key in _POOL_OUTPUTS:
+            dtype = hologram.dtype_complex if key == "farfield" else hologram.dtype
+            layout[key] = (hologram.target.shape, dtype)
+
+        shared = _SharedArrays(layout)
+        for key, value in arrays.items():
+            shared.put(key, value)
+
+        return state, shared
+
+    @staticmethod
+    def _finish(hologram, shared, future):
+        """Copies the results back into ``hologram`` and frees the shared memory."""
+        try:
+            result = future.result()
+        except BaseException:
+            shared.close(unlink=True)
+            raise
+
+        try:
+            for key in _POOL_RESULTS:
+                if key in shared.spec:
+                    setattr(hologram, key, shared.get(key))
+            result["phase"] = hologram.phase
+        finally:
+            shared.close(unlink=True)
+
+        hologram.iter = result["iter"]
+        hologram.flags = result["flags"]
+        hologram.stats = result["stats"]
+
+        return result
+
+    def submit(self, hologram, method="GS", maxiter=20, verbose=False, **kwargs):
+        """
+        Queues the optimization of ``hologram``. Arguments are passed to
+        :meth:`Hologram.optimize()`.
+
+        Parameters
+        ----------
+        hologram : :class:`Hologram` OR :class:`SpotHologram` OR :class:`CompressedSpotHologram`
+            Hologram to optimize. Results are written into this object upon completion.
+        method : str
+            Optimization method. See :meth:`Hologram.optimize()`.
+        maxiter : int
+            Number of iterations to optimize before terminating.
+        verbose : bool
+            Whether each worker displays progress. Defaults to ``False``, as the
+            progress bars of concurrent workers interleave.
+        **kwargs
+            Passed to :meth:`Hologram.optimize()`.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to a dictionary with the optimized ``"phase"``, and the ``"stats"``,
+            ``"flags"``, and ``"iter"`` of the hologram.
+        """
+        feedback = kwargs.get("feedback", None)
+        if feedback is not None and not "computational" in feedback:
+            raise ValueError("HologramPool only supports computational feedback.")
+
+        state, shared = self._strip(hologram)
+        kwargs.update({"method": method, "maxiter": maxiter, "verbose": verbose})
+
+        try:
+            inner = self.executor.submit(
+                _pool_worker, type(hologram), state, shared.name, shared.spec, kwargs
+            )
+        except BaseException:
+            shared.close(unlink=True)
+            raise
+
+        outer = concurrent.futures.Future()
+
+        def finish(inner):
+            try:
+                outer.set_result(self._finish(hologram, shared, inner))
+            except BaseException as err:
+                outer.set_exception(err)
+
+        inner.add_done_callback(finish)
+
+        return outer
+
+    def map(self, holograms, **kwargs):
+        """
+        Optimizes all ``holograms`` concurrently, blocking until completion.
+
+        Parameters
+        ----------
+        holograms : list of :class:`Hologram`
+            Holograms to optimize. Results are written into these objects.
+        **kwargs
+            Passed to :meth:`.submit()`.
+
+        Returns
+        -------
+        list of dict
+            Results in the order of ``holograms``. See :meth:`.submit()`.
+        """
+        futures = [self.submit(hologram, **kwargs) for hologram in holograms]
+        return [future.result() for future in futures]
@@ -1,6 +1,7 @@
 from slmsuite.holography.algorithms._header import *
 from slmsuite.holography.algorithms._hologram import Hologram
 from slmsuite.holography.algorithms._feedback import FeedbackHologram
+from slmsuite.holography.algorithms._nufft import _NUFFTEngine
 
 
 class _AbstractSpotHologram(FeedbackHologram):
@@ -14,12 +15,51 @@ class _AbstractSpotHologram(FeedbackHologram):
     def remove_vortices(self):
         """Spot holograms do not need to consider vortices."""
         pass
+
+    def _get_spot_ij(self, image=None):
+        """
+        Returns the camera-space spot positions to integrate ``"experimental_spot"``
+        feedback around. If the ``"spot_tracking"`` flag is set, these are the positions
+        of a :class:`~slmsuite.holography.analysis.SpotTracker` (stored in
+        ``spot_tracker``), which is updated with the intensity ``image`` if given.
+        The tracking windows are about twice the integration width, such that their
+        borders sample the background, but no wider than the spot separation.
+        Lost spots are re-detected near their origin upon each update, and revert to
+        :attr:`spot_ij` if they remain lost.
+        """
+        if not self.flags.get("spot_tracking", False) or self.spot_integration_width_ij is None:
+            return self.spot_ij
+
+        tracker = getattr(self, "spot_tracker", None)
+        if tracker is None or tracker.positions.shape != np.shape(self.spot_ij):
+            width = 2 * int(self.spot_integration_width_ij) + 1
+            if self.spot_ij.shape[1] > 1:
+                width = min(width, int(toolbox.smallest_distance(self.spot_ij)))
+            width = max(int(self.spot_integration_width_ij), width) | 1
+
+            # Images are in camera counts, so the noise is at least one count.
+            tracker = analysis.SpotTracker(self.spot_ij, width, noise=1)
+            self.spot_tracker = tracker
+
+        if image is not None:
+            tracker.redetect(image)
+            tracker.update(image)
+
+        return np.where(tracker.lost, self.spot_ij, tracker.positions)
     # def update_spots(self, source_basis="kxy"):
     #     pass
 
 
 # For the cupy kernel based approach, the size of the kernel to cache.
 N_BATCH_MAX = 400   # Corresponds to ~2 GB for a megapixel SLM.
+# Host memory for kernel rows beyond the cache, stored as quantized phase. Opt-in.
+KERNEL_MEMORY_COMPRESSED = 0
+KERNEL_QUANTIZATION = 2 ** 16       # Phase levels of the uint16 quantized rows.
+# ANSI indices of Zernike polynomials which are sums of a function of x and a function of y.
+SEPARABLE_ZERNIKE = [0, 1, 2, 4, 5]
+# ANSI indices of Zernike polynomials which are linear (piston and tilts), such that
+# spot kernels are plane waves and the transforms are non-uniform DFTs.
+BLAZE_ZERNIKE = [0, 1, 2]
 
 class CompressedSpotHologram(_AbstractSpotHologram):
     """
@@ -56,6 +96,19 @@ class CompressedSpotHologram(_AbstractSpotHologram):
         in ``"ij"`` (camera) space.
     cuda : bool
         Whether the custom CUDA kernel is used for optimization (option 2).
+    kernel_memory : int OR None
+        Bytes of (GPU) memory for the :mod:`numpy`/:mod:`cupy` kernel (option 1).
+        If the full kernel does not fit, half of this budget holds rows in full precision
+        while the other half double-buffers the remaining rows, which are streamed
+        in blocks, such that the budget must hold at least two rows.
+        If ``None``, defaults to the memory of ``N_BATCH_MAX = 400`` rows.
+    kernel_memory_compressed : int OR None
+        Bytes of host memory for streamed rows, which are cached as ``uint16``
+        quantized phase (a quarter of the size of ``complex64``).
+        Rows which do not fit are recomputed whenever they are streamed.
+        If ``None``, defaults to ``0``, such that all streamed rows are recomputed.
+        This memory is pinned, and the quantized phase (to ``2**16`` levels) makes
+        results differ slightly from recomputation, so this tier is opt-in.
     """
     def __init__(
         self,
@@ -63,6 +116,8 @@ class CompressedSpotHologram(_AbstractSpotHologram):
         basis="kxy",
         spot_amp=None,
         cameraslm=None,
+        kernel_memory=None,
+        kernel_memory_compressed=None,
         **kwargs
     ):
         r"""
@@ -95,7 +150,15 @@ class CompressedSpotHologram(_AbstractSpotHologram):
             plays tricks to vectorize the farfield transformation operations.
             This method makes ample use of memory and is inefficient for very large spot arrays.
             The caches are unique to a specific :attr:`spot_zernike`, and are updated
-            when a change to :attr:`spot_zernike` is detected.
+            when a change to :attr:`spot_zernike` is detected. Only the kernels of the
+            spots which changed are rebuilt, such that moving a few spots is cheap.
+            If the basis only contains tilt, defocus, and vertical astigmatism, each kernel
+            separates into a product of a function of :math:`x` and a function of :math:`y`.
+            In this case, only ``(N, H)`` and ``(N, W)`` factors are stored instead
+            of the ``(N, H*W)`` kernel.
+            If the basis only contains tilt, the transforms are non-uniform DFTs, which the
+            ``"nufft"`` flag evaluates in :math:`O(HW \\log HW + N)` rather than :math:`O(NHW)`.
+            See :attr:`~slmsuite.holography.algorithms.Hologram.flags`.
             More general or complicated functionality requires full use of the GPU
             and thus the following option requires :mod:`cupy` and underlying CUDA.
 
@@ -175,9 +238,18 @@ class CompressedSpotHologram(_AbstractSpotHologram):
         cameraslm : ~slmsuite.hardware.cameraslms.FourierSLM
             Must be passed. The default of ``None`` with throw an error and is only
             optional such that we can retain the same argument ordering as :class:`SpotHologram`.
+        kernel_memory : int OR None
+            Bytes of (GPU) memory for the :mod:`numpy`/:mod:`cupy` kernel.
+            See :attr:`kernel_memory`.
+        kernel_memory_compressed : int OR None
+            Bytes of host memory for quantized kernel rows.
+            See :attr:`kernel_memory_compressed`.
         **kwargs
             Passed to :meth:`.FeedbackHologram.__init__()`.
         """
+        self.kernel_memory = kernel_memory
+        self.kernel_memory_compressed = kernel_memory_compressed
+
         # Parse vectors.
         spot_vectors = toolbox.format_vectors(spot_vectors, handle_dimension="pass")
         (D, N) = spot_vectors.shape
@@ -331,7 +403,11 @@ class CompressedSpotHologram(_AbstractSpotHologram):
 
         # Default helper variables.
         self._cupy_kernel = None
+        self._cupy_kernel_store = None
         self._cupy_stack = None
+        self._separable = None
+        self._separable_kernel = None
+        self._nufft_points = None
         self.cuda = False
 
         # Storage variable to use cp.sum on the intermediate sum.
@@ -393,6 +469,13 @@ class CompressedSpotHologram(_AbstractSpotHologram):
     def refine_offset(self, *args, **kwargs):
         raise NotImplementedError("Currently not implemented for CompressedSpotHologram")
 
+    def _set_fft_shift(self, fft_shift=True):
+        """
+        :class:`~slmsuite.holography.algorithms.CompressedSpotHologram`
+        does not use a DFT grid, so the ``"fft_shift"`` flag is ignored.
+        """
+        pass
+
     def _get_target_moments_knm_norm(self):
         """
         Get the first and second order moments of the target in normalized knm space
@@ -422,10 +505,10 @@ class CompressedSpotHologram(_AbstractSpotHologram):
         return np.squeeze(center_knm_norm), np.squeeze(std_knm_norm)
 
     # Projection backend helper functions.
-    def _build_cupy_kernel_batched(self, vectors=None, out=None):
+    def _build_cupy_kernel_phase(self, vectors=None, out=None, grid=None):
         """
-        Uses the coordinate stack to produce the kernel, a stack of images corresponding
-        to the blaze and lens directing power to each desired spot in the farfield.
+        Uses the coordinate stack to produce the phase of the kernel, a stack of images
+        corresponding to the blaze and lens directing power to each desired spot in the farfield.
 
         Parameters
         ----------
@@ -434,29 +517,50 @@ class CompressedSpotHologram(_AbstractSpotHologram):
             If ``None``, uses :attr:`spot_zernike`.
         out : numpy.ndarray OR cupy.ndarray OR None
             Array to direct data to when in-place. None if out-of-place.
+        grid : (array_like, array_like) OR None
+            Pre-scaled grids to evaluate upon. If ``None``, uses :attr:`_grid_complex`.
+
+        Returns
+        -------
+        numpy.ndarray OR cupy.ndarray
+            The phase of shape ``(N, H*W)``, stored as the real part of a complex array.
         """
         # Parse vectors.
         if vectors is None:
             vectors = self.spot_zernike
 
         # Make the grids if they aren't there.
-        if not hasattr(self, "_grid_complex"):
-            (x_scale, y_scale) = tphase.zernike_aperture(self.cameraslm.slm, aperture=None)
-            self._grid_complex = (
-                cp.array(self.cameraslm.slm.grid[0] * x_scale, dtype=self.dtype_complex),
-                cp.array(self.cameraslm.slm.grid[1] * y_scale, dtype=self.dtype_complex)
-            )
+        if grid is None:
+            self._build_grid_complex()
+            grid = self._grid_complex
 
         # Use the toolbox.phase function to calculate the kernels.
         out = zernike_sum(
-            self._grid_complex,
+            grid,
             indices=self.zernike_basis,
             weights=vectors,
             aperture=1,                     # Grids come pre-scaled.
             use_mask=False,                 # For this task, we don't want the edge of the aperture causing artifacts.
             out=out
         )
-        out = out.reshape((out.shape[0], out.shape[1] * out.shape[2]))
+        return out.reshape((-1, grid[0].size))  # N = 1 returns (H,W).
+
+    def _build_cupy_kernel_batched(self, vectors=None, out=None, grid=None):
+        """
+        Uses the coordinate stack to produce the kernel, a stack of images corresponding
+        to the blaze and lens directing power to each desired spot in the farfield.
+
+        Parameters
+        ----------
+        vectors : numpy.ndarray OR None
+            Vectors in the :attr:`zernike_basis` to project a spot towards.
+            If ``None``, uses :attr:`spot_zernike`.
+        out : numpy.ndarray OR cupy.ndarray OR None
+            Array to direct data to when in-place. None if out-of-place.
+        grid : (array_like, array_like) OR None
+            Pre-scaled grids to evaluate upon. If ``None``, uses :attr:`_grid_complex`.
+        """
+        out = self._build_cupy_kernel_phase(vectors=vectors, out=out, grid=grid)
 
         # Convert from real phase to complex amplitude.
         out *= self.dtype_complex(1j)
@@ -464,37 +568,365 @@ class CompressedSpotHologram(_AbstractSpotHologram):
 
         return out
 
-    def _update_cupy_kernel(self, kernel_slice=None, batch_slice=None):
-        # Check if we need to update the kernel.
-        needs_update = (
-            not hasattr(self, "_spot_zernike_cached") or
-            np.any(self._spot_zernike_cached != self.spot_zernike)
+    def _build_cupy_kernel_quantized(self, vectors):
+        """
+        Produces the kernel phase for ``vectors`` quantized to ``uint16``
+        (``KERNEL_QUANTIZATION`` levels over :math:`2\\pi`), stored on the host.
+        """
+        phase = self._build_cupy_kernel_phase(vectors=vectors).real
+        phase *= KERNEL_QUANTIZATION / (2 * np.pi)
+        phase = cp.rint(phase, out=phase)
+        phase = cp.remainder(phase, KERNEL_QUANTIZATION, out=phase)
+        phase = phase.astype(np.uint16)
+
+        return phase.get() if hasattr(phase, "get") else phase
+
+    def _build_grid_complex(self):
+        """
+        Caches the SLM grids, pre-scaled to the Zernike aperture, as :attr:`_grid_complex`.
+        Once cached, the kernel no longer requires :attr:`cameraslm`.
+        """
+        if not hasattr(self, "_grid_complex"):
+            (x_scale, y_scale) = tphase.zernike_aperture(self.cameraslm.slm, aperture=None)
+            self._grid_complex = (
+                cp.array(self.cameraslm.slm.grid[0] * x_scale, dtype=self.dtype_complex),
+                cp.array(self.cameraslm.slm.grid[1] * y_scale, dtype=self.dtype_complex)
+            )
+
+    def _is_separable(self):
+        """
+        Whether the kernel phase is the sum of a function of :math:`x` and a function
+        of :math:`y`. This is the case when :attr:`zernike_basis` only contains
+        ``SEPARABLE_ZERNIKE`` terms (piston, tilts, defocus, and vertical astigmatism)
+        and the SLM grids are not rotated.
+        """
+        if self._separable is None:
+            self._build_grid_complex()
+            (x_grid, y_grid) = self._grid_complex
+
+            self._separable = bool(
+                np.all(np.isin(self.zernike_basis, SEPARABLE_ZERNIKE)) and
+                cp.all(x_grid == x_grid[:1, :]) and
+                cp.all(y_grid == y_grid[:, :1])
+            )
+
+        return self._separable
+
+    def _is_blaze(self):
+        """
+        Whether each kernel is a plane wave on a uniform grid, i.e. :attr:`zernike_basis`
+        only contains ``BLAZE_ZERNIKE`` terms (piston and tilts).
+        """
+        if not self._is_separable() or not np.all(np.isin(self.zernike_basis, BLAZE_ZERNIKE)):
+            return False
+
+        (x_grid, y_grid) = self._grid_complex
+        dx = cp.diff(x_grid[0, :].real)
+        dy = cp.diff(y_grid[:, 0].real)
+
+        # Loose tolerance to allow for the rounding of single-precision grids.
+        return bool(
+            (dx.size == 0 or cp.allclose(dx, dx[0], rtol=1e-3, atol=0)) and
+            (dy.size == 0 or cp.allclose(dy, dy[0], rtol=1e-3, atol=0))
+        )
+
+    def _get_nufft_points(self):
+        """
+        Returns the plane wave of each spot as non-uniform points, prepared by
+        :meth:`_NUFFTEngine.setpts()`, and the phase of each spot at the grid center,
+        such that the kernel is :math:`e^{i(\\phi_n + x_n (p - W//2) + y_n (q - H//2))}`
+        with :math:`x_n, y_n` in radians per pixel. These are cached until
+        :attr:`spot_zernike` changes.
+        """
+        engine = self._get_nufft_engine()
+
+        if (
+            self._nufft_points is not None and
+            self._nufft_points[0] is engine and
+            self._nufft_points[1].shape == self.spot_zernike.shape and
+            np.all(self._nufft_points[1] == self.spot_zernike)
+        ):
+            return self._nufft_points[2:]
+
+        self._build_grid_complex()
+        (x_grid, y_grid) = self._grid_complex
+        (H, W) = x_grid.shape
+        (xc, yc) = (x_grid[0, W // 2], y_grid[H // 2, 0])
+        (dx, dy) = (
+            x_grid[0, 1] - x_grid[0, 0] if W > 1 else 0,
+            y_grid[1, 0] - y_grid[0, 0] if H > 1 else 0,
+        )
+
+        # Linear phase, so three evaluations determine the plane waves.
+        grid = (
+            cp.array([[xc, xc + dx, xc]], dtype=np.complex128),
+            cp.array([[yc, yc, yc + dy]], dtype=np.complex128),
+        )
+        phase = self._build_cupy_kernel_phase(grid=grid).real
+
+        points = engine.setpts(phase[:, 1] - phase[:, 0], phase[:, 2] - phase[:, 0])
+        center = cp.exp(1j * phase[:, 0]).astype(self.dtype_complex)
+
+        self._nufft_points = (engine, self.spot_zernike.copy(), points, center)
+
+        return self._nufft_points[2:]
+
+    def _get_nufft_engine(self):
+        nufft = self.flags.get("nufft", False)
+        eps = 1e-6 if self.dtype == np.float32 else 1e-12
+
+        return _NUFFTEngine.get(
+            self.slm_shape, eps=eps, backend=(nufft if isinstance(nufft, str) else None)
+        )
+
+    def _nearfield2farfield_nufft(self, nearfield):
+        (points, center) = self._get_nufft_points()
+
+        self.farfield[:] = self._get_nufft_engine().type2(points, cp.conj(nearfield))
+        self.farfield *= center
+
+        self.farfield *= (1 / Hologram._norm(self.farfield, xp=cp))
+
+        return self.farfield
+
+    def _farfield2nearfield_nufft(self):
+        (points, center) = self._get_nufft_points()
+
+        self.nearfield[:] = self._get_nufft_engine().type1(points, self.farfield * center)
+
+    def _update_separable_kernel(self):
+        """
+        Builds the factors of the separable kernel. Kernel row :math:`n` is the outer product
+        of the :math:`n`-th rows of the ``(N, H)`` and ``(N, W)`` factors, using
+        :math:`\\phi(x, y) = \\phi(x, 0) + \\phi(0, y) - \\phi(0, 0)`.
+        """
+        if (
+            self._separable_kernel is not None and
+            self._separable_zernike_cached.shape == self.spot_zernike.shape and
+            np.all(self._separable_zernike_cached == self.spot_zernike)
+        ):
+            return
+
+        self._separable_zernike_cached = self.spot_zernike.copy()
+        self._separable_kernel = None
+
+        self._build_grid_complex()
+        (x_grid, y_grid) = self._grid_complex
+        x_grid = x_grid[:1, :]
+        y_grid = y_grid[:, :1]
+        zero = cp.zeros((1, 1), dtype=self.dtype_complex)
+
+        kernel_x = self._build_cupy_kernel_batched(grid=(x_grid, cp.zeros_like(x_grid)))
+        kernel_y = self._build_cupy_kernel_batched(grid=(cp.zeros_like(y_grid), y_grid))
+        kernel_y *= cp.conj(self._build_cupy_kernel_batched(grid=(zero, zero)))
+
+        self._separable_kernel = (kernel_y, kernel_x)
+
+    def _nearfield2farfield_separable(self, nearfield):
+        self._update_separable_kernel()
+        (kernel_y, kernel_x) = self._separable_kernel
+
+        # (N, W) x (W, H) = (N, H), then contract with the (N, H) factor.
+        partial = cp.matmul(kernel_x, cp.conj(nearfield).T)
+        partial *= kernel_y
+        farfield = cp.sum(partial, axis=1, out=self.farfield)
+
+        farfield *= (1 / Hologram._norm(farfield, xp=cp))
+
+        return farfield
+
+    def _farfield2nearfield_separable(self):
+        self._update_separable_kernel()
+        (kernel_y, kernel_x) = self._separable_kernel
+
+        # (H, N) x (N, W) = (H, W)
+        cp.matmul(kernel_y.T * self.farfield[np.newaxis, :], kernel_x, out=self.nearfield)
+
+    def _get_cupy_kernel_layout(self):
+        """
+        Partitions the ``N`` rows of the kernel into tiers according to
+        :attr:`kernel_memory` and :attr:`kernel_memory_compressed`.
+
+        Returns
+        -------
+        (int, int, int)
+            The number of rows resident in full precision, the number of rows per
+            streamed block, and the number of streamed rows cached in quantized form.
+            Rows beyond these tiers are recomputed whenever they are streamed.
+        """
+        N = len(self)
+        pixels = int(self.slm_shape[0] * self.slm_shape[1])
+        row_bytes = pixels * np.dtype(self.dtype_complex).itemsize
+
+        memory = N_BATCH_MAX * row_bytes if self.kernel_memory is None else self.kernel_memory
+        rows = int(memory // row_bytes)
+
+        if N <= rows:
+            return (N, 0, 0)
+        if rows < 2:
+            raise ValueError(
+                "kernel_memory={} bytes cannot hold the two streaming buffers of at least "
+                "one row ({} bytes) each.".format(memory, row_bytes)
+            )
+
+        # Two streaming buffers of a quarter of the budget each; the rest is resident.
+        block = int(np.clip(rows // 4, 1, N_BATCH_MAX))
+        resident = max(0, rows - 2 * block)
+
+        memory = (
+            KERNEL_MEMORY_COMPRESSED if self.kernel_memory_compressed is None
+            else self.kernel_memory_compressed
         )
+        compressed = int(min(N - resident, memory // (2 * pixels)))
+
+        return (resident, block, compressed)
+
+    def _update_cupy_kernel(self):
+        pixels = int(self.slm_shape[0] * self.slm_shape[1])
+        layout = self._get_cupy_kernel_layout()
+        (resident, block, compressed) = layout
+
+        # Find the spots which changed since the last update. None means everything changed.
+        changed = None
+        if (
+            hasattr(self, "_spot_zernike_cached") and
+            self._spot_zernike_cached.shape == self.spot_zernike.shape and
+            self._cupy_kernel_store is not None and
+            self._cupy_kernel_store["layout"] == layout
+        ):
+            changed = np.flatnonzero(
+                np.any(self._spot_zernike_cached != self.spot_zernike, axis=0)
+            )
+
+        if changed is not None and len(changed) == 0:
+            return
 
         # Take a cached copy so we can check if we need to update next time.
-        if needs_update:
-            self._spot_zernike_cached = self.spot_zernike.copy()
-
-        # Update the kernel always if we're slicing (updating a fractional kernel).
-        if kernel_slice is not None and batch_slice is not None:
-            if self._cupy_kernel is None:
-                self._cupy_kernel = cp.zeros(
-                    (N_BATCH_MAX, self.slm_shape[0] * self.slm_shape[1]),
-                    dtype=self.dtype_complex
+        self._spot_zernike_cached = self.spot_zernike.copy()
+
+        # (Re)allocate the tiers if the layout changed.
+        if changed is None:
+            if self._cupy_kernel is None or self._cupy_kernel.shape != (resident, pixels):
+                self._cupy_kernel = None    # Free memory before allocating.
+                self._cupy_kernel = cp.zeros((resident, pixels), dtype=self.dtype_complex)
+
+            self._cupy_kernel_store = None
+            self._cupy_kernel_store = {
+                "layout": layout,
+                "compressed": cp_zeros_pinned((compressed, pixels), dtype=np.uint16),
+                "buffers": [cp.zeros((block, pixels), dtype=self.dtype_complex) for _ in range(2 if block else 0)],
+                "staging": None,
+                "stream": None,
+                "table": None,
+            }
+            if compressed:  # Lookup table which decompresses phase to complex amplitude.
+                self._cupy_kernel_store["table"] = cp.exp(
+                    cp.arange(KERNEL_QUANTIZATION, dtype=self.dtype) *
+                    self.dtype_complex(2j * np.pi / KERNEL_QUANTIZATION)
                 )
-
-            self._cupy_kernel[kernel_slice, :] = self._build_cupy_kernel_batched(
-                vectors=self.spot_zernike[:, batch_slice],
-                out=self._cupy_kernel[kernel_slice, :]
+            if cp is not np and block:
+                self._cupy_kernel_store["staging"] = [
+                    cp.zeros((block, pixels), dtype=np.uint16) for _ in range(2)
+                ]
+                self._cupy_kernel_store["stream"] = cp.cuda.Stream(non_blocking=True)
+
+        # Resident tier: rebuild only the rows of the spots which moved, unless most of them did.
+        rows = None if changed is None else changed[changed < resident]
+
+        if rows is None or 2 * len(rows) > resident:
+            self._cupy_kernel = self._build_cupy_kernel_batched(
+                vectors=self.spot_zernike[:, :resident],
+                out=self._cupy_kernel
             )
-        elif needs_update:  # Otherwise, only update if we need to.
-            if self._cupy_kernel is None:
-                self._cupy_kernel = cp.zeros(
-                    (len(self), self.slm_shape[0] * self.slm_shape[1]),
-                    dtype=self.dtype_complex
+        elif len(rows) > 0:
+            self._cupy_kernel[rows, :] = self._build_cupy_kernel_batched(
+                vectors=self.spot_zernike[:, rows]
+            )
+
+        # Compressed tier: rebuild the changed rows, a block at a time to bound memory.
+        if compressed > 0:
+            if changed is None:
+                rows = np.arange(resident, resident + compressed)
+            else:
+                rows = changed[(changed >= resident) & (changed < resident + compressed)]
+
+            store = self._cupy_kernel_store["compressed"]
+            for i in range(0, len(rows), block):
+                batch = rows[i:i+block]
+                store[batch - resident, :] = self._build_cupy_kernel_quantized(
+                    vectors=self.spot_zernike[:, batch]
                 )
 
-            self._cupy_kernel = self._build_cupy_kernel_batched(out=self._cupy_kernel)
+    def _prepare_cupy_kernel_block(self, batch_slice, index):
+        """
+        Fills streaming buffer ``index`` with the kernel rows in ``batch_slice``, either by
+        decompressing the quantized rows (with a lookup table) or by recomputing them.
+        """
+        store = self._cupy_kernel_store
+        (resident, _, compressed) = store["layout"]
+        size = batch_slice.stop - batch_slice.start
+        out = store["buffers"][index][:size]
+
+        if batch_slice.stop <= resident + compressed:
+            quantized = store["compressed"][batch_slice.start - resident : batch_slice.stop - resident]
+
+            if store["staging"] is not None:    # Asynchronous copy from pinned memory.
+                staging = store["staging"][index][:size]
+                staging.set(quantized, stream=store["stream"])
+                quantized = staging
+
+            cp.take(store["table"], quantized, out=out)
+        else:
+            self._build_cupy_kernel_batched(vectors=self.spot_zernike[:, batch_slice], out=out)
+
+    def _iter_cupy_kernel(self):
+        """
+        Yields ``(batch_slice, kernel)`` pairs which together cover all ``N`` rows of the
+        kernel. The resident rows come first, as one block. The remaining rows are streamed
+        through two buffers: the next block is prepared (on a separate :mod:`cupy`
+        stream, if available) while the current block is in use.
+        """
+        self._update_cupy_kernel()
+
+        N = len(self)
+        store = self._cupy_kernel_store
+        (resident, block, compressed) = store["layout"]
+
+        if resident > 0:
+            yield slice(0, resident), self._cupy_kernel
+        if resident == N:
+            return
+
+        # Blocks do not straddle the compressed and recomputed tiers.
+        stop = resident + compressed
+        slices = [slice(i, min(i + block, stop)) for i in range(resident, stop, block)]
+        slices += [slice(i, min(i + block, N)) for i in range(stop, N, block)]
+
+        stream = store["stream"]
+        events = [None, None]
+
+        def prepare(j):
+            if stream is None:
+                self._prepare_cupy_kernel_block(slices[j], j % 2)
+            else:
+                with stream:
+                    self._prepare_cupy_kernel_block(slices[j], j % 2)
+                    events[j % 2] = stream.record()
+
+        if len(slices):
+            prepare(0)
+
+        for j, batch_slice in enumerate(slices):
+            if j + 1 < len(slices):
+                # The next buffer was last used by block j-1, which must finish first.
+                if stream is not None:
+                    stream.wait_event(cp.cuda.get_current_stream().record())
+                prepare(j + 1)
+
+            if stream is not None:
+                cp.cuda.get_current_stream().wait_event(events[j % 2])
+
+            yield batch_slice, store["buffers"][j % 2][:batch_slice.stop - batch_slice.start]
 
     def _nearfield2farfield(self, phase_torch=None):
         """
@@ -570,11 +1002,16 @@ class CompressedSpotHologram(_AbstractSpotHologram):
     def _nearfield2farfield_cupy(self, nearfield):
         # Conjugate the nearfield to properly take the overlap integral.
         # FYI: Nearfield shape is (H,W)
-        N = len(self)
 
         # Determine whether we are in torch-mode.
         istorch = torch is not None and isinstance(nearfield, torch.Tensor)
 
+        # Avoid the dense kernel when it factors.
+        if not istorch and self.flags.get("nufft", False) and self._is_blaze():
+            return self._nearfield2farfield_nufft(nearfield)
+        if not istorch and self._is_separable():
+            return self._nearfield2farfield_separable(nearfield)
+
         # Do some prep work.
         if istorch:
             nearfield = torch.conj(nearfield)
@@ -597,18 +1034,9 @@ class CompressedSpotHologram(_AbstractSpotHologram):
                     out=out[:, np.newaxis]
                 )
 
-        # Evaluate the kernel.
-        if N <= N_BATCH_MAX:
-            self._update_cupy_kernel()
-            collapse_kernel(self._cupy_kernel, out=farfield)
-        else:
-            batches = 1 + N // N_BATCH_MAX
-            for batch in range(batches):
-                batch_slice = slice(batch * N_BATCH_MAX, np.clip((batch+1) * N_BATCH_MAX, 0, N))
-                kernel_slice = slice(0, batch_slice.stop - batch_slice.start)
-
-                self._update_cupy_kernel(batch_slice, kernel_slice)
-                collapse_kernel(self._cupy_kernel[:, kernel_slice], out=farfield[batch_slice])
+        # Evaluate the kernel, streaming blocks of rows if it does not fit in memory.
+        for batch_slice, kernel in self._iter_cupy_kernel():
+            collapse_kernel(kernel, out=farfield[batch_slice])
 
         # Restore the in-place memory.
         if not istorch:
@@ -702,32 +1130,31 @@ class CompressedSpotHologram(_AbstractSpotHologram):
 
     def _farfield2nearfield_cupy(self):
         # FYI: Farfield shape is (N,)
-        N = len(self)
+
+        # Avoid the dense kernel when it factors.
+        if self.flags.get("nufft", False) and self._is_blaze():
+            self._farfield2nearfield_nufft()
+            return
+        if self._is_separable():
+            self._farfield2nearfield_separable()
+            return
 
         def expand_kernel(kernel, farfield, out):
             # (1, N) x (N, H*W) = (1, H*W)   ===reshape===>   (H,W)
             return cp.matmul(farfield[np.newaxis, :], kernel, out=out[np.newaxis, :])
 
-        # Evaluate the kernel.
-        if N <= N_BATCH_MAX:
-            self._update_cupy_kernel()
-            expand_kernel(self._cupy_kernel, self.farfield, out=self.nearfield.ravel())
-        else:
-            nearfield_out_temp = cp.zeros(self.slm_shape, dtype=self.dtype_complex)
-
-            batches = 1 + N // N_BATCH_MAX
-
-            for batch in range(batches):
-                batch_slice = slice(batch * N_BATCH_MAX, np.clip((batch+1) * N_BATCH_MAX, 0, N))
-                kernel_slice = slice(0, batch_slice.stop - batch_slice.start)
+        # Evaluate the kernel, streaming blocks of rows if it does not fit in memory.
+        nearfield_out_temp = None
 
-                self._update_cupy_kernel(batch_slice, kernel_slice)
+        for batch_slice, kernel in self._iter_cupy_kernel():
+            if batch_slice.start == 0:
+                expand_kernel(kernel, self.farfield[batch_slice], out=self.nearfield.ravel())
+            else:
+                if nearfield_out_temp is None:
+                    nearfield_out_temp = cp.zeros(self.slm_shape, dtype=self.dtype_complex)
 
-                if batch == 0:
-                    expand_kernel(self._cupy_kernel[kernel_slice, :], self.farfield[batch_slice], out=self.nearfield.ravel())
-                else:
-                    expand_kernel(self._cupy_kernel[kernel_slice, :], self.farfield[batch_slice], out=nearfield_out_temp.ravel())
-                    self.nearfield += nearfield_out_temp
+                expand_kernel(kernel, self.farfield[batch_slice], out=nearfield_out_temp.ravel())
+                self.nearfield += nearfield_out_temp
 
     # Target update.
     def set_target(self, new_target=None, reset_weights=False):
@@ -782,9 +1209,11 @@ class CompressedSpotHologram(_AbstractSpotHologram):
         elif feedback == "experimental_spot":
             self.measure(basis="ij")
 
+            pwr_img = np.square(np.array(self.img_ij, copy=(False if np.__version__[0] == '1' else None), dtype=self.dtype))
+
             amp_feedback = np.sqrt(analysis.take(
-                np.square(np.array(self.img_ij, copy=(False if np.__version__[0] == '1' else None), dtype=self.dtype)),
-                self.spot_ij,
+                pwr_img,
+                self._get_spot_ij(pwr_img),
                 self.spot_integration_width_ij,
                 centered=True,
                 integrate=True
@@ -825,7 +1254,7 @@ class CompressedSpotHologram(_AbstractSpotHologram):
 
             pwr_feedback = analysis.take(
                 pwr_img,
-                self.spot_ij,
+                self._get_spot_ij(),
                 self.spot_integration_width_ij,
                 centered=True,
                 integrate=True
@@ -1439,10 +1868,12 @@ class SpotHologram(_AbstractSpotHologram):
             elif feedback == "experimental_spot":
                 self.measure(basis="ij")
 
+                pwr_img = np.square(np.array(self.img_ij, copy=(False if np.__version__[0] == '1' else None), dtype=self.dtype))
+
                 amp_feedback = np.sqrt(
                     analysis.take(
-                        np.square(np.array(self.img_ij, copy=(False if np.__version__[0] == '1' else None), dtype=self.dtype)),
-                        self.spot_ij,
+                        pwr_img,
+                        self._get_spot_ij(pwr_img),
                         self.spot_integration_width_ij,
                         centered=True,
                         integrate=True,
@@ -1529,7 +1960,7 @@ class SpotHologram(_AbstractSpotHologram):
             pwr_img = np.square(self.img_ij)
 
             pwr_feedback = analysis.take(
-                pwr_img, self.spot_ij, self.spot_integration_width_ij, centered=True, integrate=True
+                pwr_img, self._get_spot_ij(), self.spot_integration_width_ij, centered=True, integrate=True
             )
 
             stats["experimental_spot"] = self._calculate_stats(
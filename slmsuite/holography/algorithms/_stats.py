@@ -1,5 +1,9 @@
 from slmsuite.holography.algorithms._header import *
 
+import time
+import tracemalloc
+import contextlib
+
 class _HologramStats(object):
 
     # Statistics handling.
@@ -222,9 +226,103 @@ class _HologramStats(object):
 
         self._update_stats_dictionary(stats)
 
+    # Profiling.
+    def _profile_begin(self):
+        """
+        Prepares per-stage profiling if the ``"profile"`` flag is set.
+        Must be paired with :meth:`_profile_end()`. See :meth:`_profile_stage()`.
+        """
+        if not self.flags.get("profile", False):
+            self._profile_state = None
+            return
+
+        if not "profile" in self.stats:
+            self.stats["profile"] = {}
+
+        # numpy reports allocations to tracemalloc; cupy allocations are counted by the pool.
+        trace = cp == np and not tracemalloc.is_tracing()
+        if trace:
+            tracemalloc.start()
+
+        self._profile_state = {"tracemalloc": trace}
+
+    def _profile_end(self):
+        """Stops any memory tracing started by :meth:`_profile_begin()`."""
+        state = getattr(self, "_profile_state", None)
+
+        if state is not None and state["tracemalloc"]:
+            tracemalloc.stop()
+
+        self._profile_state = None
+
+    @contextlib.contextmanager
+    def _profile_stage(self, stage):
+        """
+        Context manager which records, for the current iteration, the following
+        statistics of the enclosed ``stage`` of the optimization loop in
+        ``self.stats["profile"][stage]``:
+
+        - ``"time"`` : Wall time of the stage in seconds, including device synchronization.
+        - ``"sync"`` : Time in seconds spent waiting at the device synchronization point
+          after the stage (i.e. GPU work which was still queued when the host finished).
+          Always near zero for :mod:`numpy`.
+        - ``"bytes"`` : For :mod:`numpy`, the peak memory allocated during the stage
+          (via :mod:`tracemalloc`; the net change in traced memory on Python 3.8, which
+          lacks :func:`tracemalloc.reset_peak`). For :mod:`cupy`, the net change in memory held by the
+          default memory pool.
+
+        Does nothing if profiling is not enabled.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the stage.
+        """
+        if getattr(self, "_profile_state", None) is None:
+            yield
+            return
+
+        # tracemalloc.reset_peak() requires Python 3.9+.
+        peak = hasattr(tracemalloc, "reset_peak")
+
+        if cp == np:
+            if peak:
+                tracemalloc.reset_peak()
+            bytes_start = tracemalloc.get_traced_memory()[0]
+        else:
+            cp.cuda.get_current_stream().synchronize()
+            bytes_start = cp.get_default_memory_pool().used_bytes()
+
+        t_start = time.perf_counter()
+
+        yield
+
+        t_sync = time.perf_counter()
+        if cp == np:
+            bytes_stage = tracemalloc.get_traced_memory()[1 if peak else 0] - bytes_start
+        else:
+            cp.cuda.get_current_stream().synchronize()
+            bytes_stage = cp.get_default_memory_pool().used_bytes() - bytes_start
+        t_end = time.perf_counter()
+
+        profile = self.stats["profile"]
+        if not stage in profile:
+            profile[stage] = {"time": [], "sync": [], "bytes": []}
+
+        for key, value in zip(
+            ["time", "sync", "bytes"],
+            [t_end - t_start, t_end - t_sync, float(bytes_stage)]
+        ):
+            diff = self.iter + 1 - len(profile[stage][key])
+            if diff > 0:
+                profile[stage][key].extend([np.nan for _ in range(diff)])
+            profile[stage][key][self.iter] = value
+
     def write_stats(self, file_path, include_state=True):
         """
         Uses :meth:`write_h5` to export the statistics hierarchy to a given h5 file.
+        This includes the per-stage timings in ``stats["profile"]`` if
+        :meth:`optimize()` was called with ``profile=True``.
 
         Parameters
         ----------
@@ -483,13 +581,16 @@ class _HologramStats(object):
 
             if source is None or len(source.shape) == 1:
                 source = self.get_farfield(get=False)
+            elif not self._fft_shift:   # Called mid-optimization in the unshifted basis.
+                source = cp.fft.fftshift(source)
 
             if limits is None:
                 if len(self.target.shape) == 2:
+                    target = self.target if self._fft_shift else cp.fft.fftshift(self.target)
                     if np == cp:
-                        limits = self._compute_limits(self.target, limit_padding=limit_padding)
+                        limits = self._compute_limits(target, limit_padding=limit_padding)
                     else:
-                        limits = self._compute_limits(self.target.get(), limit_padding=limit_padding)
+                        limits = self._compute_limits(target.get(), limit_padding=limit_padding)
 
             if len(title) == 0:
                 title = "Farfield Amplitude"
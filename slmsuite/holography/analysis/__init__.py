@@ -6,10 +6,10 @@ import cv2
 import numpy as np
 import matplotlib
 import matplotlib.pyplot as plt
-from functools import reduce
 from scipy.optimize import curve_fit, minimize
 from scipy.ndimage import binary_erosion
 import warnings
+from functools import lru_cache
 try:
     import cupy as cp   # type: ignore
 except ImportError:
@@ -18,7 +18,10 @@ except ImportError:
 from slmsuite.holography.toolbox import format_2vectors, _process_grid
 from slmsuite.holography.toolbox.phase import zernike_sum, laguerre_gaussian
 from slmsuite.misc.math import REAL_TYPES
-from slmsuite.holography.analysis.fitfunctions import gaussian2d
+from slmsuite.holography.analysis.fitfunctions import (
+    gaussian2d, gaussian2d_jacobian, tophat2d, tophat2d_jacobian,
+    sinc2d, sinc2d_jacobian, lorentzian, lorentzian_jacobian
+)
 
 # Take and associated functions.
 
@@ -56,6 +59,166 @@ def _generate_grid(w_x, w_y, centered=False, integer=False):
     return grid
 
 
+class TakePlan():
+    """
+    Precomputed integration regions for :meth:`take()`, for repeatedly gathering
+    regions around fixed ``vectors`` from images of a fixed shape.
+
+    The meshgrid, the integration indices, and the clip mask are computed once and
+    stored as flat indices into the image, such that each call is a single
+    :meth:`numpy.take` (or :meth:`cupy.take`) over the last two axes,
+    followed by a sum if integrating. Plans for :mod:`cupy` keep their indices on the GPU.
+
+    Tip
+    ~~~
+    :meth:`take()` caches recently used plans, so feedback loops calling :meth:`take()`
+    with the same arguments benefit without change. Construct a :class:`TakePlan`
+    directly to skip the cache lookup (which hashes ``vectors``).
+
+    Attributes
+    ----------
+    vectors : numpy.ndarray
+        Region anchors of shape ``(2, V)``.
+    size : (int, int)
+        Size ``(w, h)`` of each region.
+    shape : (int, int)
+        Shape ``(H, W)`` of the images.
+    index : numpy.ndarray OR cupy.ndarray
+        Flat indices into the image of shape ``(V, h*w)``.
+    mask : numpy.ndarray OR None
+        Boolean array of shape ``(V, h*w)`` flagging indices which were out of range
+        and clipped, or ``None`` if no index was clipped.
+    """
+
+    def __init__(self, vectors, size, shape, centered=True, clip=False, xp=None):
+        """
+        Computes the integration indices. See :meth:`take()` for the parameters.
+
+        Parameters
+        ----------
+        shape : (int, int)
+            Shape ``(H, W)`` of the images (the last two axes).
+
+        Raises
+        ------
+        IndexError
+            If ``clip`` is ``False`` and a region is out of range.
+        """
+        # Clean variables.
+        if isinstance(size, REAL_TYPES):
+            size = int(size)
+            size = (size, size)
+        else:
+            size = (int(size[0]), int(size[1]))
+
+        self.vectors = format_2vectors(vectors)
+        self.size = size
+        self.shape = (int(shape[-2]), int(shape[-1]))
+        self.xp = np if xp is None else xp
+        (height, width) = self.shape
+
+        # Prepare helper variables.
+        edge_x = _coordinates(size[0], centered)
+        edge_y = _coordinates(size[1], centered)
+
+        region_x, region_y = np.meshgrid(edge_x, edge_y)
+
+        # Get the lists for the integration regions.
+        integration_x = np.rint(np.add(
+            region_x.ravel()[:, np.newaxis].T, self.vectors[:][0][:, np.newaxis]
+        )).astype(int)
+        integration_y = np.rint(np.add(
+            region_y.ravel()[:, np.newaxis].T, self.vectors[:][1][:, np.newaxis]
+        )).astype(int)
+
+        self.mask = None
+        if clip:  # Prevent out-of-range errors by clipping.
+            mask = (
+                (integration_x < 0) | (integration_x >= width) |
+                (integration_y < 0) | (integration_y >= height)
+            )
+
+            if np.any(mask):
+                # Clip these indices to prevent errors.
+                np.clip(integration_x, 0, width - 1, out=integration_x)
+                np.clip(integration_y, 0, height - 1, out=integration_y)
+                self.mask = mask
+        else:
+            # Error upon out-of-range, wrapping negative indices as numpy indexing does.
+            for (integration, length) in [(integration_x, width), (integration_y, height)]:
+                if np.any(integration >= length) or np.any(integration < -length):
+                    raise IndexError(
+                        "Integration region out of range for images of shape {}.".format(self.shape)
+                    )
+                integration[integration < 0] += length
+
+        self.index = self.xp.asarray(integration_y * width + integration_x)
+        if self.mask is not None:
+            self._mask_xp = self.xp.asarray(self.mask)
+
+    def __call__(self, images, integrate=False):
+        """
+        Gathers the regions from ``images``. See :meth:`take()`.
+
+        Parameters
+        ----------
+        images : array_like
+            2D image or ``(N, H, W)`` stack of images.
+        integrate : bool
+            Whether to sum each region.
+
+        Returns
+        -------
+        numpy.ndarray OR cupy.ndarray
+            If ``integrate`` is ``False``, regions of shape ``(V, h, w)``, or
+            ``(N, V, h, w)`` for a stack of ``N > 1`` images.
+            A ``(1, H, W)`` stack yields ``(V, h, w)``, as for a 2D image.
+            If ``integrate`` is ``True``, the (squeezed) float sums of the regions,
+            of shape ``(V,)`` or ``(N, V)``.
+        """
+        xp = self.xp
+        images = xp.asarray(images)
+        shape = images.shape
+
+        if len(shape) not in [2, 3]:
+            raise RuntimeError("Unexpected shape for images: {}".format(shape))
+        if shape[-2:] != self.shape:
+            raise ValueError(
+                "Expected images of shape {}. Found {}.".format(self.shape, shape[-2:])
+            )
+
+        # Take the data from the flattened images.
+        flat = xp.reshape(images, shape[:-2] + (self.shape[0] * self.shape[1],))
+        result = xp.take(flat, self.index, axis=-1)
+
+        if self.mask is not None:  # Set values that were out of range to nan (or zero).
+            result[..., self._mask_xp] = np.nan if result.dtype.kind in "fc" else 0
+
+        if integrate:  # Sum over the integration axis.
+            return xp.squeeze(xp.sum(result, axis=-1, dtype=float))
+        else:  # Reshape the integration axis, dropping the stack axis for a single image.
+            if len(shape) == 3 and shape[0] == 1:
+                result = result[0]
+            return xp.reshape(result, result.shape[:-1] + (self.size[1], self.size[0]))
+
+    def get_mask(self):
+        """
+        Returns a boolean mask of shape :attr:`shape` corresponding to the regions
+        which are taken from.
+        """
+        canvas = np.zeros(self.shape, dtype=bool)
+        index = self.index.get() if hasattr(self.index, "get") else self.index
+        canvas.ravel()[index.ravel()] = True
+        return canvas
+
+
+@lru_cache(maxsize=32)
+def _take_plan_cached(vectors_bytes, vector_count, size, shape, centered, clip, xp_name):
+    vectors = np.frombuffer(vectors_bytes, dtype=float).reshape((2, vector_count))
+    xp = cp if xp_name == "cupy" else np
+    return TakePlan(vectors, size, shape, centered=centered, clip=clip, xp=xp)
+
+
 def take(
         images,
         vectors,
@@ -73,6 +236,8 @@ def take(
     Each integration region is a rectangle of the same ``size``. Similar to but more
     general than :meth:`numpy.take`. Useful for gathering data from spots in spot
     arrays. Operates with some speed due to the vectorized nature of implemented slicing.
+    The integration indices are cached as a :class:`TakePlan`, such that repeated calls
+    with the same ``vectors``, ``size``, and image shape skip their construction.
 
     Parameters
     ----------
@@ -108,66 +273,43 @@ def take(
         If ``images`` are :mod:`cupy` objects, then :mod:`cupy` must be passed as
         ``xp``. Very useful to minimize the cost of moving data between the GPU and CPU.
         If ``None``, defaults to :mod:`numpy`.
-        Indexing variables inside `:meth:`take` still use :mod:`numpy` for speed, no
-        matter what module is used.
+        The cached indices of the :class:`TakePlan` are kept on the same device.
 
     Returns
     -------
     numpy.ndarray OR cupy.ndarray
         If ``integrate`` is ``False``, returns an array containing the images cropped
-        from the regions of size ``(image_count, h, w)``.
+        from the regions of size ``(image_count, h, w)``
+        (or ``(N, image_count, h, w)`` for a stack of ``N > 1`` images).
         If ``integrate`` is ``True``, instead returns an array of floats of size ``(image_count,)``
         where each float corresponds to the :meth:`numpy.sum` of a cropped image.
         If ``xp`` is :mod:`cupy`, then a ``cupy.ndarray`` is returned.
     """
-    # Clean variables.
-    if isinstance(size, REAL_TYPES):
-        size = int(size)
-        size = (size, size)
-    else:
-        size = (int(size[0]), int(size[1]))
-
-    vectors = format_2vectors(vectors)
-
     if xp is None:
         xp = np
 
-    # Prepare helper variables. Future: consider caching for speed, if not negligible.
-    edge_x = _coordinates(size[0], centered)
-    edge_y = _coordinates(size[1], centered)
-
-    region_x, region_y = np.meshgrid(edge_x, edge_y)
+    if isinstance(size, REAL_TYPES):
+        size = (int(size), int(size))
+    else:
+        size = (int(size[0]), int(size[1]))
 
-    # Get the lists for the integration regions.
-    integration_x = np.rint(np.add(
-        region_x.ravel()[:, np.newaxis].T, vectors[:][0][:, np.newaxis]
-    )).astype(int)
-    integration_y = np.rint(np.add(
-        region_y.ravel()[:, np.newaxis].T, vectors[:][1][:, np.newaxis]
-    )).astype(int)
+    vectors = np.ascontiguousarray(format_2vectors(vectors), dtype=float)
 
     images = xp.array(images, copy=(False if np.__version__[0] == '1' else None))
     shape = xp.shape(images)
 
-    if clip:  # Prevent out-of-range errors by clipping.
-        mask = (
-            (integration_x < 0) | (integration_x >= shape[-1]) |
-            (integration_y < 0) | (integration_y >= shape[-2])
-        )
-
-        if np.any(mask):
-            # Clip these indices to prevent errors.
-            np.clip(integration_x, 0, shape[-1] - 1, out=integration_x)
-            np.clip(integration_y, 0, shape[-2] - 1, out=integration_y)
-        else:
-            # No clipping needed.
-            clip = False
-    else:
-        pass  # Don't prevent out-of-range errors.
+    plan = _take_plan_cached(
+        vectors.tobytes(),
+        vectors.shape[1],
+        size,
+        tuple(int(s) for s in shape[-2:]),
+        bool(centered),
+        bool(clip),
+        xp.__name__
+    )
 
     if return_mask:
-        canvas = np.zeros(shape[:2], dtype=bool)
-        canvas[integration_y, integration_x] = True
+        canvas = plan.get_mask()
 
         if plot:
             plt.imshow(canvas)
@@ -175,26 +317,7 @@ def take(
 
         return canvas
     else:
-        # Take the data, depending on the shape of the images.
-        if len(shape) == 2:
-            result = images[np.newaxis, integration_y, integration_x]
-        elif len(shape) == 3:
-            result = images[:, integration_y, integration_x]
-        else:
-            raise RuntimeError("Unexpected shape for images: {}".format(shape))
-
-        if clip:  # Set values that were out of range to nan instead of erroring.
-            try:  # If the datatype of result is incompatible with nan, set to zero instead.
-                result[:, mask] = np.nan
-            except:
-                result[:, mask] = 0
-        else:
-            pass
-
-        if integrate:  # Sum over the integration axis.
-            return xp.squeeze(xp.sum(result.astype(float), axis=-1))
-        else:  # Reshape the integration axis.
-            return xp.reshape(result, (vectors.shape[1], size[1], size[0]))
+        return plan(images, integrate=integrate)
 
 
 def take_plot(images):
@@ -236,6 +359,292 @@ def take_plot(images):
     plt.show()
 
 
+class SpotTracker():
+    """
+    Tracks the sub-pixel positions of many spots across frames, starting from the
+    last known positions rather than detecting spots in the full frame.
+
+    Each :meth:`update()` extracts small windows around the current positions (see
+    :class:`TakePlan`), removes the background of each window (the median of its
+    border), and moves each spot to the intensity-weighted centroid of its window.
+    This is iterated until the positions are stable, such that the cost per frame is :math:`O(N w^2)` for
+    ``N`` spots with window width ``w``, independent of the frame size.
+    Optionally, the centroids are refined with a batched Gaussian fit
+    (see :meth:`image_fit()`).
+
+    Spots whose windowed power drops below ``threshold`` times their reference power
+    (or below ``snr`` times the noise of the power, estimated from the spread of the
+    window border), or which move more than ``max_shift`` from their origin, are
+    flagged as :attr:`lost` and are no longer moved. Lost spots can be re-acquired with
+    :meth:`redetect()` or re-seeded with :meth:`reset()`
+    (e.g. after a :meth:`blob_detect()`).
+
+    Attributes
+    ----------
+    positions : numpy.ndarray
+        Current spot positions of shape ``(2, N)`` in pixels.
+    origins : numpy.ndarray
+        Positions of shape ``(2, N)`` which the spots were seeded at with :meth:`reset()`.
+    size : (int, int)
+        Size ``(w, h)`` of the tracking windows.
+    lost : numpy.ndarray of bool
+        Flags spots which were lost and should be re-detected.
+    powers : numpy.ndarray
+        Background-subtracted power of each window for the latest frame.
+    reference : numpy.ndarray
+        Power of each spot upon the first frame after :meth:`reset()` where it is
+        visible above the noise. Kept by :meth:`redetect()`.
+    """
+
+    def __init__(
+        self,
+        positions,
+        size,
+        method="centroid",
+        iterations=3,
+        tolerance=.05,
+        threshold=.1,
+        snr=5,
+        noise=0,
+        max_shift=None,
+    ):
+        """
+        Initializes the tracker at known spot positions.
+
+        Parameters
+        ----------
+        positions : array_like
+            Initial spot positions. See :meth:`~slmsuite.holography.toolbox.format_2vectors()`.
+        size : int OR (int, int)
+            Size of the window around each spot in ``(w, h)`` format, as for :meth:`take()`.
+        method : str
+            ``"centroid"`` (iterative weighted centroid) or ``"gaussian"``
+            (centroid followed by a batched :meth:`image_fit()`).
+        iterations : int
+            Maximum number of centroid iterations per frame.
+        tolerance : float
+            Centroid iteration stops when no spot moves more than this many pixels.
+        threshold : float
+            Spots whose power drops below this fraction of their reference are lost.
+        snr : float
+            Spots whose power drops below this multiple of its noise are lost.
+        noise : float
+            Lower bound on the per-pixel noise estimated from each window border,
+            e.g. the read noise or quantization step of the camera. This prevents
+            noise-free (e.g. dark or simulated) frames from making every speck visible.
+        max_shift : float OR None
+            Spots which move further than this from their origin are lost.
+            Defaults to the window size.
+        """
+        if isinstance(size, REAL_TYPES):
+            size = (int(size), int(size))
+        self.size = (int(size[0]), int(size[1]))
+
+        if not method in ["centroid", "gaussian"]:
+            raise ValueError("SpotTracker method '{}' not recognized.".format(method))
+        self.method = method
+
+        self.iterations = int(iterations)
+        self.tolerance = float(tolerance)
+        self.threshold = float(threshold)
+        self.snr = float(snr)
+        self.noise = float(noise)
+        self.max_shift = float(max(self.size) if max_shift is None else max_shift)
+
+        # Window pixels used to estimate the background.
+        border = np.ones((self.size[1], self.size[0]), dtype=bool)
+        border[1:-1, 1:-1] = False
+        self._border = border.ravel()
+
+        self.reset(positions)
+
+    def reset(self, positions, indices=None):
+        """
+        (Re-)seeds spots at ``positions``, clearing their :attr:`lost` flags.
+
+        Parameters
+        ----------
+        positions : array_like
+            New positions of shape ``(2, N)``, or ``(2, len(indices))``.
+        indices : array_like of int OR None
+            Spots to re-seed. If ``None``, all spots are replaced.
+        """
+        positions = format_2vectors(positions).astype(float)
+
+        if indices is None:
+            self.positions = positions.copy()
+            self.origins = positions.copy()
+            self.lost = np.zeros(positions.shape[1], dtype=bool)
+            self.powers = np.full(positions.shape[1], np.nan)
+            self.reference = np.full(positions.shape[1], np.nan)
+        else:
+            indices = np.ravel(indices).astype(int)
+            self.positions[:, indices] = positions
+            self.origins[:, indices] = positions
+            self.lost[indices] = False
+            self.reference[indices] = np.nan
+
+    def _centroid(self, image, indices, positions=None):
+        """
+        Background-subtracted windows, their powers, the noise of these powers, and
+        the weighted centroids for the spots ``indices`` (at ``positions``, if given).
+        """
+        if positions is None:
+            positions = self.positions[:, indices]
+
+        plan = TakePlan(positions, self.size, image.shape, clip=True)
+        windows = np.reshape(plan(image).astype(float), (len(indices), -1))
+        if plan.mask is not None:
+            windows[plan.mask] = np.nan
+
+        # Estimate the background and its noise from the border of each window.
+        # Unlike the minimum, the median does not leave a noise floor in the power, and
+        # the median absolute deviation is robust to a spot overlapping the border.
+        border = windows[:, self._border]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            background = np.nanmedian(border, axis=1)
+            deviation = 1.4826 * np.nanmedian(np.abs(border - background[:, np.newaxis]), axis=1)
+        deviation = np.fmax(deviation, self.noise)
+
+        count = np.sum(np.isfinite(windows), axis=1)
+        windows -= background[:, np.newaxis]
+        windows = np.nan_to_num(windows, copy=False)
+
+        # The power is unbiased, whereas only positive pixels weight the centroid.
+        powers = np.sum(windows, axis=1)
+        noise = deviation * np.sqrt(count)
+
+        weights = np.clip(windows, 0, None)
+        total = np.sum(weights, axis=1)
+        reciprocal = np.reciprocal(total, where=total > 0, out=np.zeros_like(total))
+
+        # Absolute pixel coordinates of each window pixel.
+        (y, x) = np.divmod(plan.index, image.shape[1])
+        centroids = np.vstack((
+            np.sum(weights * x, axis=1) * reciprocal,
+            np.sum(weights * y, axis=1) * reciprocal,
+        ))
+
+        return windows, powers, noise, centroids
+
+    def _floor(self, indices, noise):
+        """Power which the spots ``indices`` must exceed to not be lost."""
+        return np.fmax(self.threshold * self.reference[indices], self.snr * noise)
+
+    def update(self, image):
+        """
+        Moves the (non-lost) spots to their positions in ``image``.
+
+        Parameters
+        ----------
+        image : array_like
+            2D intensity image.
+
+        Returns
+        -------
+        numpy.ndarray
+            :attr:`positions`, of shape ``(2, N)``.
+        """
+        image = np.asarray(image.get() if hasattr(image, "get") else image)
+        if image.ndim != 2:
+            raise ValueError("SpotTracker expects a 2D image.")
+
+        active = np.flatnonzero(np.logical_not(self.lost))
+        noise = np.zeros(active.size)
+
+        for _ in range(self.iterations):
+            if active.size == 0:
+                break
+
+            (windows, powers, noise, centroids) = self._centroid(image, active)
+
+            # Spots which are not visible above the noise are not moved.
+            visible = powers > self.snr * noise
+            shift = np.where(visible, centroids - self.positions[:, active], 0)
+            self.positions[:, active] += shift
+            self.powers[active] = powers
+
+            if np.max(np.abs(shift)) < self.tolerance:
+                break
+
+        if self.method == "gaussian" and active.size > 0:
+            # Refine with a batched Gaussian fit upon windows centered on the centroids.
+            (windows, powers, noise, _) = self._centroid(image, active)
+            windows = np.reshape(windows, (active.size, self.size[1], self.size[0]))
+
+            fit = image_fit(windows, batched=True)
+            offsets = fit[:, 1:3].T
+            fine = np.all(np.isfinite(offsets), axis=0) & (np.max(np.abs(offsets), axis=0) < 1)
+
+            # Window pixels are centered upon the rounded positions.
+            center = np.array([[_center(self.size[0])], [_center(self.size[1])]])
+            rounded = np.rint(self.positions[:, active] - center) + center
+            self.positions[:, active[fine]] = (rounded + offsets)[:, fine]
+
+        # The reference power is taken from the first frame where the spot is visible
+        # above the noise, such that an initial dark frame does not lose every spot.
+        unset = np.logical_not(self.reference[active] > 0) & (self.powers[active] > self.snr * noise)
+        self.reference[active[unset]] = self.powers[active[unset]]
+
+        distance = np.sqrt(np.sum(np.square(self.positions[:, active] - self.origins[:, active]), axis=0))
+        lost = (
+            ((self.reference[active] > 0) & np.logical_not(self.powers[active] > self._floor(active, noise)))
+            | (distance > self.max_shift)
+        )
+        self.lost[active[lost]] = True
+
+        return self.positions
+
+    def redetect(self, image, search=3):
+        """
+        Attempts to re-acquire :attr:`lost` spots, searching a window ``search`` times
+        larger than :attr:`size` around each lost spot's origin for its brightest pixel.
+        A spot is moved there and un-flagged only if the window around this pixel
+        clears the same power test as :meth:`update()`, against the spot's original
+        :attr:`reference`, and lies within ``max_shift`` of the origin.
+        Call :meth:`update()` afterward to refine.
+
+        Parameters
+        ----------
+        image : array_like
+            2D intensity image.
+        search : float
+            Size of the search window relative to :attr:`size`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Indices of the re-acquired spots.
+        """
+        image = np.asarray(image.get() if hasattr(image, "get") else image)
+        indices = np.flatnonzero(self.lost)
+        if indices.size == 0:
+            return indices
+
+        size = tuple(int(search * s) | 1 for s in self.size)
+        plan = TakePlan(self.origins[:, indices], size, image.shape, clip=True)
+        windows = plan(image).astype(float)
+        windows = np.reshape(windows, (indices.size, -1))
+        if plan.mask is not None:
+            windows[plan.mask] = -np.inf
+
+        brightest = np.take_along_axis(plan.index, np.argmax(windows, axis=1)[:, np.newaxis], 1)[:, 0]
+        (y, x) = np.divmod(brightest, image.shape[1])
+        candidates = np.vstack((x, y)).astype(float)
+
+        (_, powers, noise, _) = self._centroid(image, indices, candidates)
+        distance = np.sqrt(np.sum(np.square(candidates - self.origins[:, indices]), axis=0))
+        found = (powers > self._floor(indices, noise)) & (distance <= self.max_shift)
+
+        indices = indices[found]
+        self.positions[:, indices] = candidates[:, found]
+        self.powers[indices] = powers[found]
+        self.lost[indices] = False
+
+        return indices
+
+
 def image_remove_field(images, deviations=1, out=None):
     r"""
     Zeros the field of a stack of images such that moment calculations will succeed.
@@ -412,6 +821,17 @@ def image_moment(images, moment=(1, 0), centers=(0, 0), grid=None, normalize=Tru
         else:
             return np_sum(images, axis=(1, 2), keepdims=False)
     else:
+        axes = _moment_axes(grid, w_x, w_y)
+
+        if axes is not None:
+            # Separable grid: reduce to marginals, avoiding full-size temporaries.
+            return _image_moment_separable(
+                images, moment, centers, axes, reciprocal, nansum
+            )
+
+        if normalize:
+            reciprocal = np.reshape(reciprocal, (img_count, 1, 1))
+
         if len(np.shape(centers)) == 2:
             c_x = np.reshape(centers[0], (img_count, 1, 1))
             c_y = np.reshape(centers[1], (img_count, 1, 1))
@@ -470,6 +890,146 @@ def image_moment(images, moment=(1, 0), centers=(0, 0), grid=None, normalize=Tru
             return np_sum(images * x_grid * y_grid * reciprocal, axis=(1, 2), keepdims=False)
 
 
+def _image_moment_separable(images, moment, centers, axes, reciprocal, nansum):
+    """
+    :meth:`image_moment()` for separable grids. The images are first reduced to row or
+    column marginals (or, for shear moments, a single pass weighting the rows), such that
+    the moment costs :math:`O(HW)` reads but only :math:`O(H + W)` arithmetic per image.
+    """
+    (img_count, w_y, w_x) = images.shape
+    (x, y) = axes
+
+    if len(np.shape(centers)) == 2:
+        c_x = np.reshape(centers[0], (img_count, 1))
+        c_y = np.reshape(centers[1], (img_count, 1))
+    else:
+        c_x = centers[0]
+        c_y = centers[1]
+
+    np_sum = np.nansum if nansum else np.sum
+
+    # Polynomial weights of shape (1 or image_count, w) and (1 or image_count, h).
+    weight_x = np.power(np.reshape(x, (1, w_x)) - c_x, moment[0])
+    weight_y = np.power(np.reshape(y, (1, w_y)) - c_y, moment[1])
+
+    if moment[1] == 0:      # Only-x case: column marginals.
+        marginal = np_sum(images, axis=1)
+        result = np.sum(marginal * weight_x, axis=1)
+    elif moment[0] == 0:    # Only-y case: row marginals.
+        marginal = np_sum(images, axis=2)
+        result = np.sum(marginal * weight_y, axis=1)
+    else:                   # Shear case: weight the rows in one pass, then the columns.
+        if nansum and np.any(np.isnan(images)):
+            images = np.where(np.isnan(images), 0, images)
+
+        weight_y = np.broadcast_to(weight_y, (img_count, w_y))
+        marginal = np.matmul(weight_y[:, np.newaxis, :], images)[:, 0, :]
+        result = np.sum(marginal * weight_x, axis=1)
+
+    return result * reciprocal
+
+
+def _moment_axes(grid, w_x, w_y):
+    """
+    Parses ``grid`` (see :meth:`image_moment()`) into 1D coordinates ``(x, y)`` of
+    lengths ``w_x`` and ``w_y``, or ``None`` if the grid is not separable.
+    """
+    if grid is None or np.isscalar(grid) or (np.isscalar(grid[0]) and np.isscalar(grid[1])):
+        x = np.arange(w_x) - _center(w_x)
+        y = np.arange(w_y) - _center(w_y)
+
+        if grid is not None:    # Handle the dx, dy option.
+            if np.isscalar(grid):
+                (dx, dy) = (grid, grid)
+            else:
+                (dx, dy) = grid
+            x = x * dx
+            y = y * dy
+
+        return x, y
+    elif len(np.shape(grid[0])) == 1 and len(np.shape(grid[1])) == 1:
+        return np.ravel(grid[0]), np.ravel(grid[1])
+    else:
+        return None
+
+
+def image_moments(images, order=2, grid=None, normalize=True, nansum=False):
+    r"""
+    Computes all raw moments :math:`M_{m_xm_y}` (see :meth:`image_moment()`) with
+    :math:`m_x + m_y \leq` ``order`` for a stack of images in a single pass.
+
+    The images are projected against the powers of the :math:`y` coordinates with one
+    batched matrix product, yielding small ``(image_count, order+1, w)`` row projections,
+    which are then contracted against the powers of the :math:`x` coordinates.
+    Unlike repeated calls to :meth:`image_moment()`, no temporaries of the size of the
+    stack are allocated, and the stack is read once for all moments.
+
+    Parameters
+    ----------
+    images : numpy.ndarray OR cupy.ndarray
+        A matrix in the style of the output of :meth:`take()`, with shape ``(image_count, h, w)``.
+        A single image is interpreted correctly as ``(1, h, w)`` even if
+        ``(h, w)`` is passed.
+    order : int
+        Maximum total order :math:`m_x + m_y` of the moments.
+    grid : float OR (float, float) OR (array_like, array_like) OR None
+        See :meth:`image_moment()`. Only separable grids (scaling factors or 1D lists)
+        are supported.
+    normalize : bool
+        Whether to normalize the moments by :math:`M_{00}`.
+        If ``False``, normalization is assumed to have been precomputed.
+    nansum : bool
+        Whether to treat ``nan`` values as zeros.
+
+    Returns
+    -------
+    dict
+        Maps each ``(m_x, m_y)`` to the moment evaluated for every image, of shape
+        ``(image_count,)``. If ``normalize``, ``(0, 0)`` is unity
+        (or zero for images which sum to zero).
+
+    Raises
+    ------
+    ValueError
+        If ``grid`` is not separable.
+    """
+    xp = get_module(images)
+    images = xp.asarray(images)
+    if len(images.shape) == 2:
+        images = xp.reshape(images, (1, images.shape[0], images.shape[1]))
+    (img_count, w_y, w_x) = images.shape
+    order = int(order)
+
+    axes = _moment_axes(grid, w_x, w_y)
+    if axes is None:
+        raise ValueError("image_moments() requires a separable grid.")
+    (x, y) = axes
+
+    if nansum:
+        images = xp.where(xp.isnan(images), 0, images)
+
+    powers = np.arange(order + 1)
+    x_powers = xp.asarray(np.power.outer(np.asarray(x, dtype=float), powers))  # (w, K)
+    y_powers = xp.asarray(np.power.outer(np.asarray(y, dtype=float), powers))  # (h, K)
+
+    # Single pass over the stack: rows[n, m_y, x] = sum_y y^m_y P(x, y).
+    rows = xp.matmul(y_powers.T, images.astype(float, copy=False))
+    table = xp.matmul(rows, x_powers)                                           # (N, m_y, m_x)
+
+    if normalize:
+        normalization = table[:, 0, 0]
+        reciprocal = xp.zeros(img_count)
+        nonzero = normalization != 0
+        reciprocal[nonzero] = 1 / normalization[nonzero]
+        table = table * reciprocal[:, np.newaxis, np.newaxis]
+
+    return {
+        (m_x, m_y): table[:, m_y, m_x]
+        for m_x in range(order + 1)
+        for m_y in range(order + 1 - m_x)
+    }
+
+
 def image_normalization(images, nansum=False):
     """
     Computes the zeroth order moments, equivalent to spot mass or normalization,
@@ -573,6 +1133,15 @@ def image_positions(images, grid=None, normalize=True, nansum=False):
     numpy.ndarray
         Stack of :math:`M_{10}`, :math:`M_{01}` in an array of shape ``(2, image_count)``.
     """
+    images = np.array(images, copy=(False if np.__version__[0] == '1' else None))
+    if len(images.shape) == 2:
+        images = np.reshape(images, (1, images.shape[0], images.shape[1]))
+
+    if _moment_axes(grid, images.shape[2], images.shape[1]) is not None:
+        # Fused single-pass moments.
+        moments = image_moments(images, order=1, grid=grid, normalize=normalize, nansum=nansum)
+        return np.vstack((moments[(1, 0)], moments[(0, 1)]))
+
     if normalize:
         images = image_normalize(images, nansum=nansum)
 
@@ -648,11 +1217,33 @@ def image_variances(images, centers=None, grid=None, normalize=True, nansum=Fals
         Stack of :math:`M_{20}` and :math:`M_{02}`
         in an array of shape ``(2, image_count)``.
     """
+    images = np.array(images, copy=(False if np.__version__[0] == '1' else None))
+    if len(images.shape) == 2:
+        images = np.reshape(images, (1, images.shape[0], images.shape[1]))
+
+    if _moment_axes(grid, images.shape[2], images.shape[1]) is not None:
+        # Fused single-pass moments, made central with the given or computed centers.
+        m = image_moments(images, order=2, grid=grid, normalize=normalize, nansum=nansum)
+
+        if centers is None:
+            (c_x, c_y) = (m[(1, 0)], m[(0, 1)])
+        else:
+            (c_x, c_y) = (centers[0], centers[1])
+
+        m20 = m[(2, 0)] - 2 * c_x * m[(1, 0)] + c_x * c_x * m[(0, 0)]
+        m02 = m[(0, 2)] - 2 * c_y * m[(0, 1)] + c_y * c_y * m[(0, 0)]
+
+        if exclude_shear:
+            return np.vstack((m20, m02))
+        else:
+            m11 = m[(1, 1)] - c_x * m[(0, 1)] - c_y * m[(1, 0)] + c_x * c_y * m[(0, 0)]
+            return np.vstack((m20, m02, m11))
+
     if normalize:
         images = image_normalize(images, nansum=nansum)
 
     if centers is None:
-        centers = image_positions(images, normalize=False, nansum=nansum)
+        centers = image_positions(images, grid=grid, normalize=False, nansum=nansum)
 
     m20 = image_moment(images, (2, 0), centers=centers, grid=grid, normalize=False, nansum=nansum)
     m02 = image_moment(images, (0, 2), centers=centers, grid=grid, normalize=False, nansum=nansum)
@@ -791,7 +1382,173 @@ def image_ellipticity_angle(variances):
 #     pass
 
 
-def image_fit(images, grid=None, function=gaussian2d, guess=None, plot=False):
+_FIT_JACOBIANS_2D = {
+    gaussian2d: gaussian2d_jacobian,
+    tophat2d: tophat2d_jacobian,
+    sinc2d: sinc2d_jacobian,
+}
+_FIT_JACOBIANS = {
+    **_FIT_JACOBIANS_2D,
+    lorentzian: lorentzian_jacobian,
+}
+
+
+def fit_batched(function, x, data, guess, jacobian=None, maxiter=100, ftol=1e-5, xtol=1e-8):
+    r"""
+    Fits many datasets to ``function`` simultaneously with a vectorized
+    `Levenberg-Marquardt <https://en.wikipedia.org/wiki/Levenberg%E2%80%93Marquardt_algorithm>`_
+    solver. The residuals and Jacobians of all datasets are evaluated together as arrays
+    (with :mod:`cupy` if ``data`` is a :mod:`cupy` array) and each dataset has its own
+    damping, such that a fit of hundreds of spots is a handful of array operations
+    per iteration rather than a loop over :meth:`scipy.optimize.curve_fit`.
+
+    Parameters
+    ----------
+    function : lambda (x, ...) -> array_like
+        Fitfunction accepting ``x`` as first argument. Parameters are passed as arrays
+        of shape ``(N, 1)``, so ``function`` must broadcast (as all of
+        :mod:`~slmsuite.misc.fitfunctions` do).
+    x : array_like OR (array_like, array_like)
+        Coordinates of shape ``(P,)`` (or a tuple of such, e.g. ``(x, y)`` for 2D fits).
+    data : array_like
+        Data of shape ``(N, P)``. Non-finite values are excluded from the fit.
+    guess : array_like
+        Initial parameters of shape ``(N, K)``.
+    jacobian : lambda (x, ...) -> array_like OR None
+        Jacobian of ``function``, returning derivatives along the last axis, i.e. shape
+        ``(N, P, K)``. If ``None``, the analytic Jacobian for ``function``
+        is used if known (:meth:`~slmsuite.misc.fitfunctions.gaussian2d()`,
+        :meth:`~slmsuite.misc.fitfunctions.tophat2d()`,
+        :meth:`~slmsuite.misc.fitfunctions.sinc2d()`, or
+        :meth:`~slmsuite.misc.fitfunctions.lorentzian()`).
+    maxiter : int
+        Maximum number of iterations. Fits which have not converged by then fail.
+    ftol : float
+        A fit converges when an accepted step reduces the sum of squared residuals by a
+        relative amount less than ``ftol``.
+    xtol : float
+        A fit also converges when the relative size of an accepted step is below ``xtol``.
+
+    Returns
+    -------
+    (array_like, array_like, array_like, array_like)
+        Parameters ``(N, K)``, their standard errors ``(N, K)``, the :math:`R^2` of
+        each fit ``(N,)``, and the boolean convergence mask ``(N,)``.
+        Parameters which the data does not constrain have infinite error.
+
+    Raises
+    ------
+    ValueError
+        If ``jacobian`` is ``None`` and ``function`` has no known Jacobian.
+    """
+    if jacobian is None:
+        if not function in _FIT_JACOBIANS:
+            raise ValueError(f"No Jacobian known for {str(function)}.")
+        jacobian = _FIT_JACOBIANS[function]
+
+    xp = get_module(data)
+    data = xp.asarray(data, dtype=float)
+    if isinstance(x, (tuple, list)):
+        x = tuple(xp.asarray(x_, dtype=float) for x_ in x)
+    else:
+        x = xp.asarray(x, dtype=float)
+
+    params = xp.array(guess, dtype=float)
+    (N, K) = params.shape
+    if data.shape[0] != N:
+        raise ValueError(f"Expected {data.shape[0]} guesses. Found {N}.")
+
+    # Exclude undefined data.
+    defined = xp.isfinite(data)
+    data = xp.where(defined, data, 0)
+    count = xp.sum(defined, axis=1)
+
+    def unpack(p):
+        return [p[:, k:k+1] for k in range(K)]
+
+    def residuals(p, rows):
+        return xp.where(defined[rows], data[rows] - function(x, *unpack(p)), 0)
+
+    def jacobians(p, rows):
+        return jacobian(x, *unpack(p)) * defined[rows][:, :, np.newaxis]
+
+    residual = residuals(params, xp.arange(N))
+    cost = xp.sum(xp.square(residual), axis=1)
+    damping = xp.full(N, 1e-3)
+    active = xp.isfinite(cost)
+    converged = xp.zeros(N, dtype=bool)
+    eye = xp.eye(K)
+
+    for _ in range(maxiter):
+        rows = xp.flatnonzero(active)
+        if rows.size == 0:
+            break
+        p = params[rows]
+
+        # Damped normal equations (J^T J + lambda diag(J^T J)) step = J^T r.
+        J = jacobians(p, rows)
+        JT = xp.swapaxes(J, 1, 2)
+        A = JT @ J
+        g = (JT @ residual[rows][:, :, np.newaxis])[:, :, 0]
+
+        diag = xp.diagonal(A, axis1=1, axis2=2)
+        diag = xp.maximum(diag, 1e-12 * xp.max(diag, axis=1, keepdims=True) + 1e-30)
+        A = A + (damping[rows, np.newaxis] * diag)[:, :, np.newaxis] * eye
+
+        try:
+            step = xp.linalg.solve(A, g[:, :, np.newaxis])[:, :, 0]
+        except np.linalg.LinAlgError:
+            step = xp.einsum("nkl,nl->nk", xp.linalg.pinv(A), g)
+
+        p_new = p + step
+        residual_new = residuals(p_new, rows)
+        cost_new = xp.sum(xp.square(residual_new), axis=1)
+
+        # Accept steps which do not increase the cost.
+        cost_old = cost[rows]
+        better = xp.isfinite(cost_new) & (cost_new <= cost_old)
+
+        params[rows[better]] = p_new[better]
+        residual[rows[better]] = residual_new[better]
+        cost[rows] = xp.where(better, cost_new, cost_old)
+        damping[rows] = xp.where(better, xp.maximum(damping[rows] / 10, 1e-12), damping[rows] * 10)
+
+        # Converge upon small relative changes, or when no step can reduce the cost.
+        small_step = (
+            xp.sqrt(xp.sum(xp.square(step), axis=1))
+            <= xtol * (xp.sqrt(xp.sum(xp.square(p), axis=1)) + xtol)
+        )
+        done = (better & ((cost_old - cost_new <= ftol * cost_old) | small_step))
+        done |= damping[rows] > 1e10
+
+        converged[rows[done]] = True
+        active[rows[done]] = False
+
+    # Standard errors, scaled by the residual variance as in curve_fit.
+    J = jacobians(params, xp.arange(N))
+    A = xp.swapaxes(J, 1, 2) @ J
+    finite = xp.all(xp.isfinite(A), axis=(1, 2))
+    A[xp.logical_not(finite)] = 0
+    dof = count - K
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = xp.where(dof > 0, cost / dof, xp.inf)
+        variance = xp.where(finite, variance, xp.nan)
+        covariance = xp.linalg.pinv(A) * variance[:, np.newaxis, np.newaxis]
+        errors = xp.sqrt(xp.abs(xp.diagonal(covariance, axis1=1, axis2=2)))
+
+        # Parameters which the data does not constrain (e.g. the edges of a tophat, whose
+        # derivative vanishes almost everywhere) have unbounded error, as in curve_fit.
+        unconstrained = (xp.diagonal(A, axis1=1, axis2=2) == 0) & finite[:, np.newaxis]
+        errors[unconstrained] = xp.inf
+
+        mean = xp.sum(data, axis=1, keepdims=True) / count[:, np.newaxis]
+        ss_tot = xp.sum(xp.where(defined, xp.square(data - mean), 0), axis=1)
+        r2 = 1 - cost / ss_tot
+
+    return params, errors, r2, converged
+
+
+def image_fit(images, grid=None, function=gaussian2d, guess=None, plot=False, batched=None):
     """
     Fit each image in a stack of images to a 2D ``function``.
 
@@ -820,9 +1577,15 @@ def image_fit(images, grid=None, function=gaussian2d, guess=None, plot=False):
           to the optimizer as a guess for the fit parameters for each image.
     plot : bool
         Whether to create a plot for each fit.
-    show : bool
-        Whether or not to call :meth:`matplotlib.pyplot.show` after generating
-        the plot.
+    batched : bool OR None
+        Whether to fit all images simultaneously with :meth:`fit_batched()` rather
+        than calling :meth:`scipy.optimize.curve_fit` for each image.
+        If ``None``, the batched fitter is used when ``function`` is a 2D function with
+        an analytic Jacobian (:meth:`~slmsuite.misc.fitfunctions.gaussian2d()`,
+        :meth:`~slmsuite.misc.fitfunctions.tophat2d()`, or
+        :meth:`~slmsuite.misc.fitfunctions.sinc2d()`). The batched fitter is allowed
+        ``200 * (parameter_count + 1)`` iterations, matching the default budget of
+        :meth:`scipy.optimize.curve_fit`.
 
     Returns
     -------
@@ -880,6 +1643,80 @@ def image_fit(images, grid=None, function=gaussian2d, guess=None, plot=False):
             else:
                 warnings.warn(message)
 
+    def plot_fit(img_idx, img, p0, popt):
+        # Data.
+        data = np.reshape(img, img_shape)
+        if p0 is not None:
+            guess_ = np.reshape(function(grid_ravel, *p0), img_shape)
+        else:
+            guess_ = np.zeros(img_shape)
+        result_ = np.reshape(function(grid_ravel, *popt), img_shape)
+        vmin = np.min((
+            np.min(data),
+            np.min(guess_) if p0 is not None else np.inf,
+            np.min(result_)
+        ))
+        vmax = np.max((
+            np.max(data),
+            np.max(guess_) if p0 is not None else -np.inf,
+            np.max(result_)
+        ))
+
+        # Plot.
+        fig, axs = plt.subplots(1, 3, figsize=(3 * 6.4, 4.8))
+        fig.suptitle("Image {}".format(img_idx))
+        ax0, ax1, ax2 = axs
+        ax0.imshow(data, vmin=vmin, vmax=vmax)
+        ax0.set_title("Data")
+        ax1.imshow(guess_, vmin=vmin, vmax=vmax)
+        ax1.set_title("Guess")
+        ax2.imshow(result_, vmin=vmin, vmax=vmax)
+        ax2.set_title("Result")
+
+        plt.show()
+
+    if batched is None:
+        batched = function in _FIT_JACOBIANS_2D
+    elif batched and not function in _FIT_JACOBIANS_2D:
+        raise ValueError(f"Batched fitting of {str(function)} is not implemented.")
+
+    if batched:
+        # Fit all images at once, with the same evaluation budget as curve_fit's default.
+        p0 = np.ones((image_count, param_count)) if guess is None else guess
+
+        (popt, perr, r2, converged) = fit_batched(
+            function,
+            grid_ravel,
+            images.reshape((image_count, w_y * w_x)),
+            p0,
+            maxiter=200 * (param_count + 1),
+            ftol=1e-5
+        )
+        (popt, perr, r2, converged) = (
+            (x.get() if hasattr(x, "get") else x) for x in (popt, perr, r2, converged)
+        )
+
+        # Failed fits have nan r2 and errors, and parameters set to the guess or nan.
+        failed = np.logical_not(converged) | np.any(np.logical_not(np.isfinite(popt)), axis=1)
+        popt[failed] = np.nan if guess is None else np.asarray(guess)[failed]
+        r2[failed] = np.nan
+        perr[failed] = np.nan
+
+        result[:, 0] = r2
+        result[:, 1:(param_count+1)] = popt
+        result[:, (param_count+1):] = perr
+
+        if plot:
+            for img_idx in range(image_count):
+                plot_fit(
+                    img_idx,
+                    images[img_idx, :, :].ravel(),
+                    None if guess is None else guess[img_idx],
+                    popt[img_idx]
+                )
+
+        return result
+
     # Fit and plot each image.
     for img_idx in range(image_count):
         img = images[img_idx, :, :].ravel()
@@ -925,36 +1762,7 @@ def image_fit(images, grid=None, function=gaussian2d, guess=None, plot=False):
 
         # Plot.
         if plot:
-            # Data.
-            data = np.reshape(img, img_shape)
-            if p0 is not None:
-                guess_ = np.reshape(function(grid_ravel, *p0), img_shape)
-            else:
-                guess_ = np.zeros(img_shape)
-            result_ = np.reshape(function(grid_ravel, *popt), img_shape)
-            vmin = np.min((
-                np.min(data),
-                np.min(guess_) if p0 is not None else np.inf,
-                np.min(result_)
-            ))
-            vmax = np.max((
-                np.max(data),
-                np.max(guess_) if p0 is not None else -np.inf,
-                np.max(result_)
-            ))
-
-            # Plot.
-            fig, axs = plt.subplots(1, 3, figsize=(3 * 6.4, 4.8))
-            fig.suptitle("Image {}".format(img_idx))
-            ax0, ax1, ax2 = axs
-            ax0.imshow(data, vmin=vmin, vmax=vmax)
-            ax0.set_title("Data")
-            ax1.imshow(guess_, vmin=vmin, vmax=vmax)
-            ax1.set_title("Guess")
-            ax2.imshow(result_, vmin=vmin, vmax=vmax)
-            ax2.set_title("Result")
-
-            plt.show()
+            plot_fit(img_idx, img, p0, popt)
 
     return result
 
@@ -2017,9 +2825,126 @@ def _make_8bit(img):
     return img.astype(np.uint8)
 
 
+class OrientationTransform():
+    """
+    Rotation and flip of images, compiled into a single strided view.
+
+    Any combination of :meth:`numpy.rot90`, :meth:`numpy.fliplr`, and
+    :meth:`numpy.flipud` is equivalent to an optional transpose followed by optional
+    reversals of each axis. Both are views, so calling the transform does not touch pixels
+    and acts on the last two axes, such that a stack of shape ``(N, H, W)`` is
+    transformed in one call.
+
+    Tip
+    ~~~
+    The returned view is generally not contiguous. Pass ``copy=True`` (or use
+    :meth:`numpy.ascontiguousarray()`) only when the consumer needs contiguous data.
+
+    Attributes
+    ----------
+    transpose : bool
+        Whether the last two axes are swapped (before flipping).
+    flipud, fliplr : bool
+        Whether the vertical and horizontal axes are reversed (after transposing).
+    """
+
+    def __init__(self, transpose=False, flipud=False, fliplr=False):
+        self.transpose = bool(transpose)
+        self.flipud = bool(flipud)
+        self.fliplr = bool(fliplr)
+
+    def __call__(self, img, copy=False):
+        """
+        Transforms the last two axes of ``img``.
+
+        Parameters
+        ----------
+        img : array_like
+            Image of shape ``(..., H, W)``.
+        copy : bool
+            Whether to return a contiguous copy rather than a view.
+
+        Returns
+        -------
+        numpy.ndarray
+            Transformed image (a view unless ``copy``).
+        """
+        img = np.asanyarray(img)
+
+        if self.transpose:
+            img = np.swapaxes(img, -1, -2)
+
+        img = img[..., ::(-1 if self.flipud else 1), ::(-1 if self.fliplr else 1)]
+
+        return np.ascontiguousarray(img) if copy else img
+
+    def __repr__(self):
+        return "OrientationTransform(transpose={}, flipud={}, fliplr={})".format(
+            self.transpose, self.flipud, self.fliplr
+        )
+
+    @property
+    def inverse(self):
+        """:class:`OrientationTransform` which undoes this transform."""
+        if self.transpose:
+            # Reversals before the transpose swap axes when moved after it.
+            return OrientationTransform(True, self.fliplr, self.flipud)
+        else:
+            return OrientationTransform(False, self.flipud, self.fliplr)
+
+    def transform_shape(self, shape):
+        """
+        Shape of the transformed image.
+
+        Parameters
+        ----------
+        shape : tuple of int
+            Shape ``(..., H, W)`` of the original image.
+
+        Returns
+        -------
+        tuple of int
+            Shape of the transformed image.
+        """
+        shape = tuple(shape)
+        if self.transpose:
+            shape = shape[:-2] + (shape[-1], shape[-2])
+        return shape
+
+    def transform_points(self, points, shape):
+        """
+        Maps pixel coordinates to the transformed image without touching pixels.
+        Use :attr:`inverse` to map coordinates in the transformed image
+        (e.g. a region of interest) back to the original image.
+
+        Parameters
+        ----------
+        points : array_like
+            Pixel coordinates ``(x, y)`` of shape ``(2, N)`` in the original image.
+        shape : (int, int)
+            Shape ``(H, W)`` of the original image.
+
+        Returns
+        -------
+        numpy.ndarray
+            Pixel coordinates of shape ``(2, N)`` in the transformed image.
+        """
+        points = format_2vectors(points).astype(float)
+        (height, width) = self.transform_shape(shape)[-2:]
+
+        if self.transpose:
+            points = points[::-1, :]
+        if self.fliplr:
+            points[0, :] = (width - 1) - points[0, :]
+        if self.flipud:
+            points[1, :] = (height - 1) - points[1, :]
+
+        return points
+
+
 def get_orientation_transformation(rot="0", fliplr=False, flipud=False):
     """
-    Compile a transformation lambda from simple rotates and flips.
+    Compile a transformation from simple rotates and flips.
 
     Useful to turn an image to an orientation which is user-friendly.
     Used by :class:`~slmsuite.hardware.cameras.camera.Camera` and subclasses.
@@ -2036,21 +2961,23 @@ def get_orientation_transformation(rot="0", fliplr=False, flipud=False):
 
     Returns
     -------
-    function (array_like) -> numpy.ndarray
-        Compiled image transformation.
+    OrientationTransform
+        Compiled image transformation, callable as a function
+        (array_like) -> numpy.ndarray which applies to the last two axes.
     """
-    transforms = list()
-
-    if fliplr == True:
-        transforms.append(np.fliplr)
-    if flipud == True:
-        transforms.append(np.flipud)
-
+    # The image is rotated, then flipped. Rotation by 90 degrees counterclockwise
+    # (:meth:`numpy.rot90`) is a transpose followed by an up-down flip.
     if rot == "90" or rot == 1:
-        transforms.append(lambda img: np.rot90(img, 1))
+        (transpose, ud, lr) = (True, True, False)
     elif rot == "180" or rot == 2:
-        transforms.append(lambda img: np.rot90(img, 2))
+        (transpose, ud, lr) = (False, True, True)
     elif rot == "270" or rot == 3:
-        transforms.append(lambda img: np.rot90(img, 3))
+        (transpose, ud, lr) = (True, False, True)
+    else:
+        (transpose, ud, lr) = (False, False, False)
 
-    return reduce(lambda f, g: lambda x: f(g(x)), transforms, lambda x: x)
+    return OrientationTransform(
+        transpose,
+        ud != (flipud == True),
+        lr != (fliplr == True),
+    )
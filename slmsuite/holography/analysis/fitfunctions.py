@@ -158,26 +158,23 @@ def lorentzian_jacobian(x, x0, a, c, Q):
     Returns
     -------
     gradf : numpy.ndarray
-        Jacobian of Lorentzian fit evaluated at all ``x``.
+        Jacobian of Lorentzian fit evaluated at all ``x``, with the derivatives with
+        respect to ``(x0, a, c, Q)`` along the last axis.
+        Parameters may be arrays which broadcast against ``x``.
     """
-    return np.array(
-        [
-            a
-            * 8
-            * Q ** 2
-            * (x - x0)
-            / x0 ** 2
-            * (1 + (x - x0) / x0)
-            / (1 + 4 * (Q * (x - x0) / x0) ** 2) ** 2,
-            1 / (1 + 4 * (Q * (x - x0) / x0) ** 2),
-            -8
-            * Q
-            * a
-            * ((x - x0) / x0) ** 2
-            / (1 + 4 * (Q * (x - x0) / x0) ** 2) ** 2,
-            1 - 1 / (1 + 4 * (Q * (x - x0) / x0) ** 2),
-        ]
-    ).T
+    u = (2 * Q) * (x / x0 - 1)
+    L = 1 / (1 + np.square(u))
+    dfdu = -2 * a * np.square(L) * u
+
+    return np.stack(
+        np.broadcast_arrays(
+            dfdu * (-2 * Q) * x / np.square(x0),    # x0
+            L,                                      # a
+            np.ones_like(L),                        # c
+            dfdu * u / Q,                           # Q
+        ),
+        axis=-1
+    )
 
 
 def gaussian(x, x0, a, c, w):
@@ -299,18 +296,77 @@ def gaussian2d(xy, x0, y0, a, c, wx, wy, wxy=0):
     x = xy[0] - x0
     y = xy[1] - y0
 
-    wxy = np.sign(wxy) * np.min([np.abs(wxy), wx*wy])
-
-    try:
-        M = np.linalg.inv([[wx*wx, wxy], [wxy, wy*wy]])
-    except np.linalg.LinAlgError:
-        M = np.array([[1/wx/wx, 0], [0, 1/wy/wy]])
+    (K00, K11, K10) = _gaussian2d_inverse_variance(wx, wy, wxy)
 
-    argument = np.square(x) * M[0,0] + np.square(y) * M[1,1] + 2 * x * y * M[1,0]
+    argument = np.square(x) * K00 + np.square(y) * K11 + 2 * x * y * K10
 
     return c + a * np.exp(-.5 * argument)
 
 
+def _gaussian2d_inverse_variance(wx, wy, wxy):
+    """
+    Elements ``(K00, K11, K10)`` of the inverse of the variance matrix of
+    :meth:`gaussian2d`, in closed form such that parameters may be arrays.
+    """
+    wxy = np.sign(wxy) * np.minimum(np.abs(wxy), wx*wy)
+
+    wx2 = wx * wx
+    wy2 = wy * wy
+    det = wx2 * wy2 - wxy * wxy
+
+    # When singular, revert to the unsheared Gaussian.
+    singular = det == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        K00 = np.where(singular, 1 / wx2, wy2 / det)
+        K11 = np.where(singular, 1 / wy2, wx2 / det)
+        K10 = np.where(singular, 0, -wxy / det)
+
+    return K00, K11, K10
+
+
+def gaussian2d_jacobian(xy, x0, y0, a, c, wx, wy, wxy=0):
+    """
+    Jacobian of :meth:`gaussian2d`.
+
+    Parameters
+    ----------
+    xy : numpy.ndarray
+        Points to fit upon (x, y).
+    x0, y0, a, c, wx, wy, wxy : float OR numpy.ndarray
+        See :meth:`gaussian2d`. Parameters may be arrays which broadcast against
+        ``xy[0]``, e.g. of shape ``(N, 1)`` to evaluate ``N`` parameter sets at once.
+
+    Returns
+    -------
+    gradf : numpy.ndarray
+        Jacobian evaluated at all ``(x,y)`` in ``xy``, with the derivatives with
+        respect to ``(x0, y0, a, c, wx, wy, wxy)`` along the last axis.
+    """
+    x = xy[0] - x0
+    y = xy[1] - y0
+
+    (K00, K11, K10) = _gaussian2d_inverse_variance(wx, wy, wxy)
+
+    # With u = K (x, y), derivatives of the argument are quadratic in u.
+    u0 = K00 * x + K10 * y
+    u1 = K10 * x + K11 * y
+    E = np.exp(-.5 * (x * u0 + y * u1))
+    aE = a * E
+
+    return np.stack(
+        np.broadcast_arrays(
+            aE * u0,                    # x0
+            aE * u1,                    # y0
+            E,                          # a
+            np.ones_like(E),            # c
+            aE * wx * np.square(u0),    # wx
+            aE * wy * np.square(u1),    # wy
+            aE * u0 * u1,               # wxy
+        ),
+        axis=-1
+    )
+
+
 def tophat2d(xy, x0, y0, R, a=1, c=0):
     r"""
     For fitting a 2D tophat distribution.
@@ -345,6 +401,35 @@ def tophat2d(xy, x0, y0, R, a=1, c=0):
     return np.where(np.square(x) + np.square(y) <= R*R, a+c, c)
 
 
+def tophat2d_jacobian(xy, x0, y0, R, a=1, c=0):
+    """
+    Jacobian of :meth:`tophat2d`. The tophat is discontinuous, so the derivatives
+    with respect to ``x0``, ``y0``, and ``R`` are zero almost everywhere.
+
+    Parameters
+    ----------
+    xy : numpy.ndarray
+        Points to fit upon (x, y).
+    x0, y0, R, a, c : float OR numpy.ndarray
+        See :meth:`tophat2d`. Parameters may be arrays which broadcast against ``xy[0]``.
+
+    Returns
+    -------
+    gradf : numpy.ndarray
+        Jacobian evaluated at all ``(x,y)`` in ``xy``, with the derivatives with
+        respect to ``(x0, y0, R, a, c)`` along the last axis.
+    """
+    x = xy[0] - x0
+    y = xy[1] - y0
+    inside = (np.square(x) + np.square(y) <= R*R).astype(float)
+    zero = np.zeros_like(inside)
+
+    return np.stack(
+        np.broadcast_arrays(zero, zero, zero, inside, np.ones_like(inside)),
+        axis=-1
+    )
+
+
 def sinc2d(xy, x0, y0, R, a=1, b=0, c=0, d=0, kx=0, ky=0):
     r"""
     For fitting a 2D rectangular :math:`\text{sinc}^2` distribution, potentially with a sinusoidal modulation.
@@ -387,6 +472,66 @@ def sinc2d(xy, x0, y0, R, a=1, b=0, c=0, d=0, kx=0, ky=0):
             * (a * 0.5 * (1 + np.cos(kx * x + ky * y - b)) + c) + d
 
 
+def _sinc_derivative(u, sinc):
+    """Derivative of :meth:`numpy.sinc` at ``u``, given ``sinc = np.sinc(u)``."""
+    nonzero = u != 0
+    u_safe = np.where(nonzero, u, 1)
+    return np.where(nonzero, (np.cos(np.pi * u_safe) - sinc) / u_safe, 0)
+
+
+def sinc2d_jacobian(xy, x0, y0, R, a=1, b=0, c=0, d=0, kx=0, ky=0):
+    """
+    Jacobian of :meth:`sinc2d`.
+
+    Parameters
+    ----------
+    xy : numpy.ndarray
+        Points to fit upon (x, y).
+    x0, y0, R, a, b, c, d, kx, ky : float OR numpy.ndarray
+        See :meth:`sinc2d`. Parameters may be arrays which broadcast against ``xy[0]``.
+
+    Returns
+    -------
+    gradf : numpy.ndarray
+        Jacobian evaluated at all ``(x,y)`` in ``xy``, with the derivatives with
+        respect to ``(x0, y0, R, a, b, c, d, kx, ky)`` along the last axis.
+    """
+    x = xy[0] - x0
+    y = xy[1] - y0
+    ux = (1 / R) * x
+    uy = (1 / R) * y
+
+    scx = np.sinc(ux)
+    scy = np.sinc(uy)
+    dscx = _sinc_derivative(ux, scx)
+    dscy = _sinc_derivative(uy, scy)
+
+    sinc_term = np.square(scx * scy)
+    phi = kx * x + ky * y - b
+    cos_term = 0.5 * (1 + np.cos(phi))
+    dcos_term = -0.5 * a * np.sin(phi)      # Derivative of the modulation wrt phi.
+    modulation = a * cos_term + c
+
+    # Derivatives of sinc_term with respect to x and y.
+    dsdx = 2 * scx * np.square(scy) * dscx / R
+    dsdy = 2 * scy * np.square(scx) * dscy / R
+
+    return np.stack(
+        np.broadcast_arrays(
+            -(dsdx * modulation + sinc_term * dcos_term * kx),  # x0
+            -(dsdy * modulation + sinc_term * dcos_term * ky),  # y0
+            -(dsdx * x + dsdy * y) * modulation / R,            # R
+            sinc_term * cos_term,                               # a
+            -sinc_term * dcos_term,                             # b
+            sinc_term,                                          # c
+            np.ones_like(sinc_term),                            # d
+            sinc_term * dcos_term * x,                          # kx
+            sinc_term * dcos_term * y,                          # ky
+        ),
+        axis=-1
+    )
+
+
 # sinc variations
 
 def _sinc2d_nomod(xy, x0, y0, R, a=1, d=0):